@@ -0,0 +1,70 @@
+"""
+Runs the pyptvdata benchmark suite offline on synthetic fixtures.
+
+Usage:
+    python -m benchmarks [--scale 1.0] [--only gtfs,api] [--save results.json] [--compare baseline.json]
+
+Results saved with --save can be passed to --compare on a later run to report the ratio
+of each best_seconds against the baseline, to catch performance regressions.
+"""
+import argparse
+import importlib
+import json
+
+from .harness import print_table
+
+
+# Benchmark modules, each with a run(scale) function returning result rows
+SUITE = [
+    'bench_api',
+    'bench_decode',
+    'bench_types',
+    'bench_gtfs',
+    'bench_mirror',
+    'bench_unified',
+    'bench_transfers',
+    'bench_frequency',
+    'bench_patterns',
+    'bench_isochrone',
+    'bench_accessibility',
+    'bench_validate',
+    'bench_shapes',
+    'bench_segments',
+    'bench_compare',
+    'bench_blocks',
+    'bench_departures',
+    'bench_gtfsr',
+]
+
+
+def main(scale : float = 1.0, only : list[str] = None, save : str = None, compare : str = None):
+    rows = []
+    for module_name in SUITE:
+        if only is not None and module_name.removeprefix('bench_') not in only:
+            continue
+        module = importlib.import_module(f'.{module_name}', __package__)
+        rows.extend(module.run(scale=scale))
+
+    if compare is not None:
+        with open(compare) as f:
+            baseline = {(row['benchmark'], row.get('variant')): row for row in json.load(f)}
+        for row in rows:
+            baseline_row = baseline.get((row['benchmark'], row.get('variant')))
+            if baseline_row is not None and baseline_row.get('best_seconds') and 'best_seconds' in row:
+                row['vs_baseline'] = row['best_seconds'] / baseline_row['best_seconds']
+
+    print_table(rows)
+
+    if save is not None:
+        with open(save, 'w') as f:
+            json.dump(rows, f, indent=4)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the fixtures and iteration counts.")
+    parser.add_argument('--only', help="Comma-separated benchmark modules to run, e.g. gtfs,api.")
+    parser.add_argument('--save', help="Save the results to a JSON file.")
+    parser.add_argument('--compare', help="Compare against results saved with --save.")
+    args = parser.parse_args()
+    main(scale=args.scale, only=args.only.split(',') if args.only else None, save=args.save, compare=args.compare)
@@ -0,0 +1,41 @@
+"""
+Benchmarks stop accessibility scores on a synthetic feed with `get_accessibility`.
+
+Usage:
+    python -m benchmarks.bench_accessibility [--scale 1.0]
+"""
+import argparse
+import os
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.accessibility import get_accessibility
+from pyptvdata.isochrone import build_transit_network
+from pyptvdata.unified import build_unified_feed
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for scoring a sample of stops in one process and in a process pool over all CPUs.
+    """
+    feed = build_unified_feed(read_gtfs_zip(get_gtfs_zip_path(scale=scale)))
+    network = build_transit_network(feed, '20240312')
+    origins = feed['stops']['stop_index'].iloc[::max(len(feed['stops']) // 128, 1)].tolist()
+
+    rows = []
+    for processes in sorted({1, os.cpu_count() or 1}):
+        rows.append({
+            'benchmark': 'accessibility.get_accessibility',
+            'variant': f'scale={scale},origins={len(origins)},processes={processes}',
+            **measure(lambda: get_accessibility(network, origins, processes=processes, chunksize=16), repeat=3),
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
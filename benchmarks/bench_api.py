@@ -0,0 +1,47 @@
+"""
+Benchmarks the per-request overhead of the PTV API client: URL signing and endpoint template matching.
+
+Usage:
+    python -m benchmarks.bench_api [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.apiv3 import get_ptv_api_url, get_canonical_endpoint
+from pyptvdata.metrics import get_endpoint_template
+
+from .harness import measure, print_table
+
+
+ENDPOINTS = [
+    '/v3/route_types',
+    '/v3/departures/route_type/0/stop/1071/route/1?max_results=5&expand=All&expand=Run&include_geopath=true',
+    '/v3/stops/location/-37.8183,144.9671?route_types=0&route_types=1&max_distance=500',
+]
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns a result row for each function and endpoint, timed over 10,000 * scale calls.
+    """
+    number = max(100, int(10_000 * scale))
+    functions = {
+        'get_ptv_api_url': lambda endpoint: get_ptv_api_url(endpoint, 1000000, 'abcdef01-2345-6789-abcd-ef0123456789'),
+        'get_canonical_endpoint': get_canonical_endpoint,
+        'get_endpoint_template': get_endpoint_template,
+    }
+    rows = []
+    for function_name, function in functions.items():
+        for endpoint in ENDPOINTS:
+            rows.append({
+                'benchmark': f'api.{function_name}',
+                'variant': endpoint.split('?')[0],
+                **measure(lambda: function(endpoint), repeat=5, number=number),
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Times 10,000 * scale calls.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
@@ -0,0 +1,44 @@
+"""
+Benchmarks inferring vehicle blocks and the peak vehicle requirement of a synthetic feed with `infer_blocks`.
+
+Usage:
+    python -m benchmarks.bench_blocks [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.blocks import infer_blocks
+from pyptvdata.unified import build_unified_feed
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for the bus mode, with each route its own group and with all routes in one group, and for the unified feed, on a weekday.
+    """
+    DFK = read_gtfs_zip(get_gtfs_zip_path(scale=scale))
+    bus = DFK['4']
+    variants = {
+        'mode=4': (bus, None),
+        'mode=4,one group': (bus, {route_id: 'all routes' for route_id in bus['routes']['route_id']}),
+        'unified': (build_unified_feed(DFK), None),
+    }
+
+    rows = []
+    for name, (feed, route_groups) in variants.items():
+        rows.append({
+            'benchmark': 'blocks.infer_blocks',
+            'variant': f'scale={scale},{name}',
+            **measure(lambda: infer_blocks(feed, '20240312', route_groups=route_groups), repeat=3),
+            'rows': len(feed['trips']),
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
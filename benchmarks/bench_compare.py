@@ -0,0 +1,44 @@
+"""
+Benchmarks comparing two versions of a synthetic feed with `compare_feeds`, where the new version drops every tenth trip of each mode.
+
+Usage:
+    python -m benchmarks.bench_compare [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.compare import compare_feeds
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns a result row for comparing every mode of the feed.
+    """
+    old_DFK = read_gtfs_zip(get_gtfs_zip_path(scale=scale))
+    new_DFK = {}
+    for mode_id, feed in old_DFK.items():
+        trips = feed['trips'].iloc[[i for i in range(len(feed['trips'])) if i % 10 != 0]]
+        new_DFK[mode_id] = {
+            **feed,
+            'trips': trips,
+            'stop_times': feed['stop_times'][feed['stop_times']['trip_id'].isin(trips['trip_id'])],
+        }
+
+    return [
+        {
+            'benchmark': 'compare.compare_feeds',
+            'variant': f'scale={scale},modes={len(old_DFK)}',
+            **measure(lambda: compare_feeds(old_DFK, new_DFK), repeat=3),
+            'rows': sum(len(feed['stop_times']) for feed in old_DFK.values()),
+        },
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
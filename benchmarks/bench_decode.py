@@ -0,0 +1,48 @@
+"""
+Compares the JSON decoder backends of `PTVAPIClient` on API response bodies.
+
+Uses synthetic responses shaped like the swagger definitions, or recorded responses
+from a directory of `<class name>.json` files (e.g. `V3DeparturesResponse.json`).
+
+Usage:
+    python -m benchmarks.bench_decode [--fixtures-dir DIR] [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.apiv3 import types
+from pyptvdata.apiv3.decoders import decode_json, get_available_decoders
+
+from .fixtures import make_api_responses, load_recorded_api_responses
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0, fixtures_dir : str = None) -> list[dict]:
+    """
+    Returns a result row for each response and decoder. Synthetic responses have 1000 * scale items in their top-level lists.
+    """
+    if fixtures_dir is not None:
+        responses = load_recorded_api_responses(fixtures_dir)
+    else:
+        responses = make_api_responses(list_length=max(10, int(1000 * scale)))
+
+    rows = []
+    for class_name, content in responses.items():
+        response_type = getattr(types, class_name)
+        for decoder in get_available_decoders():
+            for typed in [False, True]:
+                timing = measure(lambda: decode_json(content, decoder=decoder, response_type=response_type if typed else None), repeat=10)
+                rows.append({
+                    'benchmark': f'decode.{class_name}',
+                    'variant': f"{decoder}{'+types' if typed else ''}",
+                    'kilobytes': len(content) / 1024,
+                    **timing,
+                })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures-dir', help="Directory of recorded responses named <class name>.json.")
+    parser.add_argument('--scale', type=float, default=1.0, help="Synthetic responses have 1000 * scale items in their top-level lists.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale, fixtures_dir=args.fixtures_dir))
@@ -0,0 +1,96 @@
+"""
+Benchmarks the departure board of a synthetic feed with `DepartureBoard`: building a service date, applying GTFS-R updates,
+and the latency of next-departure queries at every stop.
+
+Usage:
+    python -m benchmarks.bench_departures [--scale 1.0]
+"""
+import argparse
+import time
+import numpy as np
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.gtfsr import get_stop_time_updates
+from pyptvdata.departures import DepartureBoard
+from pyptvdata.frequency import get_active_trips
+from pyptvdata.segments import get_service_day_starts
+
+from .fixtures import get_gtfs_zip_path, make_gtfs_r_feed
+from .harness import measure, print_table
+
+
+def measure_latency(func, queries : list[tuple]) -> dict[str, float]:
+    """
+    Calls func with each query's arguments, and returns the median and 99th percentile seconds per call.
+    """
+    timings = np.empty(len(queries))
+    for i, args in enumerate(queries):
+        start = time.perf_counter()
+        func(*args)
+        timings[i] = time.perf_counter() - start
+    return {'median_seconds': float(np.median(timings)), 'p99_seconds': float(np.percentile(timings, 99))}
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for the bus mode on a weekday, with and without realtime, and by route.
+    """
+    feed = read_gtfs_zip(get_gtfs_zip_path(scale=scale))['4']
+    day_start = int(get_service_day_starts(np.array(['20240312']), 'Australia/Melbourne')[0])
+    trips = get_active_trips(feed, '20240312')[0]
+    updates = get_stop_time_updates(make_gtfs_r_feed(trips['trip_id'].tolist(), stops_per_trip=30))
+    updates['start_date'] = '20240312'
+
+    board = DepartureBoard(feed)
+    stops = feed['stop_times']['stop_id'].unique().tolist()
+    rng = np.random.default_rng(0)
+    times = (day_start + rng.integers(5 * 3600, 23 * 3600, size=20_000)).tolist()
+    queries = [(stops[i % len(stops)], 5, now) for i, now in enumerate(times)]
+    board.get_board('20240311')
+    board.get_board('20240312')
+
+    rows = [
+        {
+            'benchmark': 'departures.DepartureBoard.build_board',
+            'variant': f'scale={scale}',
+            **measure(lambda: board.build_board('20240312'), repeat=3),
+            'rows': len(feed['stop_times']),
+        },
+        {
+            'benchmark': 'departures.DepartureBoard.get_next_departures',
+            'variant': f'scale={scale},static',
+            **measure_latency(board.get_next_departures, queries),
+            'rows': len(queries),
+        },
+    ]
+
+    board.apply_trip_updates(updates, now=day_start + 8 * 3600)
+    rows.append({
+        'benchmark': 'departures.DepartureBoard.apply_trip_updates',
+        'variant': f'scale={scale}',
+        **measure(lambda: board.apply_trip_updates(updates, now=day_start + 8 * 3600), repeat=3),
+        'rows': len(updates),
+    })
+    rows.append({
+        'benchmark': 'departures.DepartureBoard.get_next_departures',
+        'variant': f'scale={scale},realtime',
+        **measure_latency(board.get_next_departures, queries),
+        'rows': len(queries),
+    })
+
+    stop_routes = feed['stop_times'][['stop_id', 'trip_id']].merge(feed['trips'][['trip_id', 'route_id']], on='trip_id').drop_duplicates('stop_id')
+    route_of_stop = dict(zip(stop_routes['stop_id'], stop_routes['route_id']))
+    rows.append({
+        'benchmark': 'departures.DepartureBoard.get_next_departures',
+        'variant': f'scale={scale},realtime,by route',
+        **measure_latency(lambda stop, n, now: board.get_next_departures(stop, n, now, route=route_of_stop[stop]), queries),
+        'rows': len(queries),
+    })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
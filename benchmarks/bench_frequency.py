@@ -0,0 +1,48 @@
+"""
+Benchmarks the frequency and headway tables of a synthetic feed with `get_stop_frequencies` and `get_route_frequencies`.
+
+Usage:
+    python -m benchmarks.bench_frequency [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.frequency import get_stop_frequencies, get_route_frequencies
+from pyptvdata.unified import build_unified_feed
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for the bus mode and the unified feed, on a weekday service date.
+    """
+    DFK = read_gtfs_zip(get_gtfs_zip_path(scale=scale))
+    feeds = {
+        'mode=4': DFK['4'],
+        'unified': build_unified_feed(DFK),
+    }
+
+    rows = []
+    for name, feed in feeds.items():
+        rows.append({
+            'benchmark': 'frequency.get_stop_frequencies',
+            'variant': f'scale={scale},{name}',
+            **measure(lambda: get_stop_frequencies(feed, '20240312'), repeat=3),
+            'rows': len(feed['stop_times']),
+        })
+        rows.append({
+            'benchmark': 'frequency.get_route_frequencies',
+            'variant': f'scale={scale},{name}',
+            **measure(lambda: get_route_frequencies(feed, '20240312'), repeat=3),
+            'rows': len(feed['stop_times']),
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
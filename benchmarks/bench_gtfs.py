@@ -0,0 +1,56 @@
+"""
+Benchmarks loading a synthetic gtfs.zip with `read_gtfs_zip`.
+
+Usage:
+    python -m benchmarks.bench_gtfs [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.gtfs import read_gtfs_zip, profile_gtfs_zip, iter_gtfs_table_chunks
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for loading the whole feed, and the per-table stages of one profiled load.
+    """
+    path = get_gtfs_zip_path(scale=scale)
+
+    rows = [{
+        'benchmark': 'gtfs.read_gtfs_zip',
+        'variant': f'scale={scale}',
+        **measure(lambda: read_gtfs_zip(path), repeat=3),
+    }]
+
+    rows.append({
+        'benchmark': 'gtfs.read_gtfs_zip',
+        'variant': f'scale={scale},modes=3,tables=stops+routes',
+        **measure(lambda: read_gtfs_zip(path, modes=['3'], tables=['stops', 'routes']), repeat=3),
+    })
+
+    rows.append({
+        'benchmark': 'gtfs.iter_gtfs_table_chunks',
+        'variant': f'scale={scale},mode=4,07:00-09:00',
+        **measure(lambda: sum(len(chunk) for chunk in iter_gtfs_table_chunks(path, '4', 'stop_times', chunksize=100_000, start_time='07:00:00', end_time='09:00:00')), repeat=3),
+    })
+
+    _, report = profile_gtfs_zip(path)
+    stages = report['tables'].groupby('table_name')[['inflate_seconds', 'parse_seconds', 'convert_seconds', 'rows', 'memory_bytes']].sum()
+    for table_name, stage in stages.iterrows():
+        rows.append({
+            'benchmark': f'gtfs.read_gtfs_zip.{table_name}',
+            'variant': f'scale={scale}',
+            'best_seconds': stage['inflate_seconds'] + stage['parse_seconds'] + stage['convert_seconds'],
+            'rows': int(stage['rows']),
+            'megabytes': stage['memory_bytes'] / 2 ** 20,
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
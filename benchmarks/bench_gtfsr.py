@@ -0,0 +1,43 @@
+"""
+Benchmarks parsing GTFS-R feeds with `parse_gtfs_r_binary`.
+
+Uses synthetic trip update and vehicle position feeds, or recorded feeds from a directory of `.pb` files.
+
+Usage:
+    python -m benchmarks.bench_gtfsr [--fixtures-dir DIR] [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.gtfsr import parse_gtfs_r_binary
+
+from .fixtures import make_gtfs_r_feed, load_recorded_gtfs_r_feeds
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0, fixtures_dir : str = None) -> list[dict]:
+    """
+    Returns a result row for each feed. The synthetic feed has 500 * scale trips.
+    """
+    if fixtures_dir is not None:
+        feeds = load_recorded_gtfs_r_feeds(fixtures_dir)
+    else:
+        n_trips = max(10, int(500 * scale))
+        feeds = {f'synthetic-{n_trips}-trips': make_gtfs_r_feed(n_trips=n_trips)}
+
+    rows = []
+    for feed_name, feed_data in feeds.items():
+        rows.append({
+            'benchmark': 'gtfsr.parse_gtfs_r_binary',
+            'variant': feed_name,
+            'kilobytes': len(feed_data) / 1024,
+            **measure(lambda: parse_gtfs_r_binary(feed_data), repeat=5),
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fixtures-dir', help="Directory of recorded GTFS-R feeds as .pb files.")
+    parser.add_argument('--scale', type=float, default=1.0, help="The synthetic feed has 500 * scale trips.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale, fixtures_dir=args.fixtures_dir))
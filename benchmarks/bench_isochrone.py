@@ -0,0 +1,60 @@
+"""
+Benchmarks isochrones on a synthetic feed with `get_isochrone` and `get_isochrones`.
+
+Usage:
+    python -m benchmarks.bench_isochrone [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.isochrone import build_transit_network, get_isochrone, get_isochrones
+from pyptvdata.unified import build_unified_feed
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for building the network, single isochrones from a stop and a coordinate, and a batch of origins.
+    """
+    feed = build_unified_feed(read_gtfs_zip(get_gtfs_zip_path(scale=scale)))
+    network = build_transit_network(feed, '20240312')
+    stop = feed['stops'].iloc[len(feed['stops']) // 2]
+    origins = feed['stops']['stop_index'].iloc[::max(len(feed['stops']) // 64, 1)].tolist()
+
+    return [
+        {
+            'benchmark': 'isochrone.build_transit_network',
+            'variant': f'scale={scale}',
+            **measure(lambda: build_transit_network(feed, '20240312'), repeat=3),
+            'rows': len(network['dep_time']),
+        },
+        {
+            'benchmark': 'isochrone.get_isochrone',
+            'variant': f'scale={scale},stop,60min',
+            **measure(lambda: get_isochrone(network, int(stop['stop_index']), '08:00:00', max_minutes=60)),
+        },
+        {
+            'benchmark': 'isochrone.get_isochrone',
+            'variant': f'scale={scale},coordinate,60min,window=30min',
+            **measure(lambda: get_isochrone(network, (stop['stop_lat'], stop['stop_lon']), '08:00:00', max_minutes=60, departure_window_minutes=30)),
+        },
+        {
+            'benchmark': 'isochrone.get_isochrones',
+            'variant': f'scale={scale},origins={len(origins)},processes=1',
+            **measure(lambda: get_isochrones(network, origins, processes=1, max_minutes=60), repeat=3),
+        },
+        {
+            'benchmark': 'isochrone.get_isochrones',
+            'variant': f'scale={scale},origins={len(origins)},processes=4',
+            **measure(lambda: get_isochrones(network, origins, processes=4, max_minutes=60), repeat=3),
+        },
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
@@ -0,0 +1,64 @@
+"""
+Benchmarks materialising a synthetic gtfs.zip into a columnar mirror, and reading it back with `read_gtfs_mirror`.
+
+Usage:
+    python -m benchmarks.bench_mirror [--scale 1.0]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+
+from pyptvdata.mirror import materialize_gtfs_zip, read_gtfs_mirror
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for materialising the feed from scratch, and for reading the whole and a filtered mirror.
+    """
+    path = get_gtfs_zip_path(scale=scale)
+    mirror_dir = tempfile.mkdtemp(prefix='pyptvdata-mirror-')
+
+    def materialize():
+        shutil.rmtree(mirror_dir)
+        os.makedirs(mirror_dir)
+        materialize_gtfs_zip(path, mirror_dir)
+
+    try:
+        rows = [{
+            'benchmark': 'mirror.materialize_gtfs_zip',
+            'variant': f'scale={scale}',
+            **measure(materialize, repeat=3),
+        }]
+
+        rows.append({
+            'benchmark': 'mirror.materialize_gtfs_zip',
+            'variant': f'scale={scale},unchanged',
+            **measure(lambda: materialize_gtfs_zip(path, mirror_dir), repeat=3),
+        })
+
+        for categorical in [True, False]:
+            rows.append({
+                'benchmark': 'mirror.read_gtfs_mirror',
+                'variant': f'scale={scale},categorical={categorical}',
+                **measure(lambda: read_gtfs_mirror(mirror_dir, categorical=categorical), repeat=3),
+            })
+
+        rows.append({
+            'benchmark': 'mirror.read_gtfs_mirror',
+            'variant': f'scale={scale},modes=3,tables=stops+routes',
+            **measure(lambda: read_gtfs_mirror(mirror_dir, modes=['3'], tables=['stops', 'routes']), repeat=3),
+        })
+    finally:
+        shutil.rmtree(mirror_dir, ignore_errors=True)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
@@ -0,0 +1,46 @@
+"""
+Benchmarks compressing the stop_times of a synthetic feed into trip patterns with `build_trip_patterns`.
+
+Usage:
+    python -m benchmarks.bench_patterns [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.patterns import build_trip_patterns, get_stop_times_from_patterns
+from pyptvdata.unified import build_unified_feed
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for building the patterns of the unified feed and expanding them back,
+    with the rows stored for the stop sequences and times before and after.
+    """
+    feed = build_unified_feed(read_gtfs_zip(get_gtfs_zip_path(scale=scale)))
+    patterns = build_trip_patterns(feed)
+
+    return [
+        {
+            'benchmark': 'patterns.build_trip_patterns',
+            'variant': f'scale={scale},unified',
+            **measure(lambda: build_trip_patterns(feed), repeat=3),
+            'rows': len(feed['stop_times']),
+            'compressed_rows': len(patterns['pattern_stops']) + len(patterns['timings']) + len(patterns['trips']),
+        },
+        {
+            'benchmark': 'patterns.get_stop_times_from_patterns',
+            'variant': f'scale={scale},unified',
+            **measure(lambda: get_stop_times_from_patterns(patterns), repeat=3),
+            'rows': len(feed['stop_times']),
+        },
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
@@ -0,0 +1,63 @@
+"""
+Benchmarks the segment running times and speeds of a synthetic feed with `get_segment_speeds`,
+against GTFS-R stop time updates for each trip of a weekday, read with `get_stop_time_updates`.
+
+Usage:
+    python -m benchmarks.bench_segments [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.gtfsr import get_stop_time_updates
+from pyptvdata.frequency import get_active_trips
+from pyptvdata.segments import build_segments, get_segment_speeds
+
+from .fixtures import get_gtfs_zip_path, make_gtfs_r_feed
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for the bus mode: building the segments, reading the updates, and aggregating a week, with and without actuals.
+    """
+    feed = read_gtfs_zip(get_gtfs_zip_path(scale=scale))['4']
+    dates = ['20240311', '20240312', '20240313', '20240314', '20240315', '20240316', '20240317']
+    trip_ids = get_active_trips(feed, '20240312')[0]['trip_id'].tolist()
+    feed_data = make_gtfs_r_feed(trip_ids, stops_per_trip=30)
+    updates = get_stop_time_updates(feed_data)
+    updates['start_date'] = '20240312'
+    segments = build_segments(feed)
+
+    return [
+        {
+            'benchmark': 'segments.build_segments',
+            'variant': f'scale={scale}',
+            **measure(lambda: build_segments(feed), repeat=3),
+            'rows': len(feed['stop_times']),
+        },
+        {
+            'benchmark': 'gtfsr.get_stop_time_updates',
+            'variant': f'trips={len(trip_ids)}',
+            **measure(lambda: get_stop_time_updates(feed_data), repeat=3),
+            'rows': len(updates),
+        },
+        {
+            'benchmark': 'segments.get_segment_speeds',
+            'variant': f'scale={scale},dates={len(dates)}',
+            **measure(lambda: get_segment_speeds(feed, dates, segments=segments), repeat=3),
+            'rows': len(segments) * len(dates),
+        },
+        {
+            'benchmark': 'segments.get_segment_speeds',
+            'variant': f'scale={scale},dates={len(dates)},actuals',
+            **measure(lambda: get_segment_speeds(feed, dates, actuals=updates, segments=segments), repeat=3),
+            'rows': len(segments) * len(dates) + len(updates),
+        },
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
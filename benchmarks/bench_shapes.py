@@ -0,0 +1,60 @@
+"""
+Benchmarks deriving distances along the shapes of a synthetic feed with `build_stop_distances` and `fill_shape_dist_traveled`.
+
+Usage:
+    python -m benchmarks.bench_shapes [--scale 1.0]
+"""
+import argparse
+
+import numpy as np
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.patterns import build_trip_patterns
+from pyptvdata.shapes import build_stop_distances, fill_shape_dist_traveled, interpolate_shape_positions
+from pyptvdata.unified import build_unified_feed
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for projecting the pattern stops onto the shapes, filling stop_times, and interpolating positions.
+    """
+    feed = build_unified_feed(read_gtfs_zip(get_gtfs_zip_path(scale=scale)))
+    patterns = build_trip_patterns(feed)
+    stop_distances = build_stop_distances(feed, patterns=patterns)
+
+    shape_points = stop_distances['shape_points']
+    rng = np.random.default_rng(0)
+    positions = rng.integers(0, len(shape_points), 1_000_000)
+    shapes = shape_points['shape_index'].to_numpy()[positions]
+    distances = rng.uniform(0, 20_000, len(positions))
+
+    return [
+        {
+            'benchmark': 'shapes.build_stop_distances',
+            'variant': f'scale={scale},unified',
+            **measure(lambda: build_stop_distances(feed, patterns=patterns), repeat=3),
+            'rows': len(patterns['pattern_stops']),
+        },
+        {
+            'benchmark': 'shapes.fill_shape_dist_traveled',
+            'variant': f'scale={scale},unified',
+            **measure(lambda: fill_shape_dist_traveled(feed, stop_distances=stop_distances, patterns=patterns), repeat=3),
+            'rows': len(feed['stop_times']),
+        },
+        {
+            'benchmark': 'shapes.interpolate_shape_positions',
+            'variant': f'scale={scale},unified',
+            **measure(lambda: interpolate_shape_positions(shape_points, shapes, distances), repeat=3),
+            'rows': len(positions),
+        },
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
@@ -0,0 +1,51 @@
+"""
+Benchmarks building the walking transfers between the stops of a synthetic feed with `build_transfers`.
+
+Usage:
+    python -m benchmarks.bench_transfers [--scale 1.0]
+"""
+import argparse
+import shutil
+import tempfile
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.transfers import build_transfers
+from pyptvdata.unified import build_unified_stops
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for building the transfers at several radii, and for loading them from the cache.
+    """
+    stops, _ = build_unified_stops(read_gtfs_zip(get_gtfs_zip_path(scale=scale), tables=['stops']))
+
+    rows = []
+    for max_distance in [200.0, 400.0, 800.0]:
+        rows.append({
+            'benchmark': 'transfers.build_transfers',
+            'variant': f'scale={scale},max_distance={max_distance}',
+            **measure(lambda: build_transfers(stops, max_distance=max_distance), repeat=3),
+            'rows': len(build_transfers(stops, max_distance=max_distance)),
+        })
+
+    cache_dir = tempfile.mkdtemp(prefix='pyptvdata-transfers-')
+    try:
+        build_transfers(stops, cache_dir=cache_dir)
+        rows.append({
+            'benchmark': 'transfers.build_transfers',
+            'variant': f'scale={scale},cached',
+            **measure(lambda: build_transfers(stops, cache_dir=cache_dir), repeat=3),
+        })
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
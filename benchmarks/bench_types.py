@@ -0,0 +1,122 @@
+"""
+Compares the generated `pyptvdata.apiv3.types` dataclasses against plain (unslotted) dataclasses.
+
+Both variants are generated from `pyptvdata/apiv3/definitions.json` with `scripts/gen-dataclass.py`,
+then the memory and construction time per instance are measured for the models we hold the most of.
+
+Usage:
+    python -m benchmarks.bench_types [--scale 1.0]
+"""
+import argparse
+import dataclasses
+import importlib.util
+import os
+import time
+import tracemalloc
+import types
+
+from .fixtures import load_definitions
+from .harness import print_table
+
+
+GEN_DATACLASS_PATH = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'gen-dataclass.py')
+
+CLASS_NAMES = ['V3Departure', 'V3StopModel', 'V3Run', 'V3StopOnRoute', 'V3StopGeosearch']
+
+SAMPLE_VALUES = {
+    int: 1,
+    float: 1.0,
+    bool: True,
+    str: 'x',
+}
+
+
+def load_gen_dataclass() -> types.ModuleType:
+    """
+    Returns the `scripts/gen-dataclass.py` module.
+    """
+    spec = importlib.util.spec_from_file_location('gen_dataclass', GEN_DATACLASS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_types_module(name : str, code : str) -> types.ModuleType:
+    """
+    Executes generated types source code as a module.
+    """
+    module = types.ModuleType(name)
+    exec(compile(code, name, 'exec'), module.__dict__)
+    return module
+
+
+def get_sample_kwargs(cls : type) -> dict:
+    """
+    Returns constructor arguments that fill every scalar field of a generated dataclass.
+    """
+    kwargs = {}
+    for field in dataclasses.fields(cls):
+        for base_type, value in SAMPLE_VALUES.items():
+            if base_type in getattr(field.type, '__args__', (field.type,)):
+                kwargs[field.name] = value
+                break
+        else:
+            kwargs[field.name] = None
+    return kwargs
+
+
+def measure_instances(cls : type, number : int) -> tuple[float, float]:
+    """
+    Returns (bytes per instance, nanoseconds per construction) for a dataclass.
+    """
+    kwargs = get_sample_kwargs(cls)
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(**kwargs) for _ in range(number)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list itself holds one pointer per instance
+    bytes_per_instance = (after - before) / number - 8
+    del instances
+
+    start = time.perf_counter()
+    for _ in range(number):
+        cls(**kwargs)
+    ns_per_instance = (time.perf_counter() - start) / number * 1e9
+
+    return bytes_per_instance, ns_per_instance
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns a result row for each class and dataclass variant, measured over 100,000 * scale instances.
+    """
+    number = max(1000, int(100_000 * scale))
+    gen_dataclass = load_gen_dataclass()
+    definitions = load_definitions()
+
+    variants = {
+        'dataclass': build_types_module('types_dataclass', gen_dataclass.generate_module(definitions, slots=False)),
+        'slots': build_types_module('types_slots', gen_dataclass.generate_module(definitions, slots=True)),
+        'slots+frozen': build_types_module('types_slots_frozen', gen_dataclass.generate_module(definitions, slots=True, frozen=True)),
+    }
+
+    rows = []
+    for class_name in CLASS_NAMES:
+        for variant_name, module in variants.items():
+            bytes_per_instance, ns_per_instance = measure_instances(getattr(module, class_name), number)
+            rows.append({
+                'benchmark': f'types.{class_name}',
+                'variant': variant_name,
+                'bytes_per_instance': bytes_per_instance,
+                'ns_per_instance': ns_per_instance,
+            })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Measures 100,000 * scale instances.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
@@ -0,0 +1,43 @@
+"""
+Benchmarks merging the modes of a synthetic feed with `build_unified_feed`.
+
+Usage:
+    python -m benchmarks.bench_unified [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.unified import build_unified_feed, build_unified_stops
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for merging the stops alone, and the whole feed.
+    """
+    DFK = read_gtfs_zip(get_gtfs_zip_path(scale=scale))
+    n_stops = sum(len(tables['stops']) for tables in DFK.values())
+
+    rows = [{
+        'benchmark': 'unified.build_unified_stops',
+        'variant': f'scale={scale}',
+        **measure(lambda: build_unified_stops(DFK), repeat=3),
+        'rows': n_stops,
+    }]
+
+    rows.append({
+        'benchmark': 'unified.build_unified_feed',
+        'variant': f'scale={scale}',
+        **measure(lambda: build_unified_feed(DFK), repeat=3),
+        'rows': sum(len(tables['stop_times']) for tables in DFK.values()),
+    })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
@@ -0,0 +1,43 @@
+"""
+Benchmarks validating a synthetic feed with `validate_gtfs`.
+
+Usage:
+    python -m benchmarks.bench_validate [--scale 1.0]
+"""
+import argparse
+
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.validate import validate_gtfs
+
+from .fixtures import get_gtfs_zip_path
+from .harness import measure, print_table
+
+
+def run(scale : float = 1.0) -> list[dict]:
+    """
+    Returns result rows for validating the whole feed, and the seconds of each check over all modes from one profiled run.
+    """
+    DFK = read_gtfs_zip(get_gtfs_zip_path(scale=scale))
+
+    rows = [{
+        'benchmark': 'validate.validate_gtfs',
+        'variant': f'scale={scale}',
+        **measure(lambda: validate_gtfs(DFK), repeat=3),
+        'rows': sum(len(df) for tables in DFK.values() for df in tables.values()),
+    }]
+
+    _, report = validate_gtfs(DFK, profile=True)
+    for check_name, seconds in report.groupby('check', sort=False)['seconds'].sum().items():
+        rows.append({
+            'benchmark': f'validate.validate_gtfs.{check_name}',
+            'variant': f'scale={scale}',
+            'best_seconds': seconds,
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=float, default=1.0, help="Scale of the synthetic feed, see benchmarks.fixtures.make_gtfs_mode_tables.")
+    args = parser.parse_args()
+    print_table(run(scale=args.scale))
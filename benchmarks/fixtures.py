@@ -0,0 +1,320 @@
+"""
+Deterministic synthetic fixtures for the benchmarks, so that they run offline:
+- API JSON responses shaped like the swagger definitions.
+- gtfs.zip feeds with the same mode/google_transit.zip layout as the PTV feed.
+- GTFS-R protobuf feeds.
+"""
+import io
+import json
+import math
+import os
+import random
+import tempfile
+import zipfile
+
+from google.transit import gtfs_realtime_pb2
+
+from pyptvdata.const import MODE_IDS, GTFS_FILE_FIELDS
+
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+DEFINITIONS_PATH = os.path.join(ROOT_DIR, 'pyptvdata', 'apiv3', 'definitions.json')
+
+
+def load_definitions() -> dict[str, dict]:
+    """
+    Returns the PTV API swagger definitions shipped with pyptvdata.
+    """
+    with open(DEFINITIONS_PATH) as f:
+        return json.load(f)
+
+
+def make_api_json(definitions : dict[str, dict], definition_name : str, list_length : int = 100, seed : int = 0) -> dict:
+    """
+    Returns a response-shaped dict for a swagger definition, e.g. 'V3.DeparturesResponse'.
+
+    Arrays and maps of models get `list_length` items at the top level and a few items below that.
+    """
+    rng = random.Random(seed)
+
+    def make_scalar(prop_schema : dict):
+        if 'enum' in prop_schema:
+            return rng.choice(prop_schema['enum'])
+        prop_type = prop_schema.get('type')
+        if prop_type == 'integer':
+            return rng.randrange(0, 100_000)
+        if prop_type == 'number':
+            return round(rng.uniform(-38.5, 145.5), 6)
+        if prop_type == 'boolean':
+            return rng.random() < 0.5
+        if prop_schema.get('format') == 'date-time':
+            return f'2024-03-{rng.randrange(1, 29):02d}T{rng.randrange(0, 24):02d}:{rng.randrange(0, 60):02d}:00Z'
+        return ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz ') for _ in range(rng.randrange(4, 24)))
+
+    def make_model(name : str, length : int, depth : int) -> dict:
+        model = {}
+        for prop_name, prop_schema in definitions[name]['properties'].items():
+            model[prop_name] = make_value(prop_schema, length, depth)
+        return model
+
+    def make_value(prop_schema : dict, length : int, depth : int):
+        if '$ref' in prop_schema:
+            if depth > 3:
+                return None
+            return make_model(prop_schema['$ref'].split('#/definitions/', 1)[1], 3, depth + 1)
+        prop_type = prop_schema.get('type')
+        if prop_type == 'array':
+            return [make_value(prop_schema['items'], 3, depth + 1) for _ in range(length)]
+        if prop_type == 'object':
+            if 'additionalProperties' not in prop_schema:
+                return {}
+            return {str(i): make_value(prop_schema['additionalProperties'], 3, depth + 1) for i in range(length)}
+        return make_scalar(prop_schema)
+
+    return make_model(definition_name, list_length, 0)
+
+
+def make_api_responses(list_length : int = 1000) -> dict[str, bytes]:
+    """
+    Returns canned JSON response bodies keyed by their `pyptvdata.apiv3.types` class name.
+    """
+    definitions = load_definitions()
+    responses = {}
+    for definition_name in ['V3.DeparturesResponse', 'V3.RunsResponse', 'V3.StopsOnRouteResponse', 'V3.StopsByDistanceResponse']:
+        class_name = definition_name.replace('.', '')
+        responses[class_name] = json.dumps(make_api_json(definitions, definition_name, list_length=list_length)).encode('utf-8')
+    return responses
+
+
+def load_recorded_api_responses(fixtures_dir : str) -> dict[str, bytes]:
+    """
+    Returns recorded JSON response bodies from a directory of `<class name>.json` files, e.g. `V3DeparturesResponse.json`.
+    """
+    responses = {}
+    for file_name in sorted(os.listdir(fixtures_dir)):
+        if not file_name.endswith('.json'):
+            continue
+        with open(os.path.join(fixtures_dir, file_name), 'rb') as f:
+            responses[file_name.removesuffix('.json')] = f.read()
+    return responses
+
+
+# Service IDs of the synthetic feed: weekdays, Saturdays and Sundays
+SERVICE_DAYS = {
+    'T0': (1, 1, 1, 1, 1, 0, 0),
+    'T2': (0, 0, 0, 0, 0, 1, 0),
+    'UJ': (0, 0, 0, 0, 0, 0, 1),
+}
+
+# Average speed in km/h of the synthetic trips, by mode
+MODE_SPEEDS = {'1': 60, '2': 40, '3': 16, '4': 20, '5': 50, '6': 25, '10': 70, '11': 45}
+
+
+def _format_time(seconds : int) -> str:
+    return f'{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}'
+
+
+def _haversine_m(lat1 : float, lon1 : float, lat2 : float, lon2 : float) -> float:
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6371000 * math.asin(math.sqrt(a))
+
+
+def _make_csv(table_name : str, rows : list[tuple]) -> str:
+    lines = [','.join(GTFS_FILE_FIELDS[table_name])]
+    lines.extend(','.join('' if value is None else str(value) for value in row) for row in rows)
+    return '\n'.join(lines) + '\n'
+
+
+def make_gtfs_mode_tables(mode_id : str, scale : float = 1.0, shared_stops : list[tuple] = None, seed : int = 0) -> dict[str, str]:
+    """
+    Returns the CSV text of each table of a synthetic google_transit.zip for a mode, keyed by table name.
+
+    Each route has two directions over the same stops, a full and a short-working stop pattern,
+    and trips every 10 to 40 minutes from 5am to past midnight on weekdays, Saturdays and Sundays,
+    running slower in the peaks. About a third of the routes have blank shape_dist_traveled in stop_times.
+
+    Parameters:
+    - scale: The number of routes is 8 * scale, and each route has 10 to 40 stops.
+    - shared_stops: (stop_id, stop_name, stop_lat, stop_lon) rows of other modes. Some routes start at one of them, like an interchange.
+    """
+    rng = random.Random(f'{seed}-{mode_id}')
+    speed = MODE_SPEEDS.get(mode_id, 30) / 3.6
+
+    stops = {}
+    routes = []
+    trips = []
+    stop_times = []
+    shapes = []
+
+    for route_index in range(max(1, round(8 * scale))):
+        route_id = f'{mode_id}-R{route_index:03d}-mjp-1'
+        routes.append((route_id, mode_id, str(route_index + 1), f'Route {route_index + 1}', mode_id, 'FFFFFF', '000000'))
+
+        # Lay the stops out along a gently curving path, about 400 m apart
+        route_stops = []
+        if shared_stops and rng.random() < 0.2:
+            route_stops.append(rng.choice(shared_stops))
+            lat, lon = route_stops[0][2], route_stops[0][3]
+        else:
+            lat, lon = rng.uniform(-38.1, -37.6), rng.uniform(144.6, 145.4)
+        bearing = rng.uniform(0, 2 * math.pi)
+        n_route_stops = rng.randrange(10, 41)
+        while len(route_stops) < n_route_stops:
+            if len(route_stops) > 0:
+                step = rng.uniform(250, 600)
+                bearing += rng.gauss(0, 0.3)
+                lat += step * math.cos(bearing) / 111_320
+                lon += step * math.sin(bearing) / (111_320 * math.cos(math.radians(lat)))
+            stop_id = f'{int(mode_id) * 100_000 + len(stops)}'
+            route_stops.append((stop_id, f'Stop {stop_id}', round(lat, 6), round(lon, 6)))
+            stops[stop_id] = route_stops[-1]
+        for stop in route_stops:
+            stops[stop[0]] = stop
+
+        blank_distances = rng.random() < 0.3
+        headway = rng.choice([10, 12, 15, 20, 30, 40]) * 60
+
+        for direction_id, direction_stops in enumerate([route_stops, route_stops[::-1]]):
+            full_pattern = direction_stops
+            short_pattern = direction_stops[:max(2, len(direction_stops) * 7 // 10)]
+            shape_id = f'{route_id}.{direction_id}'
+
+            # The shape goes through every stop, with a jittered point between each pair
+            distance = 0.0
+            shape_points = []
+            for i, stop in enumerate(full_pattern):
+                if i > 0:
+                    prev = full_pattern[i - 1]
+                    mid_lat = (prev[2] + stop[2]) / 2 + rng.uniform(-0.0004, 0.0004)
+                    mid_lon = (prev[3] + stop[3]) / 2 + rng.uniform(-0.0004, 0.0004)
+                    distance += _haversine_m(shape_points[-1][0], shape_points[-1][1], mid_lat, mid_lon)
+                    shape_points.append((mid_lat, mid_lon, distance))
+                    distance += _haversine_m(mid_lat, mid_lon, stop[2], stop[3])
+                shape_points.append((stop[2], stop[3], distance))
+            for sequence, (point_lat, point_lon, point_distance) in enumerate(shape_points, start=1):
+                shapes.append((shape_id, round(point_lat, 6), round(point_lon, 6), sequence, round(point_distance, 2)))
+
+            for service_id, days in SERVICE_DAYS.items():
+                service_headway = headway if service_id == 'T0' else headway * 3 // 2
+                for trip_index, start_time in enumerate(range(5 * 3600 + rng.randrange(0, service_headway), 24 * 3600 + 1800, service_headway)):
+                    pattern = short_pattern if trip_index % 4 == 3 else full_pattern
+                    trip_id = f'{route_id}.{service_id}.{direction_id}.{trip_index}'
+                    trips.append((route_id, service_id, trip_id, shape_id, pattern[-1][1], str(direction_id)))
+
+                    peak = 7 * 3600 <= start_time < 9 * 3600 or 16 * 3600 <= start_time < 18 * 3600
+                    time = start_time
+                    distance = 0.0
+                    for sequence, stop in enumerate(pattern, start=1):
+                        if sequence > 1:
+                            step = _haversine_m(pattern[sequence - 2][2], pattern[sequence - 2][3], stop[2], stop[3])
+                            distance += step
+                            time += round(step / speed * (1.3 if peak else 1.0)) + 20
+                        shape_dist_traveled = None if blank_distances else round(distance, 2)
+                        stop_times.append((trip_id, _format_time(time), _format_time(time), stop[0], sequence, None, 0, 0, shape_dist_traveled))
+
+    calendar = [(service_id, *days, '20240101', '20241231') for service_id, days in SERVICE_DAYS.items()]
+    # A public holiday on a Monday runs to the Sunday timetable
+    calendar_dates = [('T0', '20240311', 2), ('UJ', '20240311', 1)]
+
+    return {
+        'agency': _make_csv('agency', [(mode_id, f'Agency {mode_id}', 'https://www.ptv.vic.gov.au', 'Australia/Melbourne', 'EN')]),
+        'calendar': _make_csv('calendar', calendar),
+        'calendar_dates': _make_csv('calendar_dates', calendar_dates),
+        'routes': _make_csv('routes', routes),
+        'trips': _make_csv('trips', trips),
+        'stops': _make_csv('stops', list(stops.values())),
+        'stop_times': _make_csv('stop_times', stop_times),
+        'shapes': _make_csv('shapes', shapes),
+    }
+
+
+def make_gtfs_zip(file, scale : float = 1.0, mode_ids : list[str] = MODE_IDS, seed : int = 0):
+    """
+    Writes a synthetic gtfs.zip with a {mode_id}/google_transit.zip for each mode to a path or file object.
+
+    The feed is deterministic for a given scale, mode_ids and seed. See `make_gtfs_mode_tables`.
+    """
+    shared_stops = []
+    with zipfile.ZipFile(file, 'w', zipfile.ZIP_DEFLATED) as gtfs_zip:
+        for mode_id in mode_ids:
+            tables = make_gtfs_mode_tables(mode_id, scale=scale, shared_stops=shared_stops, seed=seed)
+            google_transit_file = io.BytesIO()
+            with zipfile.ZipFile(google_transit_file, 'w', zipfile.ZIP_DEFLATED) as transit_zip:
+                for table_name, csv_text in tables.items():
+                    transit_zip.writestr(f'{table_name}.txt', csv_text)
+            gtfs_zip.writestr(f'{mode_id}/', '')
+            gtfs_zip.writestr(f'{mode_id}/google_transit.zip', google_transit_file.getvalue())
+
+            for line in tables['stops'].splitlines()[1::50]:
+                stop_id, stop_name, stop_lat, stop_lon = line.split(',')
+                shared_stops.append((stop_id, stop_name, float(stop_lat), float(stop_lon)))
+
+
+def get_gtfs_zip_path(scale : float = 1.0, seed : int = 0) -> str:
+    """
+    Returns the path of a synthetic gtfs.zip for all of MODE_IDS, generating it into the temp directory on first use.
+    """
+    cache_dir = os.path.join(tempfile.gettempdir(), 'pyptvdata-benchmarks')
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f'gtfs-{scale}-{seed}.zip')
+    if not os.path.exists(path):
+        make_gtfs_zip(f'{path}.tmp', scale=scale, seed=seed)
+        os.replace(f'{path}.tmp', path)
+    return path
+
+
+def make_gtfs_r_feed(trip_ids : list[str] = None, n_trips : int = 500, stops_per_trip : int = 20, timestamp : int = 1710140400, seed : int = 0) -> bytes:
+    """
+    Returns a serialised GTFS-R FeedMessage with a trip update and a vehicle position for each trip.
+
+    Parameters:
+    - trip_ids: Trip IDs to make updates for, e.g. from a synthetic feed. Defaults to n_trips made-up IDs.
+    - timestamp: The feed timestamp, in Unix time.
+    """
+    rng = random.Random(seed)
+    if trip_ids is None:
+        trip_ids = [f'trip-{i}' for i in range(n_trips)]
+
+    feed = gtfs_realtime_pb2.FeedMessage()
+    feed.header.gtfs_realtime_version = '2.0'
+    feed.header.timestamp = timestamp
+
+    for trip_id in trip_ids:
+        entity = feed.entity.add()
+        entity.id = f'{trip_id}-tu'
+        entity.trip_update.trip.trip_id = trip_id
+        entity.trip_update.timestamp = timestamp
+        delay = rng.randrange(-60, 600)
+        for stop_sequence in range(1, stops_per_trip + 1):
+            delay += rng.randrange(-30, 60)
+            stop_time_update = entity.trip_update.stop_time_update.add()
+            stop_time_update.stop_sequence = stop_sequence
+            stop_time_update.arrival.delay = delay
+            stop_time_update.departure.delay = delay
+
+        entity = feed.entity.add()
+        entity.id = f'{trip_id}-vp'
+        entity.vehicle.trip.trip_id = trip_id
+        entity.vehicle.vehicle.id = f'vehicle-{rng.randrange(10_000)}'
+        entity.vehicle.position.latitude = rng.uniform(-38.1, -37.6)
+        entity.vehicle.position.longitude = rng.uniform(144.6, 145.4)
+        entity.vehicle.current_stop_sequence = rng.randrange(1, stops_per_trip + 1)
+        entity.vehicle.timestamp = timestamp
+
+    return feed.SerializeToString()
+
+
+def load_recorded_gtfs_r_feeds(fixtures_dir : str) -> dict[str, bytes]:
+    """
+    Returns recorded GTFS-R feeds from a directory of `.pb` files, keyed by file name.
+    None are shipped: record them by saving the bytes returned by GTFSRClient, e.g. `get_tram_tripupdates()`.
+    """
+    feeds = {}
+    for file_name in sorted(os.listdir(fixtures_dir)):
+        if not file_name.endswith('.pb'):
+            continue
+        with open(os.path.join(fixtures_dir, file_name), 'rb') as f:
+            feeds[file_name.removesuffix('.pb')] = f.read()
+    return feeds
@@ -0,0 +1,41 @@
+"""
+Timing and reporting helpers shared by the benchmark modules.
+"""
+import statistics
+import time
+from collections.abc import Callable
+
+
+def measure(func : Callable, repeat : int = 5, number : int = 1) -> dict[str, float]:
+    """
+    Calls func `number` times per run for `repeat` runs, and returns the best and median seconds per call.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return {'best_seconds': min(timings), 'median_seconds': statistics.median(timings)}
+
+
+def format_value(value) -> str:
+    if isinstance(value, float):
+        if value == 0 or 1e-3 <= abs(value) < 1e6:
+            return f'{value:.4f}'
+        return f'{value:.3e}'
+    return str(value)
+
+
+def print_table(rows : list[dict]):
+    """
+    Prints result rows as an aligned table, with a column for each key in any row.
+    """
+    if len(rows) == 0:
+        return
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    cells = [[format_value(row.get(column, '')) for column in columns] for row in rows]
+    widths = [max(len(column), *(len(row[i]) for row in cells)) for i, column in enumerate(columns)]
+    print('  '.join(column.ljust(width) for column, width in zip(columns, widths)))
+    for row in cells:
+        print('  '.join(cell.ljust(width) for cell, width in zip(row, widths)))
@@ -0,0 +1,136 @@
+import concurrent.futures
+import os
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+from .isochrone import to_seconds, get_origin_stops, scan_connections
+
+
+# Default travel time thresholds, in minutes
+THRESHOLDS = [15, 30, 45, 60]
+
+
+def share_network(network : dict[str, np.ndarray]) -> tuple[shared_memory.SharedMemory, dict[str, tuple[int, str, tuple]]]:
+    """
+    Copies the arrays of a network into one shared memory block, and returns the block and the layout
+    {name: (offset, dtype, shape)} that `attach_network` needs to map them in another process.
+    The caller must close and unlink the block when done.
+    """
+    layout = {}
+    offset = 0
+    for name, values in network.items():
+        offset = (offset + 63) // 64 * 64
+        layout[name] = (offset, values.dtype.str, values.shape)
+        offset += values.nbytes
+    shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+    for name, values in network.items():
+        start, dtype, shape = layout[name]
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=start)[...] = values
+    return shm, layout
+
+
+def attach_network(shm_name : str, layout : dict[str, tuple[int, str, tuple]]) -> tuple[shared_memory.SharedMemory, dict[str, np.ndarray]]:
+    """
+    Maps a network shared by `share_network` without copying it, and returns the block, which must be kept open while the arrays are used,
+    and the network.
+    """
+    # Worker processes share the resource tracker of the process that created the block, which unlinks it
+    shm = shared_memory.SharedMemory(name=shm_name)
+    network = {
+        name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+        for name, (offset, dtype, shape) in layout.items()
+    }
+    return shm, network
+
+
+def get_origin_scores(
+        network : dict[str, np.ndarray],
+        origins : list[int | tuple[float, float]],
+        departure_times : list[int],
+        thresholds : np.ndarray,
+        opportunities : np.ndarray,
+    ) -> np.ndarray:
+    """
+    Returns the cumulative opportunities of each origin, an array of origins × thresholds:
+    the opportunities at the stops reached within each threshold in seconds, averaged over the departure times.
+    """
+    max_seconds = int(thresholds[-1])
+    scores = np.zeros((len(origins), len(thresholds)))
+    for k, origin in enumerate(origins):
+        origin_stops, origin_seconds = get_origin_stops(network, origin)
+        for departure_time in departure_times:
+            earliest = scan_connections(network, origin_stops, origin_seconds, departure_time, max_seconds)
+            reached = np.flatnonzero(earliest >= 0)
+            bins = np.searchsorted(thresholds, earliest[reached] - departure_time, side='left')
+            scores[k] += np.cumsum(np.bincount(bins, weights=opportunities[reached], minlength=len(thresholds)))
+    return scores / max(len(departure_times), 1)
+
+
+_worker_shm = None
+_worker_network = None
+
+
+def _init_accessibility_worker(shm_name : str, layout : dict[str, tuple[int, str, tuple]]):
+    global _worker_shm, _worker_network
+    _worker_shm, _worker_network = attach_network(shm_name, layout)
+
+
+def _get_worker_scores(args : tuple) -> np.ndarray:
+    origins, departure_times, thresholds = args
+    return get_origin_scores(_worker_network, origins, departure_times, thresholds, _worker_network['opportunities'])
+
+
+def get_accessibility(
+        network : dict[str, np.ndarray],
+        origins : list[int | tuple[float, float]] = None,
+        departure_times : list[str | int] = ('07:00:00', '07:30:00', '08:00:00', '08:30:00'),
+        thresholds : list[float] = THRESHOLDS,
+        opportunities : np.ndarray = None,
+        processes : int = None,
+        chunksize : int = 32,
+    ) -> pd.DataFrame:
+    """
+    Returns the cumulative-opportunity accessibility of each origin, as a DataFrame of origins × thresholds:
+    the opportunities reachable by transit and walking within each threshold, averaged over the departure times, see `get_isochrone`.
+
+    The network is copied once into shared memory, see `share_network`, and the origins are split into chunks of chunksize
+    searched by a pool of processes that map it without copying, so the run time falls close to linearly with the processes.
+
+    Parameters:
+    - network: The output of `build_transit_network`.
+    - origins: stop_index values or (lat, lon) coordinates. Defaults to every stop with coordinates. The index of the result is the origins.
+    - departure_times: Service day times, HH:MM:SS or seconds.
+    - thresholds: Travel times in minutes, the columns of the result.
+    - opportunities: Opportunities at each stop_index, e.g. jobs or population near the stop. Defaults to 1, i.e. the number of stops reachable.
+    - processes: Number of worker processes. Defaults to the number of CPUs. If 1, runs in this process.
+    """
+    n_stops = len(network['stop_lat'])
+    if origins is None:
+        origins = np.flatnonzero(~np.isnan(network['stop_lat'])).tolist()
+    departure_times = [to_seconds(departure_time) for departure_time in departure_times]
+    threshold_seconds = np.array([int(threshold * 60) for threshold in thresholds], dtype=np.int64)
+    assert np.all(np.diff(threshold_seconds) > 0), f"Thresholds must be increasing, got {thresholds}"
+    if opportunities is None:
+        opportunities = np.ones(n_stops)
+    opportunities = np.asarray(opportunities, dtype=np.float64)
+    assert opportunities.shape == (n_stops,), f"Opportunities must have one value per stop_index ({n_stops}), got shape {opportunities.shape}"
+
+    chunks = [origins[start:start + chunksize] for start in range(0, len(origins), chunksize)]
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    if processes == 1 or len(chunks) <= 1:
+        results = [get_origin_scores(network, chunk, departure_times, threshold_seconds, opportunities) for chunk in chunks]
+    else:
+        shm, layout = share_network({**network, 'opportunities': opportunities})
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processes, initializer=_init_accessibility_worker, initargs=(shm.name, layout)) as executor:
+                results = list(executor.map(_get_worker_scores, [(chunk, departure_times, threshold_seconds) for chunk in chunks]))
+        finally:
+            shm.close()
+            shm.unlink()
+
+    scores = np.concatenate(results) if results else np.empty((0, len(thresholds)))
+    index = pd.Index(origins, name='stop_index') if all(isinstance(origin, (int, np.integer)) for origin in origins) else pd.Index(origins, name='origin', tupleize_cols=False)
+    return pd.DataFrame(scores, index=index, columns=pd.Index(thresholds, name='threshold_minutes'))
@@ -1,7 +1,15 @@
 from hashlib import sha1
 import hmac
-import requests
+import threading
+import time
 import urllib.parse
+from collections.abc import Iterator
+from concurrent.futures import Future
+
+from ..metrics import Metrics
+from ..transport import Transport, get_retry_count
+from .decoders import decode_json, get_default_decoder, to_dict, DECODERS
+from .types import V3StopDepartureRequest
 
 def get_ptv_api_url(
         endpoint : str,
@@ -25,28 +33,151 @@ def get_ptv_api_url(
     return f'https://timetableapi.ptv.vic.gov.au{raw}&signature={signature}'
 
 
+def get_canonical_endpoint(endpoint : str) -> str:
+    """
+    Returns the endpoint with its query parameters sorted, so that equivalent requests have the same endpoint.
+    """
+    path, _, query = endpoint.partition('?')
+    if query == '':
+        return path
+    return f"{path}?{'&'.join(sorted(query.split('&')))}"
+
+
 class PTVAPIClient:
-    def __init__(self, dev_id : str | int, api_key : str | int):
+    def __init__(
+            self,
+            dev_id : str | int,
+            api_key : str | int,
+            decoder : str = None,
+            coalesce_requests : bool = False,
+            transport : Transport = None,
+            metrics : Metrics = None,
+        ):
+        """
+        Parameters:
+        - transport: The HTTP transport (connection pool, retries, timeouts, compression, HTTP/2).
+          Defaults to a new Transport(). Pass the same Transport to several clients to share their connections.
+        - decoder: The JSON decoder backend, one of 'orjson', 'msgspec', 'stdlib'. Defaults to the first one installed.
+          msgspec is the fastest when decoding into `pyptvdata.apiv3.types` with `response_type`.
+        - coalesce_requests: If True, threads that call get_data for the same endpoint while a request for it is in flight
+          wait for that request and share its result, instead of sending their own, and an exception raised by it is raised in every thread.
+          The callers get the same dict or dataclass object, not copies, so it is read-only: a change made by one caller is seen by the others.
+        - metrics: If given, records latency, bytes, decode time, retries and coalesced calls of each request, and calls its hooks.
+        """
+        assert decoder is None or decoder in DECODERS, f"Decoder must be one of {DECODERS}, got {decoder}"
         self.dev_id = dev_id
         self.api_key = api_key
-        self.session = requests.Session()
+        self.transport = transport if transport is not None else Transport()
+        self.session = self.transport.session
+        self.decoder = decoder if decoder is not None else get_default_decoder()
+        self.coalesce_requests = coalesce_requests
+        self.metrics = metrics
+        self._in_flight : dict[tuple, Future] = {}
+        self._in_flight_lock = threading.Lock()
 
-    def get_data(self, endpoint : str, need_auth : bool = True):
+    def get_data(self, endpoint : str, need_auth : bool = True, response_type : type = None):
         """
         Returns the data from the URL.
+
+        Parameters:
+        - response_type: A `pyptvdata.apiv3.types` dataclass, e.g. V3DeparturesResponse, to decode the response into. If None, returns a dict.
+        """
+        if not self.coalesce_requests:
+            return self._fetch_data(endpoint, need_auth=need_auth, response_type=response_type)
+
+        key = (get_canonical_endpoint(endpoint), need_auth, response_type)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_owner:
+            if self.metrics is None:
+                return future.result()
+            info = self.metrics.start_request('ptvapi', 'GET', f'https://timetableapi.ptv.vic.gov.au{endpoint}')
+            info.coalesced = True
+            try:
+                return future.result()
+            finally:
+                info.duration = info.get_elapsed()
+                self.metrics.end_request(info)
+
+        try:
+            data = self._fetch_data(endpoint, need_auth=need_auth, response_type=response_type)
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    def _fetch_data(self, endpoint : str, need_auth : bool = True, response_type : type = None):
+        return self._request('GET', endpoint, need_auth=need_auth, response_type=response_type)
+
+    def post_data(self, endpoint : str, data, need_auth : bool = True, response_type : type = None):
         """
+        Posts data as JSON to the URL and returns the response data.
+
+        Parameters:
+        - data: A dict or a `pyptvdata.apiv3.types` dataclass, e.g. V3BulkDeparturesRequest.
+        - response_type: A `pyptvdata.apiv3.types` dataclass to decode the response into. If None, returns a dict.
+        """
+        return self._request('POST', endpoint, data=data, need_auth=need_auth, response_type=response_type)
+
+    def _request(self, method : str, endpoint : str, data = None, need_auth : bool = True, response_type : type = None):
         if need_auth:
             url = get_ptv_api_url(endpoint, self.dev_id, self.api_key)
         else:
             url = f'https://timetableapi.ptv.vic.gov.au{endpoint}'
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()
+
+        if self.metrics is None:
+            if method == 'POST':
+                response = self.transport.post(url, json=to_dict(data))
+            else:
+                response = self.transport.get(url)
+            response.raise_for_status()
+            return decode_json(response.content, decoder=self.decoder, response_type=response_type)
+
+        # The signed URL is left out of the metrics, so that the dev id is not exported
+        info = self.metrics.start_request('ptvapi', method, f'https://timetableapi.ptv.vic.gov.au{endpoint}')
+        try:
+            if method == 'POST':
+                response = self.transport.post(url, json=to_dict(data))
+            else:
+                response = self.transport.get(url)
+            info.duration = info.get_elapsed()
+            info.status_code = response.status_code
+            info.response_bytes = len(response.content)
+            info.retries = get_retry_count(response)
+            response.raise_for_status()
+            decode_start = time.perf_counter()
+            result = decode_json(response.content, decoder=self.decoder, response_type=response_type)
+            info.decode_duration = time.perf_counter() - decode_start
+            return result
+        except BaseException as e:
+            info.error = e
+            if info.duration is None:
+                info.duration = info.get_elapsed()
+            raise
+        finally:
+            self.metrics.end_request(info)
     
 
 class PTVAPI3(PTVAPIClient):
-    def __init__(self, dev_id : str | int, api_key : str | int):
-        super().__init__(dev_id, api_key)
+
+    # The bulk departures endpoint takes a V3BulkDeparturesRequest body.
+    # It is not listed in the published swagger paths, so it can be overridden here.
+    BULK_DEPARTURES_ENDPOINT = '/v3/departures/bulk'
+
+    # Maximum number of stop requests per bulk departures request
+    BULK_DEPARTURES_BATCH_SIZE = 50
+
+    def __init__(self, dev_id : str | int, api_key : str | int, **kwargs):
+        super().__init__(dev_id, api_key, **kwargs)
 
 
     def get_docs(self) -> dict:
@@ -251,6 +382,104 @@ class PTVAPI3(PTVAPIClient):
         return self.get_data(endpoint)
     
 
+    def get_bulk_departures(
+            self,
+            stop_requests : list[V3StopDepartureRequest | dict],
+            date_utc : str = None,
+            look_backwards : bool = None,
+            include_cancelled : bool = None,
+            include_geopath : bool = None,
+            expand : list[str] | str = None,
+            batch_size : int = None,
+        ) -> dict:
+        """
+        Returns the departures for many stops and route directions, using as few requests as possible.
+        Endpoint: POST /v3/departures/bulk
+
+        Stop requests for the same stop are merged into one, and the stop requests are sent in batches of batch_size.
+        Returns a dict of:
+        - departures: Keyed by (route_type, stop_id), each value a dict of:
+            - stop: The stop, if returned.
+            - responses: The departures for each requested route direction of the stop (V3BulkDeparturesUpdateResponse).
+        - runs, routes, directions: The expanded objects of all batches, each listed once.
+        - disruptions: The expanded disruptions of all batches, keyed by disruption_id.
+
+        The response keys stops by stop_id only, so stops with the same stop_id but different route types are sent in different batches.
+
+        Parameters:
+        - stop_requests: V3StopDepartureRequest or dicts of the same fields, each with the route_directions to find departures for.
+        - batch_size: Defaults to BULK_DEPARTURES_BATCH_SIZE.
+        """
+        if batch_size is None:
+            batch_size = self.BULK_DEPARTURES_BATCH_SIZE
+
+        if expand is not None and isinstance(expand, str):
+            expand = [expand]
+
+        merged_requests = {}
+        for stop_request in stop_requests:
+            stop_request = to_dict(stop_request)
+            key = (stop_request.get('route_type'), stop_request.get('stop_id'), stop_request.get('max_results'), stop_request.get('gtfs'))
+            if key not in merged_requests:
+                merged_requests[key] = {**stop_request, 'route_directions': []}
+            for route_direction in stop_request.get('route_directions', []):
+                if route_direction not in merged_requests[key]['route_directions']:
+                    merged_requests[key]['route_directions'].append(route_direction)
+
+        batches = []
+        batch_route_types = []
+        for stop_request in merged_requests.values():
+            stop_id = str(stop_request.get('stop_id'))
+            route_type = stop_request.get('route_type')
+            for batch, route_types in zip(batches, batch_route_types):
+                if len(batch) < batch_size and route_types.get(stop_id, route_type) == route_type:
+                    break
+            else:
+                batch, route_types = [], {}
+                batches.append(batch)
+                batch_route_types.append(route_types)
+            batch.append(stop_request)
+            route_types[stop_id] = route_type
+
+        results = {
+            'departures': {},
+            'runs': {},
+            'routes': {},
+            'directions': {},
+            'disruptions': {},
+        }
+        for batch in batches:
+            bulk_request = {
+                'requests': batch,
+                'date_utc': date_utc,
+                'look_backwards': look_backwards,
+                'include_cancelled': include_cancelled,
+                'include_geopath': include_geopath,
+                'expand': expand,
+            }
+            data = self.post_data(self.BULK_DEPARTURES_ENDPOINT, bulk_request)
+
+            # Each stop_id of the batch has one route type, so the stop of a response is unambiguous
+            stops = data.get('stops') or {}
+            for response in data.get('responses') or []:
+                key = (response['route_type'], response['stop_id'])
+                if key not in results['departures']:
+                    results['departures'][key] = {'stop': stops.get(str(response['stop_id'])), 'responses': []}
+                results['departures'][key]['responses'].append(response)
+
+            for run in data.get('runs') or []:
+                results['runs'].setdefault(run.get('run_ref'), run)
+            for route in data.get('routes') or []:
+                results['routes'].setdefault((route.get('route_type'), route.get('route_id')), route)
+            for direction in data.get('directions') or []:
+                results['directions'].setdefault((direction.get('route_id'), direction.get('direction_id')), direction)
+            results['disruptions'].update(data.get('disruptions') or {})
+
+        for name in ['runs', 'routes', 'directions']:
+            results[name] = list(results[name].values())
+        return results
+    
+
     def get_disruptions(
             self, 
             route_id : int = None, 
@@ -587,4 +816,140 @@ class PTVAPI3(PTVAPIClient):
             endpoint += '?' + '&'.join(params)
 
         return self.get_data(endpoint)
-    
+
+
+    def iter_departures(
+            self,
+            stop_id : int,
+            route_type : int,
+            route_id : int = None,
+            platform_numbers : list[int] | int = None,
+            direction_id : int = None,
+            gtfs : bool = None,
+            date_utc : str = None,
+            end_utc : str = None,
+            page_size : int = 20,
+            include_cancelled : bool = None,
+            expand : list[str] | str = None,
+        ) -> Iterator[dict]:
+        """
+        Yields pages of departures at a stop, moving forward in time from date_utc until end_utc.
+        Each page is the response of `get_departures`, with departures already yielded in a previous page removed.
+
+        The API returns up to page_size departures per route and direction. A route-direction that returned fewer has no more departures
+        before end_utc, so the next page starts at the earliest of the last departure times of the route-directions that returned a full page
+        of departures, and paging stops when there are none. Departures yielded before are tracked from the cursor on, so they are not repeated.
+
+        Parameters:
+        - date_utc: Start time in ISO 8601 UTC format, e.g. 2024-03-01T10:00:00Z. Defaults to now.
+        - end_utc: Stop once departures are at or after this time, in the same format. If None, pages until no route-direction has more departures.
+        - page_size: max_results for each request.
+        """
+        cursor = date_utc
+        seen_keys = set()
+        while True:
+            page = self.get_departures(
+                stop_id=stop_id,
+                route_type=route_type,
+                route_id=route_id,
+                platform_numbers=platform_numbers,
+                direction_id=direction_id,
+                gtfs=gtfs,
+                date_utc=cursor,
+                max_results=page_size,
+                include_cancelled=include_cancelled,
+                expand=expand,
+            )
+
+            departures = []
+            counts = {}
+            last_departure_utc = {}
+            for departure in page['departures']:
+                departure_utc = departure['scheduled_departure_utc']
+                route_direction = (departure['route_id'], departure['direction_id'])
+                counts[route_direction] = counts.get(route_direction, 0) + 1
+                last_departure_utc[route_direction] = max(last_departure_utc.get(route_direction, departure_utc), departure_utc)
+                if end_utc is not None and departure_utc >= end_utc:
+                    continue
+                key = (departure['run_ref'], departure['stop_id'], departure_utc)
+                if key not in seen_keys:
+                    seen_keys.add(key)
+                    departures.append(departure)
+
+            if len(departures) > 0:
+                # The page may be shared with other threads, so it is copied rather than modified
+                yield {**page, 'departures': departures}
+
+            # Only route-directions that filled the page can have more departures, after their last one
+            remaining = [
+                departure_utc for route_direction, departure_utc in last_departure_utc.items()
+                if counts[route_direction] >= page_size
+                and (cursor is None or departure_utc > cursor)
+                and (end_utc is None or departure_utc < end_utc)
+            ]
+            if len(remaining) == 0:
+                return
+
+            cursor = min(remaining)
+            # Departures before the cursor cannot be returned again
+            seen_keys = {key for key in seen_keys if key[2] >= cursor}
+
+
+    def iter_all_outlets(self, page_size : int = 30) -> Iterator[list[dict]]:
+        """
+        Yields pages of outlets, widening max_results by page_size on each request.
+        Each page only has the outlets not yielded before.
+        Endpoint: /v3/outlets
+        """
+        max_results = page_size
+        yielded_count = 0
+        while True:
+            outlets = self.get_all_outlets(max_results=max_results)
+            if len(outlets) > yielded_count:
+                yield outlets[yielded_count:]
+                yielded_count = len(outlets)
+            if len(outlets) < max_results:
+                return
+            max_results += page_size
+
+
+    def iter_nearby_stops(
+            self,
+            latitude : float,
+            longitude : float,
+            route_types : list[int] | int = None,
+            max_results : int = None,
+            min_distance : int = 300,
+            max_distance : int = 5000,
+            stop_disruptions : bool = None,
+        ) -> Iterator[list[dict]]:
+        """
+        Yields rings of stops near a location, doubling max_distance from min_distance up to max_distance (in metres).
+        Each ring only has the stops not yielded before, so the nearest stops come first.
+        Endpoint: /v3/stops/location/{latitude},{longitude}
+        """
+        seen_stops = set()
+        distance = min_distance
+        while True:
+            distance = min(distance, max_distance)
+            stops = self.get_nearby_stops(
+                latitude=latitude,
+                longitude=longitude,
+                route_types=route_types,
+                max_results=max_results,
+                max_distance=distance,
+                stop_disruptions=stop_disruptions,
+            )['stops']
+
+            new_stops = []
+            for stop in stops:
+                key = (stop['stop_id'], stop['route_type'])
+                if key not in seen_stops:
+                    seen_stops.add(key)
+                    new_stops.append(stop)
+
+            if len(new_stops) > 0:
+                yield new_stops
+            if distance >= max_distance:
+                return
+            distance *= 2
@@ -0,0 +1,140 @@
+import dataclasses
+import functools
+import json
+import types
+import typing
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+# All JSON decoder backends, in order of preference
+# orjson is the fastest at decoding into dicts, msgspec at decoding into types
+DECODERS = ['orjson', 'msgspec', 'stdlib']
+
+
+def get_available_decoders() -> list[str]:
+    """
+    Returns the JSON decoder backends that can be used in this environment, in order of preference.
+    """
+    available = []
+    if orjson is not None:
+        available.append('orjson')
+    if msgspec is not None:
+        available.append('msgspec')
+    available.append('stdlib')
+    return available
+
+
+def get_default_decoder() -> str:
+    """
+    Returns the preferred JSON decoder backend that is installed.
+    """
+    return get_available_decoders()[0]
+
+
+@functools.cache
+def _get_converter(annotation) -> typing.Callable | None:
+    """
+    Returns a function that converts decoded JSON into the given type annotation, or None if no conversion is needed.
+    """
+    origin = typing.get_origin(annotation)
+
+    if origin is types.UnionType or origin is typing.Union:
+        converters = [_get_converter(arg) for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(converters) != 1 or converters[0] is None:
+            return None
+        converter = converters[0]
+        return lambda value: None if value is None else converter(value)
+
+    if origin is list:
+        converter = _get_converter(typing.get_args(annotation)[0])
+        if converter is None:
+            return None
+        return lambda value: None if value is None else [converter(item) for item in value]
+
+    if origin is dict:
+        converter = _get_converter(typing.get_args(annotation)[1])
+        if converter is None:
+            return None
+        return lambda value: None if value is None else {key: converter(item) for key, item in value.items()}
+
+    if dataclasses.is_dataclass(annotation):
+        return functools.partial(from_dict, annotation)
+
+    return None
+
+
+@functools.cache
+def _get_field_converters(cls : type) -> dict[str, typing.Callable | None]:
+    type_hints = typing.get_type_hints(cls)
+    return {field.name: _get_converter(type_hints[field.name]) for field in dataclasses.fields(cls)}
+
+
+def from_dict(cls : type, data : dict):
+    """
+    Converts decoded JSON into an instance of a `pyptvdata.apiv3.types` dataclass, recursively.
+
+    Keys that are not fields of the dataclass are ignored, so new API fields do not break decoding.
+    """
+    field_converters = _get_field_converters(cls)
+    kwargs = {}
+    for key, value in data.items():
+        if key not in field_converters:
+            continue
+        converter = field_converters[key]
+        kwargs[key] = value if converter is None else converter(value)
+    return cls(**kwargs)
+
+
+def to_dict(value):
+    """
+    Converts a `pyptvdata.apiv3.types` dataclass into JSON-ready dicts and lists, recursively, leaving out None fields.
+    """
+    if dataclasses.is_dataclass(value):
+        return {field.name: to_dict(getattr(value, field.name)) for field in dataclasses.fields(value) if getattr(value, field.name) is not None}
+    if isinstance(value, dict):
+        return {key: to_dict(item) for key, item in value.items() if item is not None}
+    if isinstance(value, (list, tuple)):
+        return [to_dict(item) for item in value]
+    return value
+
+
+@functools.cache
+def _get_msgspec_decoder(response_type : type | None):
+    if response_type is None:
+        return msgspec.json.Decoder()
+    return msgspec.json.Decoder(response_type, strict=False)
+
+
+def decode_json(content : bytes, decoder : str = 'stdlib', response_type : type = None):
+    """
+    Decodes a JSON response body.
+
+    Parameters:
+    - decoder: One of DECODERS. The backend must be installed.
+    - response_type: A `pyptvdata.apiv3.types` dataclass to decode into. If None, returns plain dicts and lists.
+    """
+    assert decoder in DECODERS, f"Decoder must be one of {DECODERS}, got {decoder}"
+
+    if decoder == 'msgspec':
+        assert msgspec is not None, "msgspec is not installed"
+        # msgspec validates and builds the dataclasses in a single pass
+        return _get_msgspec_decoder(response_type).decode(content)
+
+    if decoder == 'orjson':
+        assert orjson is not None, "orjson is not installed"
+        data = orjson.loads(content)
+    else:
+        data = json.loads(content)
+
+    if response_type is None:
+        return data
+    return from_dict(response_type, data)
@@ -0,0 +1,214 @@
+import datetime
+import heapq
+import numpy as np
+import pandas as pd
+
+from .frequency import get_active_trips
+from .geo import get_pairs_within_distance, get_connected_components
+from .unified import get_key_column, get_id_values, get_stop_time_seconds
+
+
+def get_trip_intervals(feed : dict[str, pd.DataFrame], date : str | datetime.date) -> pd.DataFrame:
+    """
+    Returns the trips that run on a service date as intervals, with columns trip, route, start_seconds, end_seconds, first_stop and last_stop,
+    where trip, route and the stops are the feed's key columns, e.g. trip_id, start_seconds is the first departure and end_seconds the last arrival,
+    in seconds since the start of the service day. Trips without times are left out.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], or of `build_unified_feed`.
+    - date: The service date, see `services.get_active_services`.
+    """
+    trips, positions = get_active_trips(feed, date)
+    stop_times = feed['stop_times']
+    trip_key = get_key_column(trips, 'trip')
+    route_key = get_key_column(trips, 'route')
+    stop_key = get_key_column(stop_times, 'stop')
+
+    departure_seconds = get_stop_time_seconds(stop_times, 'departure')
+    arrival_seconds = get_stop_time_seconds(stop_times, 'arrival')
+    rows = np.flatnonzero((positions >= 0) & ((departure_seconds >= 0) | (arrival_seconds >= 0)))
+    rows = rows[np.lexsort((stop_times['stop_sequence'].to_numpy()[rows], positions[rows]))]
+    trip_positions = positions[rows]
+    starts = np.flatnonzero(np.r_[True, trip_positions[1:] != trip_positions[:-1]]) if len(rows) > 0 else np.empty(0, dtype=np.int64)
+    ends = np.r_[starts[1:], len(rows)] - 1
+    first_rows = rows[starts]
+    last_rows = rows[ends]
+    stop_values = np.asarray(stop_times[stop_key])
+
+    return pd.DataFrame({
+        trip_key: np.asarray(trips[trip_key])[trip_positions[starts]],
+        route_key: np.asarray(trips[route_key])[trip_positions[starts]],
+        'start_seconds': np.where(departure_seconds[first_rows] >= 0, departure_seconds[first_rows], arrival_seconds[first_rows]).astype(np.int32),
+        'end_seconds': np.where(arrival_seconds[last_rows] >= 0, arrival_seconds[last_rows], departure_seconds[last_rows]).astype(np.int32),
+        'first_stop': stop_values[first_rows],
+        'last_stop': stop_values[last_rows],
+    })
+
+
+def get_terminal_codes(stops : pd.DataFrame, stop_values : np.ndarray, merge_distance : float) -> np.ndarray:
+    """
+    Returns a terminal code for each of the stop_values, such that stops within merge_distance metres of each other, directly or through other terminal stops,
+    share a code, e.g. the stops on either side of the road at the end of a route. Stops without coordinates are their own terminal.
+
+    Parameters:
+    - stops: The feed's stops, with stop_lat and stop_lon.
+    - stop_values: The feed's stop key values, e.g. stop_id.
+    - merge_distance: In metres. If 0, each stop is its own terminal.
+    """
+    codes, unique_stops = pd.factorize(stop_values, use_na_sentinel=False)
+    if merge_distance <= 0 or len(unique_stops) == 0:
+        return codes
+    stop_key = get_key_column(stops, 'stop')
+    positions = pd.Index(get_id_values(stops, stop_key), dtype=object).get_indexer(np.asarray(unique_stops, dtype=object))
+    lat = np.where(positions >= 0, stops['stop_lat'].to_numpy(dtype=np.float64)[positions], np.nan)
+    lon = np.where(positions >= 0, stops['stop_lon'].to_numpy(dtype=np.float64)[positions], np.nan)
+    i, j, _ = get_pairs_within_distance(lat, lon, merge_distance)
+    return get_connected_components(len(unique_stops), i, j)[codes]
+
+
+def chain_trips(
+        group_codes : np.ndarray,
+        start_seconds : np.ndarray,
+        end_seconds : np.ndarray,
+        first_terminals : np.ndarray,
+        last_terminals : np.ndarray,
+        min_layover : int,
+        max_layover : int,
+    ) -> np.ndarray:
+    """
+    Returns the block of each trip, chaining trips in order of start time: a trip continues the block of the vehicle that has waited longest
+    at its first terminal in the same group, if that vehicle arrived at least min_layover and at most max_layover seconds before, else starts a new block.
+    Vehicles that wait longer than max_layover leave service. Each (group, terminal) keeps a heap of waiting vehicles by arrival time,
+    so chaining n trips takes O(n log n).
+    """
+    order = np.lexsort((end_seconds, start_seconds))
+    blocks = np.empty(len(order), dtype=np.int32)
+    waiting = {}
+    n_blocks = 0
+    for k, group, start, end, first_terminal, last_terminal in zip(
+        order.tolist(),
+        group_codes[order].tolist(),
+        start_seconds[order].tolist(),
+        end_seconds[order].tolist(),
+        first_terminals[order].tolist(),
+        last_terminals[order].tolist(),
+    ):
+        block = -1
+        heap = waiting.get((group, first_terminal))
+        if heap:
+            while heap and start - heap[0][0] > max_layover:
+                heapq.heappop(heap)
+            # The heap's top arrived first, so if it is not ready yet, no vehicle is
+            if heap and start - heap[0][0] >= min_layover:
+                block = heapq.heappop(heap)[1]
+        if block < 0:
+            block = n_blocks
+            n_blocks += 1
+        blocks[k] = block
+        heapq.heappush(waiting.setdefault((group, last_terminal), []), (end, block))
+    return blocks
+
+
+def get_peak_vehicles(blocks : pd.DataFrame, group_column : str = 'group') -> pd.DataFrame:
+    """
+    Returns the peak vehicle requirement of each group of blocks, the most blocks in service at once, with columns
+    group, peak_vehicles, peak_seconds (the first time the peak is reached) and blocks, and a last row for all groups, with group 'all'.
+    A block is in service from its start_seconds to its end_seconds; a block that ends when another starts does not overlap it.
+    """
+    if len(blocks) == 0:
+        return pd.DataFrame({group_column: ['all'], 'peak_vehicles': [0], 'peak_seconds': [-1], 'blocks': [0]})
+    rows = []
+    for groups, all_groups in [(blocks[group_column].to_numpy(), False), (np.zeros(len(blocks), dtype=np.int64), True)]:
+        group_codes, group_values = pd.factorize(groups, use_na_sentinel=False)
+        times = np.r_[blocks['start_seconds'].to_numpy(), blocks['end_seconds'].to_numpy()]
+        deltas = np.r_[np.ones(len(blocks), dtype=np.int64), -np.ones(len(blocks), dtype=np.int64)]
+        event_groups = np.r_[group_codes, group_codes]
+        # Each group's events sum to 0, so one running total over events sorted by group is the count in service of each group
+        order = np.lexsort((deltas, times, event_groups))
+        in_service = pd.Series(np.cumsum(deltas[order]))
+        peaks = in_service.groupby(event_groups[order]).idxmax()
+        rows.append(pd.DataFrame({
+            group_column: ['all'] if all_groups else group_values[peaks.index.to_numpy()],
+            'peak_vehicles': in_service.to_numpy()[peaks.to_numpy()],
+            'peak_seconds': times[order][peaks.to_numpy()],
+            'blocks': np.bincount(group_codes, minlength=len(group_values))[peaks.index.to_numpy()],
+        }))
+    return pd.concat(rows, ignore_index=True)
+
+
+def infer_blocks(
+        feed : dict[str, pd.DataFrame],
+        date : str | datetime.date,
+        route_groups : dict | pd.Series = None,
+        min_layover_minutes : float = 3,
+        max_layover_minutes : float = 60,
+        merge_distance : float = 100,
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Infers vehicle blocks for a service date by chaining trips, for feeds without block_id, and returns a dictionary of pandas DataFrames:
+
+        {
+            'trips': trip, route, group, block_id, start_seconds, end_seconds, first_stop, last_stop, layover_seconds,
+            'blocks': block_id, group, n_trips, start_seconds, end_seconds, service_seconds, layover_seconds,
+            'peak': group, peak_vehicles, peak_seconds, blocks,
+        }
+
+    where trip, route and the stops are the feed's key columns, e.g. trip_id, times are in seconds since the start of the service day,
+    a trip's layover_seconds is the wait before the next trip of its block (-1 for the last trip), and 'peak' is the peak vehicle requirement
+    of each group and of all groups, see `get_peak_vehicles`.
+
+    A trip continues a block if it starts at the terminal where the block's last trip ended, within the layover window, and both are in the
+    same route group, see `chain_trips`. Trips are chained greedily in order of start time, so the result is a plausible lower bound on the fleet
+    for the window, not the operator's schedule: deadheads between terminals are not modelled.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], or of `build_unified_feed`.
+    - date: The service date, see `services.get_active_services`.
+    - route_groups: The group of each route, {route: group}, e.g. the depot or operator, so vehicles can interline between the routes of a group.
+      Routes not in it are their own group. Defaults to each route being its own group.
+    - min_layover_minutes, max_layover_minutes: The layover window between consecutive trips of a block.
+    - merge_distance: Terminal stops within this many metres of each other are the same terminal, see `get_terminal_codes`.
+    """
+    assert 0 <= min_layover_minutes <= max_layover_minutes, f"Layover window must satisfy 0 <= min <= max, got {min_layover_minutes} and {max_layover_minutes}"
+    intervals = get_trip_intervals(feed, date)
+    trip_key, route_key = intervals.columns[:2]
+
+    routes = intervals[route_key].to_numpy()
+    if route_groups is None:
+        groups = routes
+    else:
+        groups = pd.Series(routes).map(pd.Series(route_groups)).to_numpy(dtype=object)
+        groups = np.where(pd.isna(groups), routes, groups)
+    group_codes = pd.factorize(groups, use_na_sentinel=False)[0]
+
+    terminals = get_terminal_codes(feed['stops'], np.r_[intervals['first_stop'].to_numpy(), intervals['last_stop'].to_numpy()], merge_distance)
+    start_seconds = intervals['start_seconds'].to_numpy()
+    end_seconds = intervals['end_seconds'].to_numpy()
+    block_ids = chain_trips(
+        group_codes, start_seconds, end_seconds, terminals[:len(intervals)], terminals[len(intervals):],
+        int(min_layover_minutes * 60), int(max_layover_minutes * 60),
+    )
+
+    # Blocks are numbered in order of their first trip's start, as chain_trips starts them in that order
+    order = np.lexsort((start_seconds, block_ids))
+    trips = intervals.iloc[order].reset_index(drop=True)
+    trips.insert(2, 'group', groups[order])
+    trips.insert(3, 'block_id', block_ids[order])
+    sorted_blocks = block_ids[order]
+    same_block = np.r_[sorted_blocks[1:] == sorted_blocks[:-1], False] if len(order) > 0 else np.empty(0, dtype=bool)
+    trips['layover_seconds'] = np.where(same_block, np.r_[start_seconds[order][1:], 0] - end_seconds[order], -1).astype(np.int32)
+
+    block_table = trips.groupby('block_id', sort=True).agg(
+        group=('group', 'first'),
+        n_trips=('block_id', 'size'),
+        start_seconds=('start_seconds', 'min'),
+        end_seconds=('end_seconds', 'max'),
+    ).reset_index()
+    block_table['service_seconds'] = np.bincount(sorted_blocks, weights=(end_seconds - start_seconds)[order], minlength=len(block_table)).astype(np.int64)
+    block_table['layover_seconds'] = np.bincount(sorted_blocks, weights=np.maximum(trips['layover_seconds'].to_numpy(), 0), minlength=len(block_table)).astype(np.int64)
+
+    return {
+        'trips': trips,
+        'blocks': block_table,
+        'peak': get_peak_vehicles(block_table),
+    }
@@ -0,0 +1,282 @@
+import datetime
+import numpy as np
+import pandas as pd
+
+from .patterns import build_trip_patterns
+from .segments import DAY_TYPES, get_day_type
+from .services import get_active_services, to_gtfs_date
+from .unified import get_id_values, get_stop_time_seconds
+
+
+def get_representative_dates(feed : dict[str, pd.DataFrame], weeks : int = 4) -> dict[str, str]:
+    """
+    Returns a service date for each day type of a feed, {day_type: date}: the date of that day type with the most trips
+    in the first weeks of the feed's calendar, so public holidays and other reduced days are passed over. Day types without trips are left out.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id].
+    - weeks: The number of weeks from the start of the calendar to search.
+    """
+    bounds = []
+    for table_name, columns in [('calendar', ['start_date', 'end_date']), ('calendar_dates', ['date'])]:
+        table = feed.get(table_name)
+        if table is not None and len(table) > 0:
+            for column in columns:
+                bounds.extend([table[column].astype(str).min(), table[column].astype(str).max()])
+    if not bounds:
+        return {}
+
+    start = datetime.datetime.strptime(min(bounds), '%Y%m%d').date()
+    end = min(datetime.datetime.strptime(max(bounds), '%Y%m%d').date(), start + datetime.timedelta(days=weeks * 7 - 1))
+    service_trips = pd.Series(get_id_values(feed['trips'], 'service_id')).value_counts()
+
+    best = {}
+    for offset in range((end - start).days + 1):
+        date = to_gtfs_date(start + datetime.timedelta(days=offset))
+        n_trips = int(service_trips.reindex(get_active_services(feed, date)).fillna(0).sum())
+        day_type = get_day_type(date)
+        if n_trips > 0 and n_trips > best.get(day_type, ('', 0))[1]:
+            best[day_type] = (date, n_trips)
+    return {day_type: best[day_type][0] for day_type in DAY_TYPES if day_type in best}
+
+
+def get_pattern_hashes(pattern_stops : pd.DataFrame, stop_key : str = 'stop_id') -> np.ndarray:
+    """
+    Returns a 64-bit hash of the stop sequence of each pattern of `build_trip_patterns`, indexed by pattern_id,
+    which depends only on the stop IDs in order, so the same pattern has the same hash in two versions of a feed.
+    """
+    pattern_ids = pattern_stops['pattern_id'].to_numpy()
+    n_patterns = int(pattern_ids.max()) + 1 if len(pattern_ids) > 0 else 0
+    # Hash each stop's hash together with its position, so the sum by pattern depends on the order; uint64 sums wrap around
+    stop_hashes = pd.util.hash_array(np.asarray(pattern_stops[stop_key]).astype(str).astype(object))
+    position_hashes = pd.util.hash_array(pattern_stops['position'].to_numpy().astype(np.uint64))
+    mixed = pd.util.hash_array(stop_hashes ^ position_hashes)
+    hashes = np.zeros(n_patterns, dtype=np.uint64)
+    if len(mixed) > 0:
+        starts = np.flatnonzero(np.r_[True, pattern_ids[1:] != pattern_ids[:-1]])
+        hashes[pattern_ids[starts]] = np.add.reduceat(mixed, starts)
+    return hashes
+
+
+def summarize_feed(feed : dict[str, pd.DataFrame], dates : dict[str, str], patterns : dict[str, pd.DataFrame] = None) -> dict[str, pd.DataFrame]:
+    """
+    Returns the service of a feed on each day type's date, as a dictionary of pandas DataFrames:
+
+        {
+            'routes': route_id, day_type, trips, first_departure_seconds, last_departure_seconds,
+            'stops': stop_id, day_type, departures,
+            'patterns': route_id, direction_id, pattern_hash, n_stops, first_stop_id, last_stop_id, trips,
+        }
+
+    where first and last departures are the earliest and latest first departures of the route's trips (-1 if none),
+    and a pattern's trips are all its trips in the feed. See `compare_feeds`.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id].
+    - dates: {day_type: date}, see `get_representative_dates`.
+    - patterns: The output of `build_trip_patterns`, if already built.
+    """
+    if patterns is None:
+        patterns = build_trip_patterns(feed)
+    trips = feed['trips']
+    stop_times = feed['stop_times']
+    trip_index = pd.Index(get_id_values(trips, 'trip_id'), dtype=object)
+    trip_services = get_id_values(trips, 'service_id')
+
+    # The first departure of each trip, and the trip of each stop_times row
+    positions = trip_index.get_indexer(get_id_values(stop_times, 'trip_id'))
+    seconds = get_stop_time_seconds(stop_times, 'departure')
+    rows = np.flatnonzero((positions >= 0) & (seconds >= 0))
+    first_seconds = np.full(len(trips), np.iinfo(np.int32).max, dtype=np.int32)
+    np.minimum.at(first_seconds, positions[rows], seconds[rows])
+
+    route_codes, route_values = pd.factorize(get_id_values(trips, 'route_id'), use_na_sentinel=False)
+    stop_codes, stop_values = pd.factorize(get_id_values(stop_times, 'stop_id')[rows], use_na_sentinel=False)
+
+    routes = []
+    stops = []
+    for day_type, date in dates.items():
+        active = np.isin(trip_services, get_active_services(feed, date))
+        active_trips = np.flatnonzero(active & (first_seconds < np.iinfo(np.int32).max))
+        first = np.full(len(route_values), np.iinfo(np.int32).max, dtype=np.int32)
+        last = np.full(len(route_values), -1, dtype=np.int32)
+        np.minimum.at(first, route_codes[active_trips], first_seconds[active_trips])
+        np.maximum.at(last, route_codes[active_trips], first_seconds[active_trips])
+        routes.append(pd.DataFrame({
+            'route_id': route_values,
+            'day_type': day_type,
+            'trips': np.bincount(route_codes[active_trips], minlength=len(route_values)),
+            'first_departure_seconds': np.where(last >= 0, first, -1),
+            'last_departure_seconds': last,
+        }))
+        stops.append(pd.DataFrame({
+            'stop_id': stop_values,
+            'day_type': day_type,
+            'departures': np.bincount(stop_codes[active[positions[rows]]], minlength=len(stop_values)),
+        }))
+
+    pattern_stops = patterns['pattern_stops']
+    pattern_table = patterns['patterns']
+    pattern_ids = pattern_stops['pattern_id'].to_numpy()
+    is_first = np.r_[True, pattern_ids[1:] != pattern_ids[:-1]] if len(pattern_ids) > 0 else np.empty(0, dtype=bool)
+    is_last = np.r_[pattern_ids[1:] != pattern_ids[:-1], True] if len(pattern_ids) > 0 else np.empty(0, dtype=bool)
+    stop_ids = np.asarray(pattern_stops['stop_id'])
+
+    def make_empty(columns : list[str]) -> pd.DataFrame:
+        return pd.DataFrame({column: pd.Series(dtype=object) for column in columns})
+
+    return {
+        'routes': pd.concat(routes, ignore_index=True) if routes else make_empty(['route_id', 'day_type', 'trips', 'first_departure_seconds', 'last_departure_seconds']),
+        'stops': pd.concat(stops, ignore_index=True) if stops else make_empty(['stop_id', 'day_type', 'departures']),
+        'patterns': pd.DataFrame({
+            'route_id': np.asarray(pattern_table['route_id']),
+            'direction_id': np.asarray(pattern_table['direction_id']).astype(str),
+            'pattern_hash': get_pattern_hashes(pattern_stops),
+            'n_stops': pattern_table['n_stops'].to_numpy(),
+            'first_stop_id': stop_ids[is_first],
+            'last_stop_id': stop_ids[is_last],
+            'trips': pattern_table['n_trips'].to_numpy(),
+        }),
+    }
+
+
+def merge_versions(old : pd.DataFrame, new : pd.DataFrame, keys : list[str], columns : list[str]) -> pd.DataFrame:
+    """
+    Returns an outer join of the old and new versions of a table on keys, with the columns prefixed old_ and new_.
+    Rows missing from a version have 0 counts and -1 seconds.
+    """
+    merged = pd.merge(
+        old[keys + columns].rename(columns={column: f'old_{column}' for column in columns}),
+        new[keys + columns].rename(columns={column: f'new_{column}' for column in columns}),
+        on=keys, how='outer', sort=True,
+    )
+    for column in columns:
+        fill = -1 if column.endswith('_seconds') else 0
+        for prefix in ['old', 'new']:
+            merged[f'{prefix}_{column}'] = merged[f'{prefix}_{column}'].fillna(fill).astype(np.int64)
+    return merged
+
+
+def get_change_status(old_counts : np.ndarray, new_counts : np.ndarray, changed : np.ndarray) -> pd.Categorical:
+    """
+    Returns 'added' where only the new version has service, 'removed' where only the old one has, else 'changed' or 'unchanged'.
+    """
+    status = np.select(
+        [(old_counts == 0) & (new_counts > 0), (old_counts > 0) & (new_counts == 0), changed],
+        [0, 1, 2], 3,
+    )
+    return pd.Categorical.from_codes(status, categories=['added', 'removed', 'changed', 'unchanged'])
+
+
+def compare_mode_feeds(
+        old_feed : dict[str, pd.DataFrame],
+        new_feed : dict[str, pd.DataFrame],
+        old_dates : dict[str, str] = None,
+        new_dates : dict[str, str] = None,
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Compares two versions of the feed of one mode, and returns a dictionary of pandas DataFrames, see `compare_feeds`.
+
+    Parameters:
+    - old_feed, new_feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], of each version.
+    - old_dates, new_dates: {day_type: date} of each version. Default to `get_representative_dates`.
+    """
+    old_dates = get_representative_dates(old_feed) if old_dates is None else {day_type: to_gtfs_date(date) for day_type, date in old_dates.items()}
+    new_dates = get_representative_dates(new_feed) if new_dates is None else {day_type: to_gtfs_date(date) for day_type, date in new_dates.items()}
+    day_types = [day_type for day_type in DAY_TYPES if day_type in old_dates or day_type in new_dates]
+    day_types += [day_type for day_type in {**old_dates, **new_dates} if day_type not in day_types]
+    old = summarize_feed(old_feed, {day_type: old_dates[day_type] for day_type in day_types if day_type in old_dates})
+    new = summarize_feed(new_feed, {day_type: new_dates[day_type] for day_type in day_types if day_type in new_dates})
+
+    patterns = merge_versions(old['patterns'], new['patterns'], ['route_id', 'direction_id', 'pattern_hash'], ['trips'])
+    pattern_info = pd.concat([new['patterns'], old['patterns']]).drop_duplicates(['route_id', 'direction_id', 'pattern_hash'])
+    patterns = patterns.merge(pattern_info[['route_id', 'direction_id', 'pattern_hash', 'n_stops', 'first_stop_id', 'last_stop_id']], on=['route_id', 'direction_id', 'pattern_hash'], how='left')
+    patterns['status'] = get_change_status(patterns['old_trips'].to_numpy(), patterns['new_trips'].to_numpy(), patterns['old_trips'].to_numpy() != patterns['new_trips'].to_numpy())
+
+    route_patterns = pd.DataFrame({
+        'patterns_added': (patterns['status'] == 'added').groupby(patterns['route_id']).sum(),
+        'patterns_removed': (patterns['status'] == 'removed').groupby(patterns['route_id']).sum(),
+    })
+    routes = merge_versions(old['routes'], new['routes'], ['route_id', 'day_type'], ['trips', 'first_departure_seconds', 'last_departure_seconds'])
+    routes = routes[(routes['old_trips'] > 0) | (routes['new_trips'] > 0)].reset_index(drop=True)
+    routes = routes.join(route_patterns, on='route_id')
+    for column in ['patterns_added', 'patterns_removed']:
+        routes[column] = routes[column].fillna(0).astype(np.int64)
+    routes['trip_change'] = routes['new_trips'] - routes['old_trips']
+    changed = (
+        (routes['trip_change'] != 0)
+        | (routes['old_first_departure_seconds'] != routes['new_first_departure_seconds'])
+        | (routes['old_last_departure_seconds'] != routes['new_last_departure_seconds'])
+        | (routes['patterns_added'] > 0) | (routes['patterns_removed'] > 0)
+    ).to_numpy()
+    routes['status'] = get_change_status(routes['old_trips'].to_numpy(), routes['new_trips'].to_numpy(), changed)
+
+    stops = merge_versions(old['stops'], new['stops'], ['stop_id', 'day_type'], ['departures'])
+    stops = stops[(stops['old_departures'] > 0) | (stops['new_departures'] > 0)].reset_index(drop=True)
+    stops['departure_change'] = stops['new_departures'] - stops['old_departures']
+    stops['status'] = get_change_status(stops['old_departures'].to_numpy(), stops['new_departures'].to_numpy(), (stops['departure_change'] != 0).to_numpy())
+
+    summary = pd.DataFrame({
+        'day_type': day_types,
+        'old_date': [old_dates.get(day_type) for day_type in day_types],
+        'new_date': [new_dates.get(day_type) for day_type in day_types],
+    })
+    for name, table, count_column in [('routes', routes, 'trips'), ('stops', stops, 'departures')]:
+        counts = pd.crosstab(table['day_type'], table['status'], dropna=False).reindex(index=day_types, columns=table['status'].cat.categories, fill_value=0)
+        for status in counts.columns:
+            summary[f'{name}_{status}'] = counts[status].to_numpy()
+        if name == 'routes':
+            totals = table.groupby('day_type')[[f'old_{count_column}', f'new_{count_column}']].sum().reindex(day_types, fill_value=0)
+            summary['old_trips'] = totals['old_trips'].to_numpy()
+            summary['new_trips'] = totals['new_trips'].to_numpy()
+
+    return {
+        'summary': summary,
+        'routes': routes,
+        'patterns': patterns,
+        'stops': stops,
+    }
+
+
+def compare_feeds(
+        old_DFK : dict[str, dict[str, pd.DataFrame]],
+        new_DFK : dict[str, dict[str, pd.DataFrame]],
+        modes : list[str] = None,
+        old_dates : dict[str, str] = None,
+        new_dates : dict[str, str] = None,
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Compares two versions of the GTFS feed, e.g. before and after a timetable change, and returns a dictionary of pandas DataFrames,
+    each with a mode_id column:
+
+        {
+            'summary': mode_id, day_type, old_date, new_date, routes_added, routes_removed, routes_changed, routes_unchanged, old_trips, new_trips,
+                       stops_added, stops_removed, stops_changed, stops_unchanged,
+            'routes': mode_id, route_id, day_type, old_trips, new_trips, old_first_departure_seconds, new_first_departure_seconds,
+                      old_last_departure_seconds, new_last_departure_seconds, patterns_added, patterns_removed, trip_change, status,
+            'patterns': mode_id, route_id, direction_id, pattern_hash, old_trips, new_trips, n_stops, first_stop_id, last_stop_id, status,
+            'stops': mode_id, stop_id, day_type, old_departures, new_departures, departure_change, status,
+        }
+
+    Each version is summarised once per mode, on one date of each day type, weekday, saturday and sunday, and the versions are compared by outer joins
+    on IDs. A route's status is 'changed' if its trips, first or last departures or stop patterns differ; patterns are matched by
+    the hash of their stop sequence, see `get_pattern_hashes`, so a pattern in both versions is 'changed' if its number of trips differs,
+    else 'unchanged', and a pattern in only one version is 'added' or 'removed'.
+    Departure times are in seconds since the start of the service day, -1 if there are none.
+
+    Parameters:
+    - old_DFK, new_DFK: The output of `read_gtfs_zip` for each version, with at least trips, stop_times and calendar or calendar_dates.
+    - modes: The mode_ids to compare. Defaults to the modes in both versions.
+    - old_dates, new_dates: {day_type: date} of each version, for every mode. Default to `get_representative_dates` of each mode.
+    """
+    if modes is None:
+        modes = [mode_id for mode_id in old_DFK if mode_id in new_DFK]
+    for mode_id in modes:
+        assert mode_id in old_DFK and mode_id in new_DFK, f"Mode {mode_id} is not in both versions of the feed"
+
+    results = {}
+    for mode_id in modes:
+        for name, table in compare_mode_feeds(old_DFK[mode_id], new_DFK[mode_id], old_dates, new_dates).items():
+            table.insert(0, 'mode_id', mode_id)
+            results.setdefault(name, []).append(table)
+    return {name: pd.concat(tables, ignore_index=True) for name, tables in results.items()}
@@ -85,6 +85,18 @@ GTFS_FILE_FIELDS_TYPES = {
     'shapes': {'shape_id': str, 'shape_pt_lat': np.float64, 'shape_pt_lon': np.float64, 'shape_pt_sequence': int, 'shape_dist_traveled': np.float64},
 }
 
+# Columns that uniquely identify a row of each GTFS table
+GTFS_PRIMARY_KEYS = {
+    'agency': ['agency_id'],
+    'calendar': ['service_id'],
+    'calendar_dates': ['service_id', 'date'],
+    'routes': ['route_id'],
+    'trips': ['trip_id'],
+    'stops': ['stop_id'],
+    'stop_times': ['trip_id', 'stop_sequence'],
+    'shapes': ['shape_id', 'shape_pt_sequence'],
+}
+
 # GTFS File Fields
 # agency.txt 
 # agency_id, agency_name, agency_url, agency_timezone, agency_lang
@@ -0,0 +1,357 @@
+import datetime
+import threading
+import time
+import zoneinfo
+import numpy as np
+import pandas as pd
+
+from .frequency import get_active_trips
+from .segments import get_feed_timezone, get_service_day_starts, get_update_trip_codes
+from .services import to_gtfs_date
+from .unified import get_key_column, get_id_values, get_stop_time_seconds
+
+
+def get_propagated_delays(
+        row_trips : np.ndarray,
+        row_sequences : np.ndarray,
+        update_trips : np.ndarray,
+        update_sequences : np.ndarray,
+        update_delays : np.ndarray,
+    ) -> np.ndarray:
+    """
+    Returns the delay of each row, as GTFS-R propagates it: the delay of the trip's update at the same or the closest earlier stop_sequence,
+    NaN if the trip has no update at or before the row. Rows and updates are given as trip codes and stop_sequence.
+    """
+    valid = (update_trips >= 0) & ~np.isnan(update_delays)
+    update_trips = update_trips[valid].astype(np.int64)
+    update_sequences = update_sequences[valid].astype(np.int64)
+    update_delays = update_delays[valid]
+    delays = np.full(len(row_trips), np.nan)
+    if len(update_trips) == 0 or len(row_trips) == 0:
+        return delays
+
+    # Pack (trip, stop_sequence) into one int64 key, so the latest update at or before each row is one searchsorted
+    multiplier = int(max(row_sequences.max(), update_sequences.max())) + 1
+    update_keys = update_trips * multiplier + update_sequences
+    order = np.argsort(update_keys, kind='stable')
+    update_keys = update_keys[order]
+    positions = np.searchsorted(update_keys, row_trips.astype(np.int64) * multiplier + row_sequences, side='right') - 1
+    found = positions >= 0
+    found[found] = update_trips[order][positions[found]] == row_trips[found]
+    delays[found] = update_delays[order][positions[found]]
+    return delays
+
+
+class DepartureBoard:
+    def __init__(
+            self,
+            feed : dict[str, pd.DataFrame],
+            timezone : str = None,
+            lookahead_days : int = 0,
+        ):
+        """
+        A departure board over the static timetable: the next departures at a stop, optionally by route and direction, with GTFS-R delays if given.
+
+        The departures of each service date are kept as arrays sorted by stop then time, and again by stop, route then time,
+        with the row range of each stop and of each (stop, route) in dictionaries, so a query is two dictionary lookups,
+        a binary search and a few slices of a handful of rows, with no upstream calls.
+        Queries always use the previous and current service dates of the query time, so the board rolls over at the GTFS service day boundary
+        by itself, and just after midnight the trips of the previous service date that run past 24:00:00 are still included.
+        A service date is built on its first query; call `roll_over` shortly before midnight, e.g. from a timer, to build the next one beforehand and drop old dates.
+
+        Parameters:
+        - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], or of `build_unified_feed`.
+        - timezone: The timezone of the service day. Defaults to the feed's agency_timezone, see `segments.get_feed_timezone`.
+        - lookahead_days: Also keep the departures of this many following service dates, for queries far ahead.
+        """
+        self.feed = feed
+        self.timezone = timezone if timezone is not None else get_feed_timezone(feed)
+        self.zoneinfo = zoneinfo.ZoneInfo(self.timezone)
+        self.lookahead_days = lookahead_days
+
+        trips = feed['trips']
+        stops = feed['stops']
+        self.trip_key = get_key_column(trips, 'trip')
+        self.route_key = get_key_column(trips, 'route')
+        self.stop_key = get_key_column(stops, 'stop')
+        self.trip_index = pd.Index(get_id_values(trips, self.trip_key), dtype=object)
+        self.trip_values = np.asarray(trips[self.trip_key]).tolist()
+        self.route_codes, route_values = pd.factorize(get_id_values(trips, self.route_key), use_na_sentinel=False)
+        self.route_values = list(route_values)
+        self.route_lookup = {route: code for code, route in enumerate(self.route_values)}
+        self.direction_ids = np.asarray(pd.to_numeric(trips['direction_id'], errors='coerce').fillna(-1), dtype=np.int8) if 'direction_id' in trips.columns else np.full(len(trips), -1, dtype=np.int8)
+        self.headsigns = trips['trip_headsign'].astype(object).where(trips['trip_headsign'].notna(), None).tolist() if 'trip_headsign' in trips.columns else [None] * len(trips)
+        stop_values = get_id_values(stops, self.stop_key)
+        self.stop_values = list(stop_values)
+        self.stop_lookup = {stop: code for code, stop in enumerate(self.stop_values)}
+        self.stop_index = pd.Index(stop_values, dtype=object)
+
+        self.boards : dict[str, dict] = {}
+        self.updates : pd.DataFrame = None
+        self.updates_date : str = None
+        self._lock = threading.Lock()
+        self._service_dates = (0.0, 0.0, [])
+
+    def get_service_dates(self, now : float) -> list[str]:
+        """
+        Returns the service dates whose departures can be at or after Unix time now: the previous, current and lookahead service dates.
+        """
+        start, end, dates = self._service_dates
+        if start <= now < end:
+            return dates
+        today = datetime.datetime.fromtimestamp(now, self.zoneinfo).date()
+        dates = [to_gtfs_date(today + datetime.timedelta(days=offset)) for offset in range(-1, self.lookahead_days + 1)]
+        # The dates stay the same until the next local midnight
+        midnight = datetime.datetime.combine(today, datetime.time(), self.zoneinfo)
+        next_midnight = datetime.datetime.combine(today + datetime.timedelta(days=1), datetime.time(), self.zoneinfo)
+        self._service_dates = (midnight.timestamp(), next_midnight.timestamp(), dates)
+        return dates
+
+    def get_board(self, date : str | datetime.date) -> dict:
+        """
+        Returns the departure arrays of a service date, building them if needed, as a dictionary:
+        day_start (Unix time), seconds, trips, sequences, stop_ranges {stop code: (start, end)}, route_rows, route_seconds,
+        route_ranges {(stop code, route code): (start, end)}, delays (NaN without realtime), estimated (seconds plus delays), max_delay and min_delay.
+
+        Departures are the stop_times rows of the date's trips with a departure time, except the last stop of each trip
+        and stops with pickup_type 1 (no pickup).
+        """
+        date = to_gtfs_date(date)
+        board = self.boards.get(date)
+        if board is not None:
+            return board
+        with self._lock:
+            board = self.boards.get(date)
+            if board is None:
+                board = self.build_board(date)
+                self.boards[date] = board
+        return board
+
+    def build_board(self, date : str) -> dict:
+        trips, positions = get_active_trips(self.feed, date)
+        stop_times = self.feed['stop_times']
+        active_codes = self.trip_index.get_indexer(get_id_values(trips, self.trip_key))
+        trip_codes = np.where(positions >= 0, active_codes[np.maximum(positions, 0)], -1) if len(trips) > 0 else np.full(len(stop_times), -1)
+        seconds = get_stop_time_seconds(stop_times, 'departure')
+        sequences = stop_times['stop_sequence'].to_numpy(dtype=np.int64)
+
+        # Leave out the last stop of each trip, where nobody departs, and stops with no pickup
+        rows = np.flatnonzero(trip_codes >= 0)
+        rows = rows[np.lexsort((sequences[rows], trip_codes[rows]))]
+        is_last = np.r_[trip_codes[rows][1:] != trip_codes[rows][:-1], True] if len(rows) > 0 else np.empty(0, dtype=bool)
+        rows = rows[~is_last]
+        if 'pickup_type' in stop_times.columns:
+            pickup_type = pd.to_numeric(stop_times['pickup_type'], errors='coerce').to_numpy()[rows]
+            rows = rows[pickup_type != 1]
+        rows = rows[seconds[rows] >= 0]
+
+        stop_codes = self.stop_index.get_indexer(get_id_values(stop_times, get_key_column(stop_times, 'stop'))[rows])
+        rows = rows[stop_codes >= 0]
+        stop_codes = stop_codes[stop_codes >= 0]
+        order = np.lexsort((seconds[rows], stop_codes))
+        rows = rows[order]
+        stop_codes = stop_codes[order]
+        board_trips = trip_codes[rows].astype(np.int32)
+        starts = np.flatnonzero(np.r_[True, stop_codes[1:] != stop_codes[:-1]]) if len(rows) > 0 else np.empty(0, dtype=np.int64)
+        ends = np.r_[starts[1:], len(rows)]
+
+        # The same departures by (stop, route), as positions into the arrays by stop
+        route_codes = self.route_codes[board_trips]
+        route_rows = np.lexsort((seconds[rows], route_codes, stop_codes))
+        route_groups = stop_codes[route_rows].astype(np.int64) * (len(self.route_values) + 1) + route_codes[route_rows]
+        route_starts = np.flatnonzero(np.r_[True, route_groups[1:] != route_groups[:-1]]) if len(rows) > 0 else np.empty(0, dtype=np.int64)
+        route_ends = np.r_[route_starts[1:], len(rows)]
+
+        board = {
+            'date': date,
+            'day_start': int(get_service_day_starts(np.array([date]), self.timezone)[0]),
+            'seconds': seconds[rows].astype(np.int32),
+            'trips': board_trips,
+            'sequences': sequences[rows],
+            'stop_ranges': dict(zip(stop_codes[starts].tolist(), zip(starts.tolist(), ends.tolist()))),
+            'route_rows': route_rows,
+            'route_seconds': seconds[rows][route_rows].astype(np.int32),
+            'route_ranges': dict(zip(
+                zip(stop_codes[route_rows][route_starts].tolist(), route_codes[route_rows][route_starts].tolist()),
+                zip(route_starts.tolist(), route_ends.tolist()),
+            )),
+            'delays': np.full(len(rows), np.nan),
+            'estimated': seconds[rows].astype(np.float64),
+            'max_delay': 0,
+            'min_delay': 0,
+        }
+        if self.updates is not None:
+            board.update(self.get_delays(board))
+        return board
+
+    def get_delays(self, board : dict) -> dict:
+        """
+        Returns the delays, estimated, max_delay and min_delay of a board's departures from the current GTFS-R updates, see `apply_trip_updates`.
+        """
+        updates = self.updates
+        update_dates = updates['start_date'].astype(str).replace('', self.updates_date).to_numpy()
+        updates = updates[update_dates == board['date']]
+        update_trips = get_update_trip_codes(self.feed, updates, self.trip_index)
+        update_sequences = updates['stop_sequence'].to_numpy(dtype=np.int64)
+
+        delays = updates['departure_delay'].to_numpy(dtype=np.float64) if 'departure_delay' in updates.columns else np.full(len(updates), np.nan)
+        if 'arrival_delay' in updates.columns:
+            delays = np.where(np.isnan(delays), updates['arrival_delay'].to_numpy(dtype=np.float64), delays)
+        if 'departure_time' in updates.columns and np.isnan(delays).any():
+            # Updates with only a time give a delay against the scheduled departure of the same trip and stop_sequence
+            scheduled = np.full(len(updates), np.nan)
+            key_order = np.lexsort((board['sequences'], board['trips']))
+            row_keys = board['trips'][key_order].astype(np.int64) * (1 << 32) + board['sequences'][key_order]
+            update_keys = update_trips.astype(np.int64) * (1 << 32) + update_sequences
+            positions = np.minimum(np.searchsorted(row_keys, update_keys), max(len(row_keys) - 1, 0))
+            matched = (update_trips >= 0) & (len(row_keys) > 0)
+            matched[matched] = row_keys[positions[matched]] == update_keys[matched]
+            scheduled[matched] = board['seconds'][key_order][positions[matched]]
+            delays = np.where(np.isnan(delays), updates['departure_time'].to_numpy(dtype=np.float64) - board['day_start'] - scheduled, delays)
+
+        board_delays = get_propagated_delays(board['trips'], board['sequences'], update_trips, update_sequences, delays)
+        has_delays = not np.isnan(board_delays).all()
+        return {
+            'delays': board_delays,
+            'estimated': board['seconds'] + np.nan_to_num(board_delays),
+            'max_delay': int(max(np.nanmax(board_delays), 0)) if has_delays else 0,
+            'min_delay': int(min(np.nanmin(board_delays), 0)) if has_delays else 0,
+        }
+
+    def apply_trip_updates(self, updates : pd.DataFrame, now : float = None):
+        """
+        Applies a snapshot of GTFS-R stop time updates to the board, replacing the previous ones. Each departure takes the delay of its trip's update
+        at the same or the closest earlier stop, as GTFS-R propagates delays; departures of trips without updates stay on schedule.
+
+        Parameters:
+        - updates: The output of `gtfsr.get_stop_time_updates`. Updates without a start_date are for the service date of now.
+        - now: The Unix time of the snapshot. Defaults to the current time.
+        """
+        now = time.time() if now is None else now
+        self.updates = updates
+        self.updates_date = to_gtfs_date(datetime.datetime.fromtimestamp(now, self.zoneinfo).date())
+        # Boards are replaced rather than changed, so concurrent queries see either the old or the new delays
+        with self._lock:
+            for date, board in list(self.boards.items()):
+                self.boards[date] = {**board, **self.get_delays(board)}
+
+    def clear_trip_updates(self):
+        """
+        Removes the GTFS-R updates, so departures are on schedule again.
+        """
+        self.updates = None
+        with self._lock:
+            for date, board in list(self.boards.items()):
+                self.boards[date] = {
+                    **board,
+                    'delays': np.full(len(board['seconds']), np.nan),
+                    'estimated': board['seconds'].astype(np.float64),
+                    'max_delay': 0,
+                    'min_delay': 0,
+                }
+
+    def roll_over(self, now : float = None):
+        """
+        Builds the boards of the service dates of now and of the service date after them, and drops the older ones,
+        so that called shortly before midnight, the first query after midnight does not have to build a board.
+        """
+        now = time.time() if now is None else now
+        today = datetime.datetime.fromtimestamp(now, self.zoneinfo).date()
+        dates = [*self.get_service_dates(now), to_gtfs_date(today + datetime.timedelta(days=self.lookahead_days + 1))]
+        for date in dates:
+            self.get_board(date)
+        with self._lock:
+            for date in list(self.boards):
+                if date not in dates:
+                    del self.boards[date]
+
+    def get_next_departures(
+            self,
+            stop,
+            n : int = 5,
+            now : float | datetime.datetime = None,
+            route = None,
+            direction_id : int = None,
+            realtime : bool = True,
+        ) -> list[dict]:
+        """
+        Returns the next n departures at a stop, at or after now by their estimated time, as a list of dictionaries sorted by that time:
+
+            {'stop', 'route', 'direction_id', 'trip', 'trip_headsign', 'service_date', 'scheduled_departure', 'estimated_departure', 'delay_seconds'}
+
+        where stop, route and trip are the feed's key values, e.g. stop_id, departures are in Unix time,
+        and estimated_departure and delay_seconds are None for departures without realtime.
+
+        Parameters:
+        - stop: The stop key value, e.g. stop_id, or stop_index for `build_unified_feed` output.
+        - n: The number of departures.
+        - now: Unix time or a timezone-aware datetime. Defaults to the current time.
+        - route: Only departures of this route key value, e.g. route_id.
+        - direction_id: Only departures in this direction.
+        - realtime: If True, uses the delays of `apply_trip_updates`.
+        """
+        if now is None:
+            now = time.time()
+        elif isinstance(now, datetime.datetime):
+            now = now.timestamp()
+        stop_code = self.stop_lookup.get(stop)
+        assert stop_code is not None, f"Stop {stop} is not in the feed"
+        route_code = None
+        if route is not None:
+            route_code = self.route_lookup.get(route)
+            if route_code is None:
+                return []
+
+        departures = []
+        for date in self.get_service_dates(now):
+            board = self.get_board(date)
+            if route_code is None:
+                start, end = board['stop_ranges'].get(stop_code, (0, 0))
+                seconds = board['seconds']
+                rows = None
+            else:
+                start, end = board['route_ranges'].get((stop_code, route_code), (0, 0))
+                seconds = board['route_seconds']
+                rows = board['route_rows']
+            if start == end:
+                continue
+
+            # Delayed departures scheduled up to max_delay before now can still be ahead, and early ones up to min_delay after the n-th
+            max_delay, min_delay = (board['max_delay'], board['min_delay']) if realtime else (0, 0)
+            estimated = board['estimated'] if realtime else board['seconds']
+            now_seconds = now - board['day_start']
+            position = start + int(seconds[start:end].searchsorted(now_seconds - max_delay))
+            window = n
+            estimates = []
+            while position < end:
+                window_end = min(position + window, end)
+                stop_rows = np.arange(position, window_end) if route_code is None else board['route_rows'][position:window_end]
+                keep = estimated[stop_rows] >= now_seconds
+                if direction_id is not None:
+                    keep &= self.direction_ids[board['trips'][stop_rows]] == direction_id
+                for row in stop_rows[keep].tolist():
+                    estimates.append(estimated[row])
+                    departures.append((estimated[row] + board['day_start'], board, row))
+                if len(estimates) >= n and seconds[window_end - 1] + min_delay >= sorted(estimates)[n - 1]:
+                    break
+                position = window_end
+                window *= 2
+
+        departures.sort(key=lambda departure: departure[0])
+        results = []
+        for estimated, board, row in departures[:n]:
+            trip_code = int(board['trips'][row])
+            delay = float(board['delays'][row]) if realtime else np.nan
+            has_delay = delay == delay
+            results.append({
+                'stop': stop,
+                'route': self.route_values[self.route_codes[trip_code]],
+                'direction_id': int(self.direction_ids[trip_code]),
+                'trip': self.trip_values[trip_code],
+                'trip_headsign': self.headsigns[trip_code],
+                'service_date': board['date'],
+                'scheduled_departure': int(board['seconds'][row]) + board['day_start'],
+                'estimated_departure': int(estimated) if has_delay else None,
+                'delay_seconds': int(delay) if has_delay else None,
+            })
+        return results
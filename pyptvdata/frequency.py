@@ -0,0 +1,191 @@
+import datetime
+import numpy as np
+import pandas as pd
+
+from .gtfs import gtfs_time_to_seconds
+from .services import get_active_services
+from .unified import get_key_column, get_id_values, get_stop_time_seconds
+
+
+# Default time bands, in service day time, so late night trips after midnight are in 'late_night'
+TIME_BANDS = {
+    'early': ('00:00:00', '07:00:00'),
+    'am_peak': ('07:00:00', '09:00:00'),
+    'interpeak': ('09:00:00', '15:00:00'),
+    'pm_peak': ('15:00:00', '19:00:00'),
+    'evening': ('19:00:00', '24:00:00'),
+    'late_night': ('24:00:00', '30:00:00'),
+}
+
+
+def check_time_bands(time_bands : dict[str, tuple[str | int, str | int]] = None) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """
+    Checks time bands, {name: (start, end)} with times as HH:MM:SS or seconds, and returns their names, start seconds and end seconds.
+    Bands must be in order and not overlap. Defaults to TIME_BANDS.
+    """
+    if time_bands is None:
+        time_bands = TIME_BANDS
+    names = list(time_bands.keys())
+    bounds = np.array([
+        [value if isinstance(value, (int, np.integer)) else gtfs_time_to_seconds(pd.Series([value]))[0] for value in band]
+        for band in time_bands.values()
+    ], dtype=np.int32).reshape(-1, 2)
+    starts, ends = bounds[:, 0], bounds[:, 1]
+    assert np.all(starts >= 0), f"Time band times must be HH:MM:SS or seconds, got {time_bands}"
+    assert np.all(starts < ends), f"Time bands must end after they start, got {time_bands}"
+    assert np.all(starts[1:] >= ends[:-1]), f"Time bands must be in order and not overlap, got {time_bands}"
+    return names, starts, ends
+
+
+def get_time_band_codes(seconds : np.ndarray, starts : np.ndarray, ends : np.ndarray) -> np.ndarray:
+    """
+    Returns the index of the time band each time falls in, or -1 for missing times and times outside every band.
+    """
+    codes = np.searchsorted(starts, seconds, side='right') - 1
+    inside = (codes >= 0) & (seconds >= 0) & (seconds < ends[codes.clip(0)])
+    return np.where(inside, codes, -1)
+
+
+def factorize_columns(columns : dict[str, np.ndarray]) -> tuple[np.ndarray, pd.DataFrame]:
+    """
+    Returns dense group codes for the distinct combinations of several columns,
+    and a DataFrame of the distinct combinations, one row per group code.
+    """
+    n = len(next(iter(columns.values())))
+    combined = np.zeros(n, dtype=np.int64)
+    for values in columns.values():
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        combined = combined * max(len(uniques), 1) + codes
+    _, first_rows, codes = np.unique(combined, return_index=True, return_inverse=True)
+    groups = pd.DataFrame({name: np.asarray(values)[first_rows] for name, values in columns.items()})
+    return codes.ravel(), groups
+
+
+def summarize_headways(group_codes : np.ndarray, seconds : np.ndarray, band_codes : np.ndarray, n_bands : int) -> dict[str, np.ndarray]:
+    """
+    Summarizes departure times by group and time band in one pass: the times are sorted by (group, band, time),
+    and each (group, band) is a contiguous run between sorted group boundaries.
+
+    Returns arrays with one element per (group, band) with departures: group, band, departures, first and last departure seconds,
+    and the largest gap between consecutive departures in seconds (-1 if there is one departure).
+    """
+    keep = (band_codes >= 0) & (group_codes >= 0)
+    keys = group_codes[keep].astype(np.int64) * n_bands + band_codes[keep]
+    seconds = seconds[keep]
+    order = np.lexsort((seconds, keys))
+    keys = keys[order]
+    seconds = seconds[order]
+
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) > 0 else np.empty(0, dtype=np.int64)
+    counts = np.diff(np.r_[starts, len(keys)])
+    gaps = np.r_[np.diff(seconds), -1]
+    gaps[starts[1:] - 1] = -1
+    return {
+        'group': keys[starts] // n_bands,
+        'band': keys[starts] % n_bands,
+        'departures': counts,
+        'first_seconds': seconds[starts],
+        'last_seconds': seconds[starts + counts - 1],
+        'max_gap_seconds': np.maximum.reduceat(gaps, starts) if len(starts) > 0 else np.empty(0, dtype=np.int64),
+    }
+
+
+def make_frequency_table(groups : pd.DataFrame, summary : dict[str, np.ndarray], names : list[str], starts : np.ndarray, ends : np.ndarray) -> pd.DataFrame:
+    """
+    Returns the frequency table of `summarize_headways`, with the group columns, time_band, departures, trips_per_hour,
+    mean_headway_minutes, max_headway_minutes, and first_departure_seconds and last_departure_seconds.
+    """
+    band = summary['band']
+    departures = summary['departures']
+    span = (summary['last_seconds'] - summary['first_seconds']).astype(np.float64)
+    df = groups.iloc[summary['group']].reset_index(drop=True)
+    df['time_band'] = pd.Categorical.from_codes(band, categories=names)
+    df['departures'] = departures
+    df['trips_per_hour'] = departures / ((ends[band] - starts[band]) / 3600)
+    df['mean_headway_minutes'] = np.where(departures > 1, span / np.maximum(departures - 1, 1) / 60, np.nan)
+    df['max_headway_minutes'] = np.where(departures > 1, summary['max_gap_seconds'] / 60, np.nan)
+    df['first_departure_seconds'] = summary['first_seconds']
+    df['last_departure_seconds'] = summary['last_seconds']
+    return df
+
+
+def get_active_trips(feed : dict[str, pd.DataFrame], date : str | datetime.date = None) -> tuple[pd.DataFrame, np.ndarray]:
+    """
+    Returns the trips that run on a service date, or all trips if date is None,
+    and the position in those trips of the trip of each stop_times row, -1 if it does not run.
+    """
+    trips = feed['trips']
+    if date is not None:
+        service_key = get_key_column(trips, 'service')
+        trips = trips[np.isin(get_id_values(trips, service_key) if service_key == 'service_id' else trips[service_key].to_numpy(), get_active_services(feed, date))]
+    trip_key = get_key_column(trips, 'trip')
+    positions = pd.Index(get_id_values(trips, trip_key), dtype=object).get_indexer(get_id_values(feed['stop_times'], trip_key))
+    return trips.reset_index(drop=True), positions
+
+
+def get_stop_frequencies(
+        feed : dict[str, pd.DataFrame],
+        date : str | datetime.date = None,
+        time_bands : dict[str, tuple[str | int, str | int]] = None,
+        by_route : bool = True,
+    ) -> pd.DataFrame:
+    """
+    Returns the departures, trips per hour and headways at each stop in each time band of a service date,
+    see `make_frequency_table`, by stop, route and direction_id, or by stop only if by_route is False.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], or of `build_unified_feed`.
+    - date: The service date, see `get_active_services`. If None, all trips are counted.
+    - time_bands: {name: (start, end)}, see `check_time_bands`. Defaults to TIME_BANDS.
+    """
+    names, starts, ends = check_time_bands(time_bands)
+    trips, positions = get_active_trips(feed, date)
+    stop_times = feed['stop_times']
+    rows = np.flatnonzero(positions >= 0)
+    positions = positions[rows]
+
+    stop_key = get_key_column(stop_times, 'stop')
+    columns = {stop_key: np.asarray(stop_times[stop_key])[rows]}
+    if by_route:
+        route_key = get_key_column(trips, 'route')
+        columns[route_key] = np.asarray(trips[route_key])[positions]
+        if 'direction_id' in trips.columns:
+            columns['direction_id'] = np.asarray(trips['direction_id'])[positions]
+    group_codes, groups = factorize_columns(columns)
+
+    seconds = get_stop_time_seconds(stop_times, 'departure')[rows]
+    summary = summarize_headways(group_codes, seconds, get_time_band_codes(seconds, starts, ends), len(names))
+    return make_frequency_table(groups, summary, names, starts, ends)
+
+
+def get_route_frequencies(
+        feed : dict[str, pd.DataFrame],
+        date : str | datetime.date = None,
+        time_bands : dict[str, tuple[str | int, str | int]] = None,
+    ) -> pd.DataFrame:
+    """
+    Returns the trips, trips per hour and headways of each route and direction_id in each time band of a service date,
+    see `make_frequency_table`. Trips are counted in the time band of their first departure.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], or of `build_unified_feed`.
+    - date: The service date, see `get_active_services`. If None, all trips are counted.
+    - time_bands: {name: (start, end)}, see `check_time_bands`. Defaults to TIME_BANDS.
+    """
+    names, starts, ends = check_time_bands(time_bands)
+    trips, positions = get_active_trips(feed, date)
+    seconds = get_stop_time_seconds(feed['stop_times'], 'departure')
+
+    rows = np.flatnonzero((positions >= 0) & (seconds >= 0))
+    first_seconds = np.full(len(trips), np.iinfo(np.int32).max, dtype=np.int32)
+    np.minimum.at(first_seconds, positions[rows], seconds[rows])
+    first_seconds[first_seconds == np.iinfo(np.int32).max] = -1
+
+    route_key = get_key_column(trips, 'route')
+    columns = {route_key: np.asarray(trips[route_key])}
+    if 'direction_id' in trips.columns:
+        columns['direction_id'] = np.asarray(trips['direction_id'])
+    group_codes, groups = factorize_columns(columns)
+
+    summary = summarize_headways(group_codes, first_seconds, get_time_band_codes(first_seconds, starts, ends), len(names))
+    return make_frequency_table(groups, summary, names, starts, ends).rename(columns={'departures': 'trips'})
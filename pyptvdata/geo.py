@@ -0,0 +1,121 @@
+import numpy as np
+
+
+# Mean Earth radius, in metres
+EARTH_RADIUS = 6_371_008.8
+
+METRES_PER_DEGREE = EARTH_RADIUS * np.pi / 180
+
+
+def haversine_distance(lat1 : np.ndarray, lon1 : np.ndarray, lat2 : np.ndarray, lon2 : np.ndarray) -> np.ndarray:
+    """
+    Returns the great-circle distances between points, in metres. The arguments are broadcast against each other.
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(value, dtype=np.float64)) for value in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def get_grid_cells(lat : np.ndarray, lon : np.ndarray, cell_size : float, max_abs_lat : float = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the (x, y) integer grid cells of points, for a grid whose cells are at least cell_size metres wide and high.
+
+    Longitude degrees are scaled at max_abs_lat, the latitude furthest from the equator, where they are shortest.
+    Defaults to the largest absolute latitude of the points.
+    """
+    if max_abs_lat is None:
+        max_abs_lat = np.nanmax(np.abs(lat)) if len(lat) > 0 else 0.0
+    cell_lat = cell_size / METRES_PER_DEGREE
+    cell_lon = cell_lat / max(np.cos(np.radians(max_abs_lat)), 1e-6)
+    return np.floor(lon / cell_lon).astype(np.int64), np.floor(lat / cell_lat).astype(np.int64)
+
+
+def get_pairs_within_distance(
+        lat : np.ndarray,
+        lon : np.ndarray,
+        max_distance : float,
+        query_lat : np.ndarray = None,
+        query_lon : np.ndarray = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the pairs of points within max_distance metres of each other, as (i, j, distance) arrays,
+    found by bucketing the points into a grid of max_distance cells and only comparing neighbouring cells.
+
+    Without query points, returns each pair of the points once, with i < j.
+    With query points, returns every (query point i, point j) pair instead.
+    Points with missing coordinates are left out.
+    """
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    is_self = query_lat is None
+    if is_self:
+        query_lat, query_lon = lat, lon
+    else:
+        query_lat = np.asarray(query_lat, dtype=np.float64)
+        query_lon = np.asarray(query_lon, dtype=np.float64)
+
+    valid = np.flatnonzero(~(np.isnan(lat) | np.isnan(lon)))
+    query_valid = valid if is_self else np.flatnonzero(~(np.isnan(query_lat) | np.isnan(query_lon)))
+    if len(valid) == 0 or len(query_valid) == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float64)
+
+    max_abs_lat = max(np.abs(lat[valid]).max(), np.abs(query_lat[query_valid]).max())
+    x, y = get_grid_cells(lat[valid], lon[valid], max_distance, max_abs_lat)
+    query_x, query_y = get_grid_cells(query_lat[query_valid], query_lon[query_valid], max_distance, max_abs_lat)
+
+    # Sort the points by cell, so the points of a cell are a contiguous range
+    offset_x = min(x.min(), query_x.min()) - 1
+    offset_y = min(y.min(), query_y.min()) - 1
+    height = max(y.max(), query_y.max()) - offset_y + 2
+    keys = (x - offset_x) * height + (y - offset_y)
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    pairs_i = []
+    pairs_j = []
+    pairs_distance = []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            neighbour_keys = (query_x + dx - offset_x) * height + (query_y + dy - offset_y)
+            start = np.searchsorted(sorted_keys, neighbour_keys, side='left')
+            counts = np.searchsorted(sorted_keys, neighbour_keys, side='right') - start
+            total = counts.sum()
+            if total == 0:
+                continue
+            i = np.repeat(np.arange(len(query_valid)), counts)
+            within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            j = order[np.repeat(start, counts) + within]
+            i = query_valid[i]
+            j = valid[j]
+            if is_self:
+                keep = i < j
+                i, j = i[keep], j[keep]
+            distance = haversine_distance(query_lat[i], query_lon[i], lat[j], lon[j])
+            keep = distance <= max_distance
+            pairs_i.append(i[keep])
+            pairs_j.append(j[keep])
+            pairs_distance.append(distance[keep])
+
+    if not pairs_i:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float64)
+    return np.concatenate(pairs_i), np.concatenate(pairs_j), np.concatenate(pairs_distance)
+
+
+def get_connected_components(n : int, i : np.ndarray, j : np.ndarray) -> np.ndarray:
+    """
+    Returns the connected component of each of n nodes joined by the edges (i, j),
+    as dense labels numbered in order of each component's smallest node.
+    """
+    labels = np.arange(n)
+    while True:
+        smallest = np.minimum(labels[i], labels[j])
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, i, smallest)
+        np.minimum.at(new_labels, j, smallest)
+        new_labels = new_labels[new_labels]
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+    return np.unique(labels, return_inverse=True)[1]
@@ -1,52 +1,218 @@
 import zipfile
 import io
+import time
 import requests
+import numpy as np
 import pandas as pd
+from collections.abc import Iterator
 
-from .const import GTFS_FILE_FIELDS_TYPES
+from .const import GTFS_FILE_FIELDS, GTFS_FILE_FIELDS_TYPES, MODE_IDS_ALL, TABLE_NAMES
 
 
-def read_gtfs_zip_obj(gtfs_zip: zipfile.ZipFile) -> dict[str, dict[str, pd.DataFrame]]:
+def open_gtfs_zip(url_or_path : str = "http://data.ptv.vic.gov.au/downloads/gtfs.zip") -> zipfile.ZipFile:
     """
-    Reads a gtfs.zip object from a URL or local path and returns a dictionary of pandas DataFrames
+    Opens a gtfs.zip file from a URL or local path. A URL is downloaded into memory.
+    """
+    assert url_or_path.endswith('.zip'), "File must be a .zip file"   
     
-    The dictionary is structured as follows:
+    if ":" in url_or_path: # If url_or_path is a URL
         
-        {
-            mode_id: {
-                table_name: pd.DataFrame
-            }
-        }
+        response = requests.get(url_or_path, stream=True)
+
+        if response.status_code == 200:
+            # Create a ZipFile object from the response content
+            return zipfile.ZipFile(io.BytesIO(response.content))
+    
+    return zipfile.ZipFile(url_or_path, 'r')
+
+
+def get_mode_ids(gtfs_zip : zipfile.ZipFile) -> list[str]:
+    """
+    Returns the mode IDs in a gtfs.zip object, i.e. the directories with a google_transit.zip, from its central directory.
+    """
+    return [item.removesuffix('/google_transit.zip') for item in gtfs_zip.namelist() if item.endswith('/google_transit.zip')]
+
+
+def open_google_transit_zip(gtfs_zip : zipfile.ZipFile, mode_id : str, in_memory : bool = False) -> zipfile.ZipFile:
+    """
+    Opens the google_transit.zip of a mode in a gtfs.zip object.
+
+    By default it is opened in place, which holds only zipfile's buffers, but zipfile seeks within it to open each table,
+    and seeking a compressed member re-inflates it from the start.
+    If in_memory is True, it is read into memory first, so each table is only inflated once, at the cost of holding the whole compressed
+    google_transit.zip of the mode in memory while it is open, the largest of which is metropolitan bus.
     """
+    google_transit_zip_path = f"{mode_id}/google_transit.zip"
+    if in_memory:
+        return zipfile.ZipFile(io.BytesIO(gtfs_zip.read(google_transit_zip_path)), 'r')
+    return zipfile.ZipFile(gtfs_zip.open(google_transit_zip_path), 'r')
+
+
+def gtfs_time_to_seconds(times : pd.Series) -> np.ndarray:
+    """
+    Converts GTFS times (HH:MM:SS, hours can be 24 or more after midnight) to seconds since the start of the service day.
+    Returns an int32 array, with -1 for missing times.
+    """
+    if isinstance(times.dtype, pd.CategoricalDtype):
+        # e.g. from read_gtfs_mirror, convert each distinct time once
+        seconds = gtfs_time_to_seconds(pd.Series(times.cat.categories, dtype=object))
+        # Missing times have code -1, which picks the -1 appended last, even when all times are missing and there are no categories
+        return np.append(seconds, np.int32(-1))[times.cat.codes.to_numpy()]
+
+    values = times.fillna('').to_numpy(dtype='S')
+    if values.dtype.itemsize == 8:
+        digits = values.view(np.uint8).reshape(-1, 8).astype(np.int32)
+        present = digits[:, 0] != 0
+        digits_only = digits[present][:, [0, 1, 3, 4, 6, 7]]
+        if np.all((digits[present, 2] == ord(':')) & (digits[present, 5] == ord(':'))) and np.all((digits_only >= ord('0')) & (digits_only <= ord('9'))):
+            digits -= ord('0')
+            seconds = (digits[:, 0] * 10 + digits[:, 1]) * 3600 + (digits[:, 3] * 10 + digits[:, 4]) * 60 + digits[:, 6] * 10 + digits[:, 7]
+            return np.where(present, seconds, -1).astype(np.int32)
+
+    # Times that are not all HH:MM:SS, e.g. H:MM:SS
+    parts = times.str.split(':', expand=True)
+    if parts.shape[1] < 3:
+        return np.full(len(times), -1, dtype=np.int32)
+    parts = parts.iloc[:, :3].apply(pd.to_numeric, errors='coerce')
+    seconds = parts[0] * 3600 + parts[1] * 60 + parts[2]
+    return seconds.fillna(-1).to_numpy(dtype=np.int32)
+
+
+def check_gtfs_filters(
+        modes : list[str] | str = None,
+        tables : list[str] | str = None,
+        columns : dict[str, list[str]] = None,
+    ) -> tuple[list[str] | None, list[str] | None, dict[str, list[str]] | None]:
+    """
+    Checks the modes, tables and columns filters of `read_gtfs_zip` against MODE_IDS_ALL, TABLE_NAMES and GTFS_FILE_FIELDS,
+    and returns them with a single mode or table wrapped in a list.
+    """
+    if isinstance(modes, str):
+        modes = [modes]
+    if isinstance(tables, str):
+        tables = [tables]
+    if modes is not None:
+        modes = [str(mode_id) for mode_id in modes]
+        for mode_id in modes:
+            assert mode_id in MODE_IDS_ALL, f"Mode ID must be one of {MODE_IDS_ALL}, got {mode_id}"
+    if tables is not None:
+        for table_name in tables:
+            assert table_name in TABLE_NAMES, f"Table name must be one of {TABLE_NAMES}, got {table_name}"
+    if columns is not None:
+        for table_name, table_columns in columns.items():
+            assert table_name in TABLE_NAMES, f"Table name must be one of {TABLE_NAMES}, got {table_name}"
+            for column in table_columns:
+                assert column in GTFS_FILE_FIELDS[table_name], f"Column of {table_name} must be one of {GTFS_FILE_FIELDS[table_name]}, got {column}"
+    return modes, tables, columns
+
+
+def read_gtfs_table(transit_zip : zipfile.ZipFile, table_name : str, columns : list[str] = None, profile_row : dict = None) -> pd.DataFrame:
+    """
+    Reads a table from a mode's google_transit.zip object and returns it as a pandas DataFrame.
+
+    If columns is given, only those columns are parsed.
+    If profile_row is given, the time spent on each stage, the row count and the DataFrame memory are added to it.
+    """
+    nested_file_name = f"{table_name}.txt"
+    dtype = GTFS_FILE_FIELDS_TYPES[table_name]
+    usecols = None
+    if columns is not None:
+        columns = set(columns)
+        dtype = {column: column_type for column, column_type in dtype.items() if column in columns}
+        usecols = lambda column: column in columns
+
+    if profile_row is None:
+        with transit_zip.open(nested_file_name) as nested_file:
+            return pd.read_csv(nested_file, keep_default_na=False, low_memory=False, na_values=[''], dtype=dtype, usecols=usecols)
+
+    # Inflate, parse and convert separately so that each stage can be timed
+    start = time.perf_counter()
+    data = transit_zip.read(nested_file_name)
+    inflated = time.perf_counter()
+    df = pd.read_csv(io.BytesIO(data), keep_default_na=False, low_memory=False, na_values=[''], dtype=str, usecols=usecols)
+    parsed = time.perf_counter()
+    df = df.astype({column: column_type for column, column_type in dtype.items() if column in df.columns and column_type is not str})
+    converted = time.perf_counter()
+
+    zip_info = transit_zip.getinfo(nested_file_name)
+    profile_row.update({
+        'compressed_bytes': zip_info.compress_size,
+        'uncompressed_bytes': zip_info.file_size,
+        'inflate_seconds': inflated - start,
+        'parse_seconds': parsed - inflated,
+        'convert_seconds': converted - parsed,
+        'rows': len(df),
+        'memory_bytes': int(df.memory_usage(deep=True).sum()),
+    })
+    return df
+
+
+def _read_gtfs_zip_obj(
+        gtfs_zip: zipfile.ZipFile,
+        modes : list[str] | str = None,
+        tables : list[str] | str = None,
+        columns : dict[str, list[str]] = None,
+        report : dict = None,
+    ) -> dict[str, dict[str, pd.DataFrame]]:
+    """
+    Reads a gtfs.zip object, see `read_gtfs_zip_obj`. If report is given, the 'modes' and 'tables' profiling DataFrames are added to it.
+    """
+    modes, tables, columns = check_gtfs_filters(modes=modes, tables=tables, columns=columns)
+
     DFK = {}
-    for item in gtfs_zip.namelist():
-        if not item.endswith('/'): # Check if the item is a directory
+    mode_rows = []
+    table_rows = []
+    for mode_id in get_mode_ids(gtfs_zip):
+        if modes is not None and mode_id not in modes:
             continue
-        mode_id = item.strip('/')
         
         DFK[mode_id] = {}
 
-        google_transit_zip_path = f"{mode_id}/google_transit.zip"
-        with gtfs_zip.open(google_transit_zip_path) as google_transit_file:
-            with zipfile.ZipFile(google_transit_file, 'r') as transit_zip:
+        start = time.perf_counter()
+        # When profiling, the nested zip is read into memory, so that the inflate time of each table is not re-inflating the nested zip
+        with open_google_transit_zip(gtfs_zip, mode_id, in_memory=report is not None) as transit_zip:
+            if report is not None:
+                zip_info = gtfs_zip.getinfo(f"{mode_id}/google_transit.zip")
+                mode_rows.append({
+                    'mode_id': mode_id,
+                    'compressed_bytes': zip_info.compress_size,
+                    'uncompressed_bytes': zip_info.file_size,
+                    'extract_seconds': time.perf_counter() - start,
+                })
 
-                for nested_file_name in transit_zip.namelist():
-                
-                    if not nested_file_name.endswith('.txt'):
-                        continue
+            for nested_file_name in transit_zip.namelist():
             
-                    table_name = nested_file_name.removesuffix('.txt')
-            
-                    with transit_zip.open(nested_file_name) as nested_file:
-                        
-                        DFK[mode_id][table_name] = pd.read_csv(nested_file, keep_default_na=False, low_memory=False, na_values=[''], dtype=GTFS_FILE_FIELDS_TYPES[table_name])
-    
+                if not nested_file_name.endswith('.txt'):
+                    continue
+        
+                table_name = nested_file_name.removesuffix('.txt')
+
+                if tables is not None and table_name not in tables:
+                    continue
+
+                if report is not None:
+                    profile_row = {'mode_id': mode_id, 'table_name': table_name}
+                    table_rows.append(profile_row)
+                else:
+                    profile_row = None
+
+                table_columns = columns.get(table_name) if columns is not None else None
+                DFK[mode_id][table_name] = read_gtfs_table(transit_zip, table_name, columns=table_columns, profile_row=profile_row)
+
+    if report is not None:
+        report['modes'] = pd.DataFrame(mode_rows)
+        report['tables'] = pd.DataFrame(table_rows)
     return DFK
 
 
-def read_gtfs_zip(url_or_path : str = "http://data.ptv.vic.gov.au/downloads/gtfs.zip") -> dict[str, dict[str, pd.DataFrame]]:
+def read_gtfs_zip_obj(
+        gtfs_zip: zipfile.ZipFile,
+        modes : list[str] | str = None,
+        tables : list[str] | str = None,
+        columns : dict[str, list[str]] = None,
+    ) -> dict[str, dict[str, pd.DataFrame]]:
     """
-    Reads a gtfs.zip file from a URL or local path and returns a dictionary of pandas DataFrames
+    Reads a gtfs.zip object from a URL or local path and returns a dictionary of pandas DataFrames
     
     The dictionary is structured as follows:
         
@@ -55,19 +221,156 @@ def read_gtfs_zip(url_or_path : str = "http://data.ptv.vic.gov.au/downloads/gtfs
                 table_name: pd.DataFrame
             }
         }
+
+    See `read_gtfs_zip` for the modes, tables and columns parameters.
     """
+    return _read_gtfs_zip_obj(gtfs_zip=gtfs_zip, modes=modes, tables=tables, columns=columns)
 
-    assert url_or_path.endswith('.zip'), "File must be a .zip file"   
+
+def read_gtfs_zip(
+        url_or_path : str = "http://data.ptv.vic.gov.au/downloads/gtfs.zip",
+        modes : list[str] | str = None,
+        tables : list[str] | str = None,
+        columns : dict[str, list[str]] = None,
+    ) -> dict[str, dict[str, pd.DataFrame]]:
+    """
+    Reads a gtfs.zip file from a URL or local path and returns a dictionary of pandas DataFrames
     
-    if ":" in url_or_path: # If url_or_path is a URL
+    The dictionary is structured as follows:
         
-        response = requests.get(url_or_path, stream=True)
+        {
+            mode_id: {
+                table_name: pd.DataFrame
+            }
+        }
 
-        if response.status_code == 200:
-            # Create a ZipFile object from the response content
-            with zipfile.ZipFile(io.BytesIO(response.content)) as gtfs_zip:
-                return read_gtfs_zip_obj(gtfs_zip=gtfs_zip)
-    
-    with zipfile.ZipFile(url_or_path, 'r') as gtfs_zip:
-        return read_gtfs_zip_obj(gtfs_zip=gtfs_zip)
-    
\ No newline at end of file
+    The filters are applied using the zip central directories, before anything is inflated:
+    - modes: Mode IDs to load, from MODE_IDS_ALL, e.g. ['3'] for metropolitan tram. Other modes' google_transit.zip are never read.
+    - tables: Table names to load, from TABLE_NAMES, e.g. ['stops', 'routes']. Other tables are never inflated.
+    - columns: Columns to parse for some tables, e.g. {'stops': ['stop_id', 'stop_lat', 'stop_lon']}.
+
+    See `profile_gtfs_zip` to also time each stage.
+    """
+    with open_gtfs_zip(url_or_path) as gtfs_zip:
+        return _read_gtfs_zip_obj(gtfs_zip=gtfs_zip, modes=modes, tables=tables, columns=columns)
+
+
+def profile_gtfs_zip(
+        url_or_path : str = "http://data.ptv.vic.gov.au/downloads/gtfs.zip",
+        modes : list[str] | str = None,
+        tables : list[str] | str = None,
+        columns : dict[str, list[str]] = None,
+    ) -> tuple[dict[str, dict[str, pd.DataFrame]], dict]:
+    """
+    Reads a gtfs.zip file like `read_gtfs_zip`, and returns a tuple of the dictionary of pandas DataFrames and a profiling report:
+
+        {
+            'download_seconds': float, # 0 for a local path
+            'total_seconds': float,
+            'modes': pd.DataFrame, # mode_id, compressed_bytes, uncompressed_bytes, extract_seconds
+            'tables': pd.DataFrame, # mode_id, table_name, compressed_bytes, uncompressed_bytes,
+                                    # inflate_seconds, parse_seconds, convert_seconds, rows, memory_bytes
+        }
+
+    Profiling parses the CSVs as strings and converts the dtypes afterwards, so that the two stages can be timed,
+    and reads each mode's google_transit.zip into memory, see `open_google_transit_zip`, so it uses more memory than `read_gtfs_zip`.
+    """
+
+    start = time.perf_counter()
+
+    report = {}
+    with open_gtfs_zip(url_or_path) as gtfs_zip:
+        download_seconds = time.perf_counter() - start if ":" in url_or_path else 0.0
+        DFK = _read_gtfs_zip_obj(gtfs_zip=gtfs_zip, modes=modes, tables=tables, columns=columns, report=report)
+
+    report = {
+        'download_seconds': download_seconds,
+        'total_seconds': time.perf_counter() - start,
+        **report,
+    }
+    return DFK, report
+
+
+def iter_gtfs_table_chunks_obj(
+        gtfs_zip : zipfile.ZipFile,
+        mode_id : str,
+        table_name : str = 'stop_times',
+        chunksize : int = 500_000,
+        columns : list[str] = None,
+        trip_ids : set[str] = None,
+        shape_ids : set[str] = None,
+        start_time : str | int = None,
+        end_time : str | int = None,
+        time_column : str = 'departure_time',
+    ) -> Iterator[pd.DataFrame]:
+    """
+    Yields a table of a mode in a gtfs.zip object in typed chunks of up to chunksize rows, streamed from the nested zip,
+    so the whole table is never in memory. Meant for stop_times and shapes, the largest tables.
+
+    The filters are applied to each chunk as it is parsed, and chunks left empty are skipped:
+    - trip_ids: Only keep rows of these trips.
+    - shape_ids: Only keep rows of these shapes.
+    - start_time, end_time: Only keep rows with time_column in [start_time, end_time), as HH:MM:SS or seconds.
+    """
+    modes, _, column_filter = check_gtfs_filters(modes=[mode_id], tables=[table_name], columns={table_name: columns} if columns is not None else None)
+
+    dtype = GTFS_FILE_FIELDS_TYPES[table_name]
+    usecols = None
+    if column_filter is not None:
+        # The filter columns are needed to filter, and are dropped afterwards
+        filter_columns = {'trip_id'} if trip_ids is not None else set()
+        filter_columns |= {'shape_id'} if shape_ids is not None else set()
+        filter_columns |= {time_column} if start_time is not None or end_time is not None else set()
+        read_columns = set(columns) | filter_columns
+        dtype = {column: column_type for column, column_type in dtype.items() if column in read_columns}
+        usecols = lambda column: column in read_columns
+
+    if isinstance(start_time, str):
+        start_time = int(gtfs_time_to_seconds(pd.Series([start_time]))[0])
+    if isinstance(end_time, str):
+        end_time = int(gtfs_time_to_seconds(pd.Series([end_time]))[0])
+
+    with open_google_transit_zip(gtfs_zip, modes[0]) as transit_zip:
+        with transit_zip.open(f"{table_name}.txt") as nested_file:
+            reader = pd.read_csv(nested_file, keep_default_na=False, na_values=[''], dtype=dtype, usecols=usecols, chunksize=chunksize)
+            for chunk in reader:
+                mask = None
+                if trip_ids is not None:
+                    mask = chunk['trip_id'].isin(trip_ids)
+                if shape_ids is not None:
+                    mask = chunk['shape_id'].isin(shape_ids) if mask is None else mask & chunk['shape_id'].isin(shape_ids)
+                if start_time is not None or end_time is not None:
+                    seconds = gtfs_time_to_seconds(chunk[time_column])
+                    time_mask = np.ones(len(chunk), dtype=bool)
+                    if start_time is not None:
+                        time_mask &= seconds >= start_time
+                    if end_time is not None:
+                        time_mask &= seconds < end_time
+                    mask = time_mask if mask is None else mask & time_mask
+                if mask is not None:
+                    chunk = chunk[mask]
+                if len(chunk) == 0:
+                    continue
+                if columns is not None:
+                    chunk = chunk[[column for column in chunk.columns if column in columns]]
+                yield chunk.reset_index(drop=True)
+
+
+def iter_gtfs_table_chunks(
+        url_or_path : str = "http://data.ptv.vic.gov.au/downloads/gtfs.zip",
+        mode_id : str = '4',
+        table_name : str = 'stop_times',
+        **kwargs,
+    ) -> Iterator[pd.DataFrame]:
+    """
+    Yields a table of a mode in a gtfs.zip file from a URL or local path in chunks, see `iter_gtfs_table_chunks_obj`.
+
+    For example, counting the trips at each metropolitan bus stop in bounded memory:
+
+        counts = None
+        for chunk in iter_gtfs_table_chunks(path, '4', 'stop_times', columns=['stop_id']):
+            chunk_counts = chunk['stop_id'].value_counts()
+            counts = chunk_counts if counts is None else counts.add(chunk_counts, fill_value=0)
+    """
+    with open_gtfs_zip(url_or_path) as gtfs_zip:
+        yield from iter_gtfs_table_chunks_obj(gtfs_zip, mode_id, table_name, **kwargs)
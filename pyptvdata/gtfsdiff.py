@@ -0,0 +1,156 @@
+import zipfile
+import pandas as pd
+
+from .const import GTFS_PRIMARY_KEYS
+from .gtfs import open_gtfs_zip, get_mode_ids, open_google_transit_zip, read_gtfs_table
+
+
+def is_same_zip_entry(old_zip : zipfile.ZipFile, new_zip : zipfile.ZipFile, name : str) -> bool:
+    """
+    Returns whether an entry has the same CRC-32 and size in two zip files, from their central directories, without inflating it.
+    """
+    old_info = old_zip.getinfo(name)
+    new_info = new_zip.getinfo(name)
+    return old_info.CRC == new_info.CRC and old_info.file_size == new_info.file_size
+
+
+def diff_gtfs_table(old_df : pd.DataFrame, new_df : pd.DataFrame, table_name : str) -> dict[str, pd.DataFrame]:
+    """
+    Returns the row-level differences between two versions of a GTFS table, keyed on its primary key (see GTFS_PRIMARY_KEYS):
+
+        {
+            'added': pd.DataFrame, # Rows only in the new version
+            'removed': pd.DataFrame, # Rows only in the old version
+            'changed': pd.DataFrame, # Rows of the new version whose non-key columns differ from the old version
+        }
+    """
+    keys = GTFS_PRIMARY_KEYS[table_name]
+    merged = old_df.merge(new_df, on=keys, how='outer', suffixes=('_old', ''), indicator=True)
+
+    added = merged['_merge'] == 'right_only'
+    removed = merged['_merge'] == 'left_only'
+    both = merged['_merge'] == 'both'
+
+    changed = pd.Series(False, index=merged.index)
+    for column in new_df.columns:
+        if column in keys or column not in old_df.columns:
+            continue
+        old_values = merged[f'{column}_old']
+        new_values = merged[column]
+        changed |= (old_values != new_values) & ~(old_values.isna() & new_values.isna())
+    # Columns added or removed between versions change every row
+    if set(old_df.columns) != set(new_df.columns):
+        changed[:] = True
+    changed &= both
+
+    # Columns only in the old version are not suffixed by the merge.
+    # The outer merge fills the other side's int columns with NaN, which makes them float, so the rows are cast back to their version's dtypes
+    old_columns = {f'{column}_old' if column in new_df.columns else column: column for column in old_df.columns if column not in keys}
+    return {
+        'added': merged.loc[added, new_df.columns].astype(new_df.dtypes.to_dict()).reset_index(drop=True),
+        'removed': merged.loc[removed, [*keys, *old_columns]].rename(columns=old_columns).astype(old_df.dtypes.to_dict()).reset_index(drop=True),
+        'changed': merged.loc[changed, new_df.columns].astype(new_df.dtypes.to_dict()).reset_index(drop=True),
+    }
+
+
+def diff_gtfs_zip_obj(old_zip : zipfile.ZipFile, new_zip : zipfile.ZipFile) -> dict[str, dict]:
+    """
+    Compares two gtfs.zip objects mode by mode and table by table.
+
+    A mode whose google_transit.zip has the same CRC-32 and size in both versions is skipped without inflating it,
+    and so is a table whose .txt has the same CRC-32 and size in both google_transit.zip versions.
+    Only the tables that changed are read and compared row by row.
+
+    Returns a dictionary structured as follows:
+
+        {
+            mode_id: {
+                'status': 'added' | 'removed' | 'changed' | 'unchanged',
+                'tables': {
+                    table_name: {
+                        'status': 'added' | 'removed' | 'changed' | 'unchanged',
+                        'added': pd.DataFrame,
+                        'removed': pd.DataFrame,
+                        'changed': pd.DataFrame,
+                    }
+                }
+            }
+        }
+
+    For an added or removed mode or table, all its rows are in 'added' or 'removed'.
+    'tables' is empty for an unchanged mode, and the row DataFrames are left out for an unchanged table.
+    """
+    old_mode_ids = get_mode_ids(old_zip)
+    new_mode_ids = get_mode_ids(new_zip)
+
+    diff = {}
+    for mode_id in list(dict.fromkeys(old_mode_ids + new_mode_ids)):
+        google_transit_zip_path = f"{mode_id}/google_transit.zip"
+
+        if mode_id in old_mode_ids and mode_id in new_mode_ids and is_same_zip_entry(old_zip, new_zip, google_transit_zip_path):
+            diff[mode_id] = {'status': 'unchanged', 'tables': {}}
+            continue
+
+        if mode_id not in new_mode_ids:
+            mode_status = 'removed'
+        elif mode_id not in old_mode_ids:
+            mode_status = 'added'
+        else:
+            mode_status = 'changed'
+
+        old_transit_zip = open_google_transit_zip(old_zip, mode_id) if mode_id in old_mode_ids else None
+        new_transit_zip = open_google_transit_zip(new_zip, mode_id) if mode_id in new_mode_ids else None
+        old_table_names = [name.removesuffix('.txt') for name in old_transit_zip.namelist() if name.endswith('.txt')] if old_transit_zip else []
+        new_table_names = [name.removesuffix('.txt') for name in new_transit_zip.namelist() if name.endswith('.txt')] if new_transit_zip else []
+
+        tables = {}
+        for table_name in list(dict.fromkeys(old_table_names + new_table_names)):
+            if table_name in old_table_names and table_name in new_table_names:
+                if is_same_zip_entry(old_transit_zip, new_transit_zip, f"{table_name}.txt"):
+                    tables[table_name] = {'status': 'unchanged'}
+                    continue
+                table_diff = diff_gtfs_table(read_gtfs_table(old_transit_zip, table_name), read_gtfs_table(new_transit_zip, table_name), table_name)
+                tables[table_name] = {'status': 'changed', **table_diff}
+            elif table_name in new_table_names:
+                new_df = read_gtfs_table(new_transit_zip, table_name)
+                tables[table_name] = {'status': 'added', 'added': new_df, 'removed': new_df.iloc[:0], 'changed': new_df.iloc[:0]}
+            else:
+                old_df = read_gtfs_table(old_transit_zip, table_name)
+                tables[table_name] = {'status': 'removed', 'added': old_df.iloc[:0], 'removed': old_df, 'changed': old_df.iloc[:0]}
+
+        for transit_zip in [old_transit_zip, new_transit_zip]:
+            if transit_zip is not None:
+                transit_zip.close()
+
+        diff[mode_id] = {'status': mode_status, 'tables': tables}
+
+    return diff
+
+
+def diff_gtfs_zip(old_url_or_path : str, new_url_or_path : str = "http://data.ptv.vic.gov.au/downloads/gtfs.zip") -> dict[str, dict]:
+    """
+    Compares two gtfs.zip files from URLs or local paths, see `diff_gtfs_zip_obj`.
+    """
+    with open_gtfs_zip(old_url_or_path) as old_zip, open_gtfs_zip(new_url_or_path) as new_zip:
+        return diff_gtfs_zip_obj(old_zip, new_zip)
+
+
+def summarize_gtfs_diff(diff : dict[str, dict]) -> pd.DataFrame:
+    """
+    Returns the number of added, removed and changed rows of each mode and table in a diff from `diff_gtfs_zip`.
+    """
+    rows = []
+    for mode_id, mode_diff in diff.items():
+        if mode_diff['status'] == 'unchanged':
+            rows.append({'mode_id': mode_id, 'table_name': None, 'status': 'unchanged', 'added': 0, 'removed': 0, 'changed': 0})
+            continue
+        for table_name, table_diff in mode_diff['tables'].items():
+            rows.append({
+                'mode_id': mode_id,
+                'table_name': table_name,
+                'status': table_diff['status'],
+                'added': len(table_diff.get('added', ())),
+                'removed': len(table_diff.get('removed', ())),
+                'changed': len(table_diff.get('changed', ())),
+            })
+    return pd.DataFrame(rows, columns=['mode_id', 'table_name', 'status', 'added', 'removed', 'changed'])
@@ -1,7 +1,17 @@
-import requests
+import numpy as np
+import pandas as pd
 from google.transit import gtfs_realtime_pb2
 
 from .const import GTFSR_ENDPOINTS
+from .metrics import Metrics
+from .transport import Transport, get_retry_count
+
+
+def is_repeated_field(field_descriptor) -> bool:
+    # FieldDescriptor.label was removed in protobuf 7, in favour of is_repeated
+    if hasattr(field_descriptor, 'is_repeated'):
+        return field_descriptor.is_repeated
+    return field_descriptor.label == field_descriptor.LABEL_REPEATED
 
 
 def parse_gtfs_r(entity):
@@ -10,7 +20,7 @@ def parse_gtfs_r(entity):
     entity_dict = {}
     for field in entity.ListFields():
         field_name = field[0].name
-        if field[0].label == field[0].LABEL_REPEATED:
+        if is_repeated_field(field[0]):
             field_value = [parse_gtfs_r(item) for item in field[1]]
         else:
             field_value = parse_gtfs_r(field[1])
@@ -28,6 +38,60 @@ def parse_gtfs_r_binary(feed_data):
     return parse_gtfs_realtime_feed(feed)
 
 
+def get_stop_time_updates(feed_data : bytes | gtfs_realtime_pb2.FeedMessage) -> pd.DataFrame:
+    """
+    Returns the stop time updates of the trip updates of a GTFS-R feed as a DataFrame, one row per update:
+
+        trip_id, start_date, stop_sequence, stop_id, arrival_delay, arrival_time, departure_delay, departure_time, timestamp
+
+    where delays are in seconds and times and timestamp in Unix time, NaN (or '' for text) if not set.
+    The fields are read from the protobuf messages directly rather than through `parse_gtfs_r`, so archived feeds can be read quickly.
+    Use `get_latest_stop_time_updates` to keep the latest of the updates of several snapshots.
+
+    Parameters:
+    - feed_data: A serialised FeedMessage, e.g. from `GTFSRClient.get_data`, or a parsed one.
+    """
+    if isinstance(feed_data, gtfs_realtime_pb2.FeedMessage):
+        feed = feed_data
+    else:
+        feed = gtfs_realtime_pb2.FeedMessage()
+        feed.ParseFromString(feed_data)
+    header_timestamp = feed.header.timestamp if feed.header.HasField('timestamp') else np.nan
+
+    columns = {name: [] for name in ['trip_id', 'start_date', 'stop_sequence', 'stop_id', 'arrival_delay', 'arrival_time', 'departure_delay', 'departure_time', 'timestamp']}
+    for entity in feed.entity:
+        if not entity.HasField('trip_update'):
+            continue
+        trip_update = entity.trip_update
+        timestamp = trip_update.timestamp if trip_update.HasField('timestamp') else header_timestamp
+        for stop_time_update in trip_update.stop_time_update:
+            columns['trip_id'].append(trip_update.trip.trip_id)
+            columns['start_date'].append(trip_update.trip.start_date)
+            columns['stop_sequence'].append(stop_time_update.stop_sequence if stop_time_update.HasField('stop_sequence') else -1)
+            columns['stop_id'].append(stop_time_update.stop_id)
+            for event_name in ['arrival', 'departure']:
+                has_event = stop_time_update.HasField(event_name)
+                event = getattr(stop_time_update, event_name)
+                columns[f'{event_name}_delay'].append(event.delay if has_event and event.HasField('delay') else np.nan)
+                columns[f'{event_name}_time'].append(event.time if has_event and event.HasField('time') else np.nan)
+            columns['timestamp'].append(timestamp)
+
+    updates = pd.DataFrame(columns)
+    updates['stop_sequence'] = updates['stop_sequence'].astype(np.int64)
+    for column in ['arrival_delay', 'arrival_time', 'departure_delay', 'departure_time', 'timestamp']:
+        updates[column] = updates[column].astype(np.float64)
+    return updates
+
+
+def get_latest_stop_time_updates(updates : pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns the latest update of each trip_id, start_date and stop_sequence by timestamp,
+    e.g. from the concatenated `get_stop_time_updates` of several snapshots of an archived feed.
+    """
+    updates = updates.sort_values('timestamp', kind='stable', na_position='first')
+    return updates.drop_duplicates(['trip_id', 'start_date', 'stop_sequence'], keep='last').sort_index().reset_index(drop=True)
+
+
 class GTFSRClient:
     def __init__(
         self,
@@ -35,16 +99,38 @@ class GTFSRClient:
         header={
             "Cache-Control": "no-cache",
         },
+        transport : Transport = None,
+        metrics : Metrics = None,
     ):
         self.api_key = api_key
-        self.session = requests.Session()
+        self.metrics = metrics
+        self.transport = transport if transport is not None else Transport()
+        self.session = self.transport.session
         self.header = header
         self.header["Ocp-Apim-Subscription-Key"] = api_key
 
     def get_data(self, endpoint):
-        response = self.session.get(endpoint, headers=self.header)
-        response.raise_for_status()
-        return response.content
+        if self.metrics is None:
+            response = self.transport.get(endpoint, headers=self.header)
+            response.raise_for_status()
+            return response.content
+
+        info = self.metrics.start_request('gtfsr', 'GET', endpoint)
+        try:
+            response = self.transport.get(endpoint, headers=self.header)
+            info.duration = info.get_elapsed()
+            info.status_code = response.status_code
+            info.response_bytes = len(response.content)
+            info.retries = get_retry_count(response)
+            response.raise_for_status()
+            return response.content
+        except BaseException as e:
+            info.error = e
+            if info.duration is None:
+                info.duration = info.get_elapsed()
+            raise
+        finally:
+            self.metrics.end_request(info)
 
     def get_tram_servicealert(self):
         return self.get_data("https://data-exchange-api.vicroads.vic.gov.au/opendata/gtfsr/v1/tram/servicealert")
@@ -0,0 +1,283 @@
+import concurrent.futures
+import datetime
+import numpy as np
+import pandas as pd
+
+from .gtfs import gtfs_time_to_seconds
+from .geo import METRES_PER_DEGREE, get_pairs_within_distance
+from .frequency import get_active_trips
+from .transfers import WALKING_SPEED, DETOUR_FACTOR, build_transfers, get_transfer_graph
+from .unified import get_stop_time_seconds
+
+
+def to_seconds(time : str | int) -> int:
+    """
+    Returns a service day time, HH:MM:SS or seconds, in seconds.
+    """
+    if isinstance(time, (int, np.integer)):
+        return int(time)
+    seconds = int(gtfs_time_to_seconds(pd.Series([time]))[0])
+    assert seconds >= 0, f"Time must be HH:MM:SS or seconds, got {time}"
+    return seconds
+
+
+def build_transit_network(
+        feed : dict[str, pd.DataFrame],
+        date : str | datetime.date = None,
+        max_walk_distance : float = 400.0,
+        walking_speed : float = WALKING_SPEED,
+        detour_factor : float = DETOUR_FACTOR,
+        cache_dir : str = None,
+    ) -> dict[str, np.ndarray]:
+    """
+    Returns the index used by `get_isochrone` for a service date, as a dictionary of numpy arrays:
+
+        {
+            'dep_stop', 'arr_stop', 'dep_time', 'arr_time', 'trip': one element per connection, i.e. a vehicle going from one stop
+                to the next, sorted by dep_time,
+            'transfer_indptr', 'transfer_to', 'transfer_seconds': the walking transfers, see `get_transfer_graph`,
+            'stop_lat', 'stop_lon': the coordinates of each stop_index,
+            'walking': [walking_speed, detour_factor],
+        }
+
+    Only plain numpy arrays are used, so the network can be pickled to, or shared between, worker processes.
+
+    Parameters:
+    - feed: The output of `build_unified_feed`.
+    - date: The service date, see `get_active_services`. If None, all trips are included.
+    - max_walk_distance: Distance in metres of the walking transfers between stops, see `build_transfers`.
+    - cache_dir: Directory to cache the transfers in, see `build_transfers`.
+    """
+    stops = feed['stops']
+    n_stops = int(stops['stop_index'].max()) + 1 if len(stops) > 0 else 0
+    stop_lat = np.full(n_stops, np.nan)
+    stop_lon = np.full(n_stops, np.nan)
+    stop_lat[stops['stop_index'].to_numpy()] = stops['stop_lat'].to_numpy()
+    stop_lon[stops['stop_index'].to_numpy()] = stops['stop_lon'].to_numpy()
+
+    stop_times = feed['stop_times']
+    _, positions = get_active_trips(feed, date)
+    rows = np.flatnonzero(positions >= 0)
+    rows = rows[np.lexsort((stop_times['stop_sequence'].to_numpy()[rows], positions[rows]))]
+    trip = positions[rows]
+    stop = stop_times['stop_index'].to_numpy()[rows]
+    arrival = get_stop_time_seconds(stop_times, 'arrival')[rows]
+    departure = get_stop_time_seconds(stop_times, 'departure')[rows]
+
+    # A connection from each stop to the next stop of the same trip
+    valid = (trip[:-1] == trip[1:]) & (departure[:-1] >= 0) & (arrival[1:] >= 0) & (stop[:-1] >= 0) & (stop[1:] >= 0)
+    order = np.argsort(departure[:-1][valid], kind='stable')
+
+    transfers = build_transfers(stops, max_distance=max_walk_distance, walking_speed=walking_speed, detour_factor=detour_factor, cache_dir=cache_dir)
+    transfer_indptr, transfer_to, transfer_seconds = get_transfer_graph(transfers, n_stops)
+
+    return {
+        'dep_stop': stop[:-1][valid][order].astype(np.int32),
+        'arr_stop': stop[1:][valid][order].astype(np.int32),
+        'dep_time': departure[:-1][valid][order].astype(np.int32),
+        'arr_time': arrival[1:][valid][order].astype(np.int32),
+        'trip': trip[:-1][valid][order].astype(np.int32),
+        'transfer_indptr': transfer_indptr,
+        'transfer_to': transfer_to.astype(np.int32),
+        'transfer_seconds': transfer_seconds.astype(np.int32),
+        'stop_lat': stop_lat,
+        'stop_lon': stop_lon,
+        'walking': np.array([walking_speed, detour_factor]),
+    }
+
+
+def get_origin_stops(
+        network : dict[str, np.ndarray],
+        origin : int | tuple[float, float],
+        access_distance : float = 800.0,
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the stops an origin starts from and the seconds to walk to each: the stop itself for a stop_index,
+    or the stops within access_distance metres of a (lat, lon) coordinate.
+    """
+    if isinstance(origin, (int, np.integer)):
+        return np.array([origin], dtype=np.int32), np.zeros(1, dtype=np.int32)
+    walking_speed, detour_factor = network['walking']
+    _, stops, distance = get_pairs_within_distance(
+        network['stop_lat'], network['stop_lon'], access_distance,
+        query_lat=np.array([origin[0]]), query_lon=np.array([origin[1]]),
+    )
+    return stops.astype(np.int32), np.ceil(distance * detour_factor / walking_speed).astype(np.int32)
+
+
+def scan_connections(
+        network : dict[str, np.ndarray],
+        origin_stops : np.ndarray,
+        origin_seconds : np.ndarray,
+        departure_time : int,
+        max_seconds : int,
+    ) -> np.ndarray:
+    """
+    Returns the earliest arrival time at each stop, leaving the origin stops at departure_time plus their walking seconds,
+    with a connection scan over the connections departing within max_seconds, and walking transfers between stops.
+    Stops that cannot be reached within max_seconds are -1.
+
+    One walking transfer is made from each origin stop and after each vehicle arrival. Vehicle arrivals are kept apart from walking arrivals,
+    so a stop reached on foot first still walks on from a later vehicle arrival.
+    """
+    n_stops = len(network['stop_lat'])
+    end_time = departure_time + max_seconds
+    unreached = end_time + 1
+    earliest = [unreached] * n_stops
+    ridden = [unreached] * n_stops
+    indptr = network['transfer_indptr'].tolist()
+    transfer_to = network['transfer_to']
+    transfer_seconds = network['transfer_seconds']
+
+    def reach(stop, time):
+        if time < ridden[stop]:
+            ridden[stop] = time
+            if time < earliest[stop]:
+                earliest[stop] = time
+            start, end = indptr[stop], indptr[stop + 1]
+            if start < end:
+                for to_stop, seconds in zip(transfer_to[start:end].tolist(), transfer_seconds[start:end].tolist()):
+                    if time + seconds < earliest[to_stop]:
+                        earliest[to_stop] = time + seconds
+
+    for stop, seconds in zip(origin_stops.tolist(), origin_seconds.tolist()):
+        reach(stop, departure_time + seconds)
+
+    # Connections are sorted by departure time, so only the window [departure_time, end_time] is scanned
+    lo = np.searchsorted(network['dep_time'], departure_time, side='left')
+    hi = np.searchsorted(network['dep_time'], end_time, side='right')
+    boarded = set()
+    for dep_stop, arr_stop, dep_time, arr_time, trip in zip(
+        network['dep_stop'][lo:hi].tolist(),
+        network['arr_stop'][lo:hi].tolist(),
+        network['dep_time'][lo:hi].tolist(),
+        network['arr_time'][lo:hi].tolist(),
+        network['trip'][lo:hi].tolist(),
+    ):
+        if trip in boarded or earliest[dep_stop] <= dep_time:
+            boarded.add(trip)
+            if arr_time <= end_time:
+                reach(arr_stop, arr_time)
+
+    earliest = np.array(earliest, dtype=np.int64)
+    return np.where(earliest <= end_time, earliest, -1)
+
+
+def get_isochrone(
+        network : dict[str, np.ndarray],
+        origin : int | tuple[float, float],
+        departure_time : str | int = '08:00:00',
+        max_minutes : float = 30.0,
+        departure_window_minutes : float = 0.0,
+        departure_step_minutes : float = 5.0,
+        access_distance : float = 800.0,
+    ) -> pd.DataFrame:
+    """
+    Returns the stops reachable from an origin within max_minutes by transit and walking, as a DataFrame with columns
+    stop_index, stop_lat, stop_lon, travel_seconds, median_travel_seconds and walk_radius, sorted by travel_seconds.
+
+    With a departure window, a search is run for every departure_step_minutes from departure_time to departure_time + departure_window_minutes.
+    travel_seconds is the shortest travel time over those departures, and median_travel_seconds the median, counting departures that
+    do not reach the stop as taking longer than max_minutes. walk_radius is how far, in straight-line metres, one can walk from the stop
+    in the time left; circles of walk_radius around the stops make up the isochrone polygon, see `get_isochrone_geojson`.
+
+    Parameters:
+    - network: The output of `build_transit_network`.
+    - origin: A stop_index, or a (lat, lon) coordinate.
+    - departure_time: Service day time, HH:MM:SS or seconds.
+    - access_distance: Distance in metres one walks from a coordinate origin to the first stop.
+    """
+    departure_time = to_seconds(departure_time)
+    max_seconds = int(max_minutes * 60)
+    origin_stops, origin_seconds = get_origin_stops(network, origin, access_distance=access_distance)
+    departure_times = np.arange(departure_time, departure_time + int(departure_window_minutes * 60) + 1, max(int(departure_step_minutes * 60), 1))
+
+    travel_seconds = np.empty((len(departure_times), len(network['stop_lat'])), dtype=np.int64)
+    for k, time in enumerate(departure_times.tolist()):
+        earliest = scan_connections(network, origin_stops, origin_seconds, time, max_seconds)
+        travel_seconds[k] = np.where(earliest >= 0, earliest - time, max_seconds + 1)
+    best = travel_seconds.min(axis=0)
+    stops = np.flatnonzero(best <= max_seconds)
+    median = np.median(travel_seconds[:, stops], axis=0)
+
+    walking_speed, detour_factor = network['walking']
+    isochrone = pd.DataFrame({
+        'stop_index': stops.astype(np.int32),
+        'stop_lat': network['stop_lat'][stops],
+        'stop_lon': network['stop_lon'][stops],
+        'travel_seconds': best[stops].astype(np.int32),
+        'median_travel_seconds': np.where(median <= max_seconds, median, np.nan),
+        'walk_radius': (max_seconds - best[stops]) * walking_speed / detour_factor,
+    })
+    return isochrone.sort_values('travel_seconds', kind='stable', ignore_index=True)
+
+
+def get_isochrone_geojson(isochrone : pd.DataFrame, n_points : int = 24, max_walk_radius : float = 800.0) -> dict:
+    """
+    Returns an isochrone as a GeoJSON FeatureCollection, with a circle polygon of walk_radius metres, up to max_walk_radius,
+    around each reachable stop, and the stop_index and travel_seconds as properties.
+    Merge the circles, e.g. with shapely.unary_union, to get the isochrone outline.
+    """
+    angles = np.linspace(0, 2 * np.pi, n_points, endpoint=False)
+    radius = np.minimum(isochrone['walk_radius'].to_numpy(), max_walk_radius)[:, None]
+    lat = isochrone['stop_lat'].to_numpy()[:, None]
+    lon = isochrone['stop_lon'].to_numpy()[:, None]
+    ring_lat = lat + radius * np.sin(angles) / METRES_PER_DEGREE
+    ring_lon = lon + radius * np.cos(angles) / (METRES_PER_DEGREE * np.cos(np.radians(lat)))
+
+    features = []
+    for k, (stop_index, travel_seconds) in enumerate(zip(isochrone['stop_index'].tolist(), isochrone['travel_seconds'].tolist())):
+        ring = np.stack([ring_lon[k], ring_lat[k]], axis=1).round(6).tolist()
+        features.append({
+            'type': 'Feature',
+            'geometry': {'type': 'Polygon', 'coordinates': [ring + ring[:1]]},
+            'properties': {'stop_index': stop_index, 'travel_seconds': travel_seconds},
+        })
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+_worker_network = None
+
+
+def _init_isochrone_worker(network : dict[str, np.ndarray]):
+    global _worker_network
+    _worker_network = network
+
+
+def _get_numbered_isochrone(network : dict[str, np.ndarray], args : tuple) -> pd.DataFrame:
+    origin_number, origin, kwargs = args
+    isochrone = get_isochrone(network, origin, **kwargs)
+    isochrone.insert(0, 'origin', origin_number)
+    return isochrone
+
+
+def _get_worker_isochrone(args : tuple) -> pd.DataFrame:
+    return _get_numbered_isochrone(_worker_network, args)
+
+
+def get_isochrones(
+        network : dict[str, np.ndarray],
+        origins : list[int | tuple[float, float]],
+        processes : int = None,
+        chunksize : int = 8,
+        **kwargs,
+    ) -> pd.DataFrame:
+    """
+    Returns the isochrones of many origins, see `get_isochrone`, concatenated with an origin column, the position of the origin in origins.
+
+    The origins are spread over a pool of processes, each given the network once when it starts.
+
+    Parameters:
+    - processes: Number of worker processes. Defaults to the number of CPUs. If 1, runs in this process.
+    - kwargs: Passed to `get_isochrone`, e.g. departure_time and max_minutes.
+    """
+    tasks = [(origin_number, origin, kwargs) for origin_number, origin in enumerate(origins)]
+    if processes == 1:
+        # The network is passed directly, so this process does not keep a reference to it after returning
+        results = [_get_numbered_isochrone(network, task) for task in tasks]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=processes, initializer=_init_isochrone_worker, initargs=(network,)) as executor:
+            results = list(executor.map(_get_worker_isochrone, tasks, chunksize=chunksize))
+    if not results:
+        return pd.DataFrame(columns=['origin', 'stop_index', 'stop_lat', 'stop_lon', 'travel_seconds', 'median_travel_seconds', 'walk_radius'])
+    return pd.concat(results, ignore_index=True)
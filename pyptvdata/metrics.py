@@ -0,0 +1,275 @@
+import bisect
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+
+# Upper bounds of the request latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float('inf'))
+
+PATHS_JSON_PATH = os.path.join(os.path.dirname(__file__), 'apiv3', 'paths.json')
+
+
+def _load_endpoint_templates() -> list[tuple[re.Pattern, str]]:
+    with open(PATHS_JSON_PATH) as f:
+        templates = list(json.load(f).keys())
+    # Templates with more literal segments are more specific, so they are matched first
+    templates.sort(key=lambda template: -sum(1 for segment in template.split('/') if not segment.startswith('{')))
+    patterns = []
+    for template in templates:
+        pattern = re.sub(r'\\\{[^/]*?\\\}', '[^/,]+', re.escape(template))
+        patterns.append((re.compile(f'^{pattern}$'), template))
+    return patterns
+
+
+ENDPOINT_TEMPLATES = _load_endpoint_templates()
+
+
+def get_endpoint_template(url_or_endpoint : str) -> str:
+    """
+    Returns the endpoint template of a request URL or endpoint, with IDs and the query string taken out.
+
+    PTV API paths are matched against the templates in `apiv3/paths.json`,
+    e.g. /v3/departures/route_type/0/stop/1071?max_results=5 becomes /v3/departures/route_type/{route_type}/stop/{stop_id}.
+    Other paths have their numeric segments replaced with {id}.
+    """
+    path = urllib.parse.urlsplit(url_or_endpoint).path
+    for pattern, template in ENDPOINT_TEMPLATES:
+        if pattern.match(path):
+            return template
+    return re.sub(r'/-?\d+(?=/|$)', '/{id}', path)
+
+
+@dataclass(slots=True)
+class RequestInfo:
+    """
+    A request made by PTVAPIClient or GTFSRClient, passed to the metrics hooks.
+    Pre-request hooks get it before the request is sent, with only client, method, url and endpoint_template set.
+    """
+    client: str
+    """
+    'ptvapi' or 'gtfsr'
+    """
+    method: str
+    url: str
+    endpoint_template: str
+    start_time: float = field(default_factory=time.time)
+    """
+    Unix time the request started, in seconds, for timestamps. Durations are measured from start_counter
+    """
+    start_counter: float = field(default_factory=time.perf_counter)
+    """
+    `time.perf_counter` when the request started, which unlike the wall clock does not jump when the system clock is adjusted
+    """
+    status_code: int | None = None
+    duration: float | None = None
+    """
+    Seconds from sending the request to receiving the whole response, including retries
+    """
+    response_bytes: int = 0
+    """
+    Length of the response body after content decoding, e.g. gunzipped, rather than the bytes on the wire
+    """
+    decode_duration: float = 0.0
+    """
+    Seconds spent decoding the response body
+    """
+    retries: int = 0
+    coalesced: bool = False
+    """
+    Whether the result was shared from an identical request in flight, rather than sent
+    """
+    error: BaseException | None = None
+
+    def get_elapsed(self) -> float:
+        """
+        Returns the seconds since the request started.
+        """
+        return time.perf_counter() - self.start_counter
+
+
+class _EndpointStats:
+    __slots__ = ('bucket_counts', 'duration_sum', 'count', 'status_counts', 'response_bytes', 'decode_duration', 'retries', 'coalesced', 'errors')
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(LATENCY_BUCKETS)
+        self.duration_sum = 0.0
+        self.count = 0
+        self.status_counts : dict[int, int] = {}
+        self.response_bytes = 0
+        self.decode_duration = 0.0
+        self.retries = 0
+        self.coalesced = 0
+        self.errors = 0
+
+
+def _escape_label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+    """
+    Collects client-side metrics for PTVAPIClient and GTFSRClient requests, per client and endpoint template.
+
+    Pass the same Metrics to several clients to aggregate them. Export them with `to_prometheus`,
+    or add hooks, e.g. `make_opentelemetry_hook`, to forward each request elsewhere.
+    """
+    def __init__(self):
+        self.pre_request_hooks : list[Callable[[RequestInfo], None]] = []
+        self.post_request_hooks : list[Callable[[RequestInfo], None]] = []
+        self._stats : dict[tuple[str, str], _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def add_pre_request_hook(self, hook : Callable[[RequestInfo], None]):
+        """
+        Adds a function that is called with the RequestInfo before each request is sent.
+        """
+        self.pre_request_hooks.append(hook)
+
+    def add_post_request_hook(self, hook : Callable[[RequestInfo], None]):
+        """
+        Adds a function that is called with the RequestInfo after each request, including failed and coalesced ones.
+        """
+        self.post_request_hooks.append(hook)
+
+    def start_request(self, client : str, method : str, url : str) -> RequestInfo:
+        """
+        Returns the RequestInfo for a new request and calls the pre-request hooks.
+        """
+        info = RequestInfo(client=client, method=method, url=url, endpoint_template=get_endpoint_template(url))
+        for hook in self.pre_request_hooks:
+            hook(info)
+        return info
+
+    def end_request(self, info : RequestInfo):
+        """
+        Records a finished request and calls the post-request hooks.
+        """
+        key = (info.client, info.endpoint_template)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _EndpointStats()
+            if info.coalesced:
+                stats.coalesced += 1
+            else:
+                stats.count += 1
+                if info.duration is not None:
+                    stats.duration_sum += info.duration
+                    stats.bucket_counts[bisect.bisect_left(LATENCY_BUCKETS, info.duration)] += 1
+                if info.status_code is not None:
+                    stats.status_counts[info.status_code] = stats.status_counts.get(info.status_code, 0) + 1
+                if info.error is not None:
+                    stats.errors += 1
+                stats.response_bytes += info.response_bytes
+                stats.decode_duration += info.decode_duration
+                stats.retries += info.retries
+        for hook in self.post_request_hooks:
+            hook(info)
+
+    def get_coalesced_ratio(self) -> float:
+        """
+        Returns the share of get_data calls that were served by an identical request already in flight.
+        """
+        with self._lock:
+            coalesced = sum(stats.coalesced for stats in self._stats.values())
+            total = coalesced + sum(stats.count for stats in self._stats.values())
+        return coalesced / total if total > 0 else 0.0
+
+    def to_dict(self) -> dict[tuple[str, str], dict]:
+        """
+        Returns the metrics keyed by (client, endpoint template).
+        """
+        with self._lock:
+            return {
+                key: {
+                    'count': stats.count,
+                    'errors': stats.errors,
+                    'status_counts': dict(stats.status_counts),
+                    'duration_sum': stats.duration_sum,
+                    'duration_mean': stats.duration_sum / stats.count if stats.count > 0 else None,
+                    'response_bytes': stats.response_bytes,
+                    'decode_duration': stats.decode_duration,
+                    'retries': stats.retries,
+                    'coalesced': stats.coalesced,
+                }
+                for key, stats in self._stats.items()
+            }
+
+    def to_prometheus(self, prefix : str = 'pyptvdata') -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        lines = [
+            f'# HELP {prefix}_request_duration_seconds Request latency, including retries.',
+            f'# TYPE {prefix}_request_duration_seconds histogram',
+        ]
+        counters = {
+            'requests_total': ('Requests sent, by HTTP status.', []),
+            'request_errors_total': ('Requests that failed, either without a response or with an HTTP error status.', []),
+            'response_bytes_total': ('Response body bytes after content decoding, not bytes on the wire.', []),
+            'decode_duration_seconds_total': ('Time spent decoding response bodies.', []),
+            'retries_total': ('Retries made by the transport.', []),
+            'coalesced_requests_total': ('Calls served by an identical request already in flight.', []),
+        }
+        with self._lock:
+            for (client, endpoint_template), stats in sorted(self._stats.items()):
+                labels = f'client="{_escape_label(client)}",endpoint="{_escape_label(endpoint_template)}"'
+                cumulative = 0
+                for bound, bucket_count in zip(LATENCY_BUCKETS, stats.bucket_counts):
+                    cumulative += bucket_count
+                    le = '+Inf' if bound == float('inf') else repr(bound)
+                    lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f'{prefix}_request_duration_seconds_sum{{{labels}}} {stats.duration_sum}')
+                lines.append(f'{prefix}_request_duration_seconds_count{{{labels}}} {stats.count}')
+
+                for status_code, status_count in sorted(stats.status_counts.items()):
+                    counters['requests_total'][1].append(f'{{{labels},status="{status_code}"}} {status_count}')
+                counters['request_errors_total'][1].append(f'{{{labels}}} {stats.errors}')
+                counters['response_bytes_total'][1].append(f'{{{labels}}} {stats.response_bytes}')
+                counters['decode_duration_seconds_total'][1].append(f'{{{labels}}} {stats.decode_duration}')
+                counters['retries_total'][1].append(f'{{{labels}}} {stats.retries}')
+                counters['coalesced_requests_total'][1].append(f'{{{labels}}} {stats.coalesced}')
+
+        for name, (description, samples) in counters.items():
+            lines.append(f'# HELP {prefix}_{name} {description}')
+            lines.append(f'# TYPE {prefix}_{name} counter')
+            lines.extend(f'{prefix}_{name}{sample}' for sample in samples)
+
+        return '\n'.join(lines) + '\n'
+
+
+def make_opentelemetry_hook(tracer) -> Callable[[RequestInfo], None]:
+    """
+    Returns a post-request hook that records each request as an OpenTelemetry span.
+
+    Parameters:
+    - tracer: An `opentelemetry.trace.Tracer`, e.g. `opentelemetry.trace.get_tracer('pyptvdata')`.
+    """
+    def hook(info : RequestInfo):
+        start_time_ns = int(info.start_time * 1e9)
+        span = tracer.start_span(
+            f'{info.method} {info.endpoint_template}',
+            start_time=start_time_ns,
+            attributes={
+                'http.request.method': info.method,
+                'url.full': info.url,
+                'url.template': info.endpoint_template,
+                'pyptvdata.client': info.client,
+                'pyptvdata.coalesced': info.coalesced,
+                'pyptvdata.retries': info.retries,
+                'pyptvdata.response_bytes': info.response_bytes,
+                'pyptvdata.decode_duration': info.decode_duration,
+            },
+        )
+        if info.status_code is not None:
+            span.set_attribute('http.response.status_code', info.status_code)
+        if info.error is not None:
+            span.record_exception(info.error)
+        span.end(end_time=start_time_ns + int((info.duration or 0.0) * 1e9))
+    return hook
@@ -0,0 +1,188 @@
+import json
+import os
+import zipfile
+import numpy as np
+import pandas as pd
+
+from .gtfs import open_gtfs_zip, get_mode_ids, open_google_transit_zip, read_gtfs_table, check_gtfs_filters
+
+
+MANIFEST_FILE_NAME = 'manifest.json'
+
+MANIFEST_VERSION = 1
+
+
+def get_codes_dtype(n_categories : int) -> np.dtype:
+    """
+    Returns the smallest integer dtype for dictionary codes of n_categories, the same one pandas picks for a Categorical,
+    so that codes loaded from disk are used without a copy.
+    """
+    for dtype in [np.int8, np.int16, np.int32]:
+        if n_categories < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def write_mirror_table(df : pd.DataFrame, table_dir : str) -> dict:
+    """
+    Writes a DataFrame as one uncompressed .npy file per column, and returns its manifest entry.
+
+    Numeric columns are written as they are. Text columns are dictionary encoded, as codes in {column}.npy
+    and the distinct values in {column}.categories.npy, with code -1 for missing values.
+    """
+    os.makedirs(table_dir, exist_ok=True)
+    columns = {}
+    for column in df.columns:
+        values = df[column]
+        if pd.api.types.is_numeric_dtype(values.dtype):
+            np.save(os.path.join(table_dir, f'{column}.npy'), values.to_numpy())
+            columns[column] = {'encoding': 'plain', 'dtype': values.dtype.str}
+        else:
+            codes, categories = pd.factorize(values)
+            codes = codes.astype(get_codes_dtype(len(categories)))
+            np.save(os.path.join(table_dir, f'{column}.npy'), codes)
+            np.save(os.path.join(table_dir, f'{column}.categories.npy'), categories.to_numpy(dtype=str))
+            columns[column] = {'encoding': 'dictionary', 'dtype': codes.dtype.str, 'categories': len(categories)}
+    return {'rows': len(df), 'columns': columns}
+
+
+def read_mirror_manifest(mirror_dir : str) -> dict | None:
+    """
+    Returns the manifest of a mirror directory, or None if there is no mirror there.
+    """
+    manifest_path = os.path.join(mirror_dir, MANIFEST_FILE_NAME)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def materialize_gtfs_zip_obj(
+        gtfs_zip : zipfile.ZipFile,
+        mirror_dir : str,
+        modes : list[str] | str = None,
+        tables : list[str] | str = None,
+    ) -> dict:
+    """
+    Unpacks a gtfs.zip object into a mirror directory of uncompressed columnar files, and returns its manifest.
+
+    The mirror is laid out as {mirror_dir}/{mode_id}/{table_name}/{column}.npy, see `write_mirror_table`,
+    with a manifest.json recording the rows and column encodings of each table, and the CRC-32 and size of
+    each mode's google_transit.zip. Tables already in the mirror for a mode with the same CRC-32 and size are not unpacked again.
+    Modes and tables outside the modes and tables filters are kept in the manifest from previous runs,
+    except the tables of a mode whose google_transit.zip changed, which are stale.
+
+    The manifest is replaced atomically once all tables are written, but the table files are overwritten in place,
+    so if a run is interrupted, the mirror must not be read until the run is repeated.
+    """
+    modes, tables, _ = check_gtfs_filters(modes=modes, tables=tables)
+
+    previous_manifest = read_mirror_manifest(mirror_dir) or {}
+    previous_modes = previous_manifest.get('modes', {}) if previous_manifest.get('version') == MANIFEST_VERSION else {}
+
+    # Without a modes filter every mode in the gtfs.zip is unpacked, so modes no longer in it are dropped
+    manifest = {'version': MANIFEST_VERSION, 'modes': {mode_id: mode for mode_id, mode in previous_modes.items() if modes is not None and mode_id not in modes}}
+    for mode_id in get_mode_ids(gtfs_zip):
+        if modes is not None and mode_id not in modes:
+            continue
+
+        zip_info = gtfs_zip.getinfo(f"{mode_id}/google_transit.zip")
+        previous_mode = previous_modes.get(mode_id)
+        unchanged = previous_mode is not None and previous_mode['crc'] == zip_info.CRC and previous_mode['file_size'] == zip_info.file_size
+        mode_manifest = {
+            'crc': zip_info.CRC,
+            'file_size': zip_info.file_size,
+            # Whether every table of the google_transit.zip is in the mirror
+            'complete': unchanged and previous_mode.get('complete', False),
+            'tables': dict(previous_mode['tables']) if unchanged else {},
+        }
+        manifest['modes'][mode_id] = mode_manifest
+        if mode_manifest['complete'] or (tables is not None and all(table_name in mode_manifest['tables'] for table_name in tables)):
+            continue
+
+        with open_google_transit_zip(gtfs_zip, mode_id) as transit_zip:
+            for nested_file_name in transit_zip.namelist():
+                if not nested_file_name.endswith('.txt'):
+                    continue
+                table_name = nested_file_name.removesuffix('.txt')
+                if (tables is not None and table_name not in tables) or table_name in mode_manifest['tables']:
+                    continue
+                df = read_gtfs_table(transit_zip, table_name)
+                mode_manifest['tables'][table_name] = write_mirror_table(df, os.path.join(mirror_dir, mode_id, table_name))
+                del df
+        mode_manifest['complete'] = tables is None
+
+    with open(os.path.join(mirror_dir, f'{MANIFEST_FILE_NAME}.tmp'), 'w') as f:
+        json.dump(manifest, f, indent=4)
+    os.replace(os.path.join(mirror_dir, f'{MANIFEST_FILE_NAME}.tmp'), os.path.join(mirror_dir, MANIFEST_FILE_NAME))
+    return manifest
+
+
+def materialize_gtfs_zip(
+        url_or_path : str = "http://data.ptv.vic.gov.au/downloads/gtfs.zip",
+        mirror_dir : str = 'gtfs_mirror',
+        modes : list[str] | str = None,
+        tables : list[str] | str = None,
+    ) -> dict:
+    """
+    Unpacks a gtfs.zip file from a URL or local path into a mirror directory, see `materialize_gtfs_zip_obj`.
+    """
+    os.makedirs(mirror_dir, exist_ok=True)
+    with open_gtfs_zip(url_or_path) as gtfs_zip:
+        return materialize_gtfs_zip_obj(gtfs_zip, mirror_dir, modes=modes, tables=tables)
+
+
+def load_mirror_column(mirror_dir : str, mode_id : str, table_name : str, column : str) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Returns a column of a mirror table as a read-only memory-mapped array, without copying or decompressing it,
+    and the distinct values its codes refer to if it is dictionary encoded (None otherwise).
+    """
+    table_dir = os.path.join(mirror_dir, mode_id, table_name)
+    values = np.load(os.path.join(table_dir, f'{column}.npy'), mmap_mode='r')
+    categories_path = os.path.join(table_dir, f'{column}.categories.npy')
+    categories = np.load(categories_path) if os.path.exists(categories_path) else None
+    return values, categories
+
+
+def read_gtfs_mirror(
+        mirror_dir : str = 'gtfs_mirror',
+        modes : list[str] | str = None,
+        tables : list[str] | str = None,
+        columns : dict[str, list[str]] = None,
+        categorical : bool = True,
+    ) -> dict[str, dict[str, pd.DataFrame]]:
+    """
+    Reads a mirror directory made by `materialize_gtfs_zip` and returns a dictionary of pandas DataFrames,
+    structured like `read_gtfs_zip`, with the same modes, tables and columns filters.
+
+    Numeric columns are memory-mapped without a copy. Text columns are returned as Categoricals whose codes are
+    memory-mapped, or if categorical is False, decoded to object columns like `read_gtfs_zip`.
+    """
+    modes, tables, columns = check_gtfs_filters(modes=modes, tables=tables, columns=columns)
+    manifest = read_mirror_manifest(mirror_dir)
+    assert manifest is not None, f"No mirror manifest in {mirror_dir}, use materialize_gtfs_zip first"
+
+    DFK = {}
+    for mode_id, mode_manifest in manifest['modes'].items():
+        if modes is not None and mode_id not in modes:
+            continue
+        DFK[mode_id] = {}
+        for table_name, table_manifest in mode_manifest['tables'].items():
+            if tables is not None and table_name not in tables:
+                continue
+            table_columns = columns.get(table_name) if columns is not None else None
+
+            data = {}
+            for column, column_manifest in table_manifest['columns'].items():
+                if table_columns is not None and column not in table_columns:
+                    continue
+                values, categories = load_mirror_column(mirror_dir, mode_id, table_name, column)
+                if column_manifest['encoding'] == 'plain':
+                    data[column] = values
+                    continue
+                dtype = pd.CategoricalDtype(pd.Index(categories, dtype=object))
+                values = pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+                data[column] = values if categorical else np.asarray(values)
+
+            DFK[mode_id][table_name] = pd.DataFrame(data, copy=False)
+    return DFK
@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+
+from .unified import get_key_column, get_id_values, get_stop_time_seconds
+
+
+def get_ranges(starts : np.ndarray, counts : np.ndarray) -> np.ndarray:
+    """
+    Returns the concatenated index ranges [start, start + count) for each start and count.
+    """
+    total = counts.sum()
+    return np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+
+
+def hash_trip_rows(prefix : np.ndarray, values : np.ndarray, starts : np.ndarray, counts : np.ndarray) -> np.ndarray:
+    """
+    Returns dense codes for trips by the exact bytes of their prefix row followed by their rows of values,
+    i.e. trips with the same prefix and the same sequence of values get the same code, numbered in order of first appearance.
+
+    Parameters:
+    - prefix: An int32 array with one row per trip.
+    - values: An int32 array with one row per stop_times row, the rows of trip k being starts[k]:starts[k] + counts[k].
+    """
+    prefix = np.ascontiguousarray(prefix, dtype=np.int32).reshape(len(starts), -1)
+    values = np.ascontiguousarray(values, dtype=np.int32).reshape(len(values), -1)
+    prefix_size = prefix.itemsize * prefix.shape[1]
+    row_size = values.itemsize * values.shape[1]
+    prefix_bytes = prefix.tobytes()
+    value_bytes = values.tobytes()
+    keys = [
+        prefix_bytes[k * prefix_size:(k + 1) * prefix_size] + value_bytes[start * row_size:(start + count) * row_size]
+        for k, (start, count) in enumerate(zip(starts.tolist(), counts.tolist()))
+    ]
+    return pd.factorize(pd.Series(keys, dtype=object))[0].astype(np.int32)
+
+
+def build_trip_patterns(feed : dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    """
+    Compresses the stop_times of a feed into trip patterns, and returns a dictionary of pandas DataFrames:
+
+        {
+            'patterns': pattern_id, route, direction_id, n_stops, n_trips,
+            'pattern_stops': pattern_id, position, stop,
+            'timings': timing_id, pattern_id, position, arrival_offset, departure_offset,
+            'trips': trip, pattern_id, timing_id, start_seconds, template_id,
+            'templates': template_id, pattern_id, timing_id, service, start_seconds, end_seconds, headway_seconds, n_trips,
+        }
+
+    where route, direction_id, stop, trip and service are the feed's key columns, e.g. stop_id, or stop_index for `build_unified_feed` output.
+
+    A pattern is the exact sequence of stops of a trip, within a route and direction, so each pattern's stops are stored once.
+    A timing is the sequence of arrival and departure offsets of a pattern, in seconds from the trip's start_seconds (-1 for missing times),
+    so each trip is stored as a pattern, a timing and a start time. Trips of the same pattern, timing and service that start at a constant headway
+    are grouped into a template, whose trips start at start_seconds + k * headway_seconds for k < n_trips, like GTFS frequencies.txt.
+    Trips without stop_times are left out. See `get_stop_times_from_patterns` to expand the patterns back to stop_times.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], or of `build_unified_feed`.
+    """
+    trips = feed['trips']
+    stop_times = feed['stop_times']
+    trip_key = get_key_column(trips, 'trip')
+    route_key = get_key_column(trips, 'route')
+    service_key = get_key_column(trips, 'service')
+    stop_key = get_key_column(stop_times, 'stop')
+
+    # Sort the stop_times by trip then stop_sequence, so each trip is a contiguous run of rows
+    positions = pd.Index(get_id_values(trips, trip_key), dtype=object).get_indexer(get_id_values(stop_times, trip_key))
+    rows = np.flatnonzero(positions >= 0)
+    rows = rows[np.lexsort((stop_times['stop_sequence'].to_numpy()[rows], positions[rows]))]
+    trip_positions = positions[rows]
+    stop_codes, stop_values = pd.factorize(np.asarray(stop_times[stop_key])[rows], use_na_sentinel=False)
+    arrival_seconds = get_stop_time_seconds(stop_times, 'arrival')[rows]
+    departure_seconds = get_stop_time_seconds(stop_times, 'departure')[rows]
+
+    starts = np.flatnonzero(np.r_[True, trip_positions[1:] != trip_positions[:-1]]) if len(rows) > 0 else np.empty(0, dtype=np.int64)
+    counts = np.diff(np.r_[starts, len(rows)])
+    trip_rows = trip_positions[starts]
+
+    route_values = np.asarray(trips[route_key])[trip_rows]
+    direction_values = np.asarray(trips['direction_id'])[trip_rows] if 'direction_id' in trips.columns else np.zeros(len(trip_rows))
+    route_codes = pd.factorize(route_values, use_na_sentinel=False)[0]
+    direction_codes = pd.factorize(direction_values, use_na_sentinel=False)[0]
+    pattern_ids = hash_trip_rows(np.stack([route_codes, direction_codes], axis=1), stop_codes, starts, counts)
+
+    # Offsets from the first departure, or the first arrival if the first stop has no departure time
+    start_seconds = np.where(departure_seconds[starts] >= 0, departure_seconds[starts], arrival_seconds[starts])
+    trip_start_seconds = np.repeat(start_seconds, counts)
+    arrival_offsets = np.where(arrival_seconds >= 0, arrival_seconds - trip_start_seconds, -1)
+    departure_offsets = np.where(departure_seconds >= 0, departure_seconds - trip_start_seconds, -1)
+    timing_ids = hash_trip_rows(pattern_ids, np.stack([arrival_offsets, departure_offsets], axis=1), starts, counts)
+
+    n_patterns = pattern_ids.max() + 1 if len(pattern_ids) > 0 else 0
+    _, pattern_first = np.unique(pattern_ids, return_index=True)
+    pattern_rows = get_ranges(starts[pattern_first], counts[pattern_first])
+    patterns = pd.DataFrame({
+        'pattern_id': np.arange(n_patterns, dtype=np.int32),
+        route_key: route_values[pattern_first],
+        'direction_id': direction_values[pattern_first],
+        'n_stops': counts[pattern_first].astype(np.int32),
+        'n_trips': np.bincount(pattern_ids, minlength=n_patterns).astype(np.int32),
+    })
+    pattern_stops = pd.DataFrame({
+        'pattern_id': np.repeat(np.arange(n_patterns, dtype=np.int32), counts[pattern_first]),
+        'position': (pattern_rows - np.repeat(starts[pattern_first], counts[pattern_first])).astype(np.int32),
+        stop_key: stop_values[stop_codes[pattern_rows]],
+    })
+
+    _, timing_first = np.unique(timing_ids, return_index=True)
+    timing_rows = get_ranges(starts[timing_first], counts[timing_first])
+    timings = pd.DataFrame({
+        'timing_id': np.repeat(np.arange(len(timing_first), dtype=np.int32), counts[timing_first]),
+        'pattern_id': np.repeat(pattern_ids[timing_first], counts[timing_first]),
+        'position': (timing_rows - np.repeat(starts[timing_first], counts[timing_first])).astype(np.int32),
+        'arrival_offset': arrival_offsets[timing_rows].astype(np.int32),
+        'departure_offset': departure_offsets[timing_rows].astype(np.int32),
+    })
+
+    # Templates: sort the trips by (pattern, timing, service, start). A template's second trip sets its headway,
+    # and a trip whose gap from the previous trip differs from it starts a new template, so starts 0, 10, 20, 25, 35, 45 give [0, 10, 20], [25, 35, 45]
+    service_values = np.asarray(trips[service_key])[trip_rows]
+    service_codes = pd.factorize(service_values, use_na_sentinel=False)[0]
+    order = np.lexsort((start_seconds, service_codes, timing_ids))
+    group_start = np.r_[True, (timing_ids[order][1:] != timing_ids[order][:-1]) | (service_codes[order][1:] != service_codes[order][:-1])][:len(order)]
+    headways = np.r_[0, np.diff(start_seconds[order])][:len(order)]
+    new_template = np.zeros(len(order), dtype=bool)
+    template_headway = None
+    for k, (is_group_start, headway) in enumerate(zip(group_start.tolist(), headways.tolist())):
+        if is_group_start or (template_headway is not None and headway != template_headway):
+            new_template[k] = True
+            template_headway = None
+        elif template_headway is None:
+            template_headway = headway
+    template_ids_sorted = np.cumsum(new_template) - 1
+    template_ids = np.empty(len(order), dtype=np.int32)
+    template_ids[order] = template_ids_sorted
+
+    template_starts = np.flatnonzero(new_template)
+    template_counts = np.diff(np.r_[template_starts, len(order)])
+    first_trips = order[template_starts]
+    templates = pd.DataFrame({
+        'template_id': np.arange(len(template_starts), dtype=np.int32),
+        'pattern_id': pattern_ids[first_trips],
+        'timing_id': timing_ids[first_trips],
+        service_key: service_values[first_trips],
+        'start_seconds': start_seconds[first_trips],
+        'end_seconds': start_seconds[order[template_starts + template_counts - 1]],
+        'headway_seconds': np.where(template_counts > 1, headways[np.minimum(template_starts + 1, len(order) - 1)], 0).astype(np.int32),
+        'n_trips': template_counts.astype(np.int32),
+    })
+
+    trips_table = pd.DataFrame({
+        trip_key: np.asarray(trips[trip_key])[trip_rows],
+        'pattern_id': pattern_ids,
+        'timing_id': timing_ids,
+        'start_seconds': start_seconds.astype(np.int32),
+        'template_id': template_ids,
+    })
+
+    return {
+        'patterns': patterns,
+        'pattern_stops': pattern_stops,
+        'timings': timings,
+        'trips': trips_table,
+        'templates': templates,
+    }
+
+
+def get_stop_times_from_patterns(patterns : dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Expands the output of `build_trip_patterns` back into stop_times rows, sorted by trip and position, with columns
+    trip, stop, stop_position (the 0-based position in the trip), arrival_seconds and departure_seconds (-1 for missing times).
+    """
+    trips = patterns['trips']
+    timings = patterns['timings']
+    pattern_stops = patterns['pattern_stops']
+    trip_key = trips.columns[0]
+    stop_key = pattern_stops.columns[2]
+
+    timing_ids = timings['timing_id'].to_numpy()
+    timing_starts = np.flatnonzero(np.r_[True, timing_ids[1:] != timing_ids[:-1]]) if len(timing_ids) > 0 else np.empty(0, dtype=np.int64)
+    timing_counts = np.diff(np.r_[timing_starts, len(timing_ids)])
+    pattern_ids = pattern_stops['pattern_id'].to_numpy()
+    pattern_starts = np.flatnonzero(np.r_[True, pattern_ids[1:] != pattern_ids[:-1]]) if len(pattern_ids) > 0 else np.empty(0, dtype=np.int64)
+
+    trip_timings = trips['timing_id'].to_numpy()
+    counts = timing_counts[trip_timings]
+    timing_rows = get_ranges(timing_starts[trip_timings], counts)
+    pattern_rows = get_ranges(pattern_starts[trips['pattern_id'].to_numpy()], counts)
+    start_seconds = np.repeat(trips['start_seconds'].to_numpy(), counts)
+    arrival_offsets = timings['arrival_offset'].to_numpy()[timing_rows]
+    departure_offsets = timings['departure_offset'].to_numpy()[timing_rows]
+
+    return pd.DataFrame({
+        trip_key: np.repeat(trips[trip_key].to_numpy(), counts),
+        stop_key: pattern_stops[stop_key].to_numpy()[pattern_rows],
+        'stop_position': timings['position'].to_numpy()[timing_rows],
+        'arrival_seconds': np.where(arrival_offsets >= 0, start_seconds + arrival_offsets, -1).astype(np.int32),
+        'departure_seconds': np.where(departure_offsets >= 0, start_seconds + departure_offsets, -1).astype(np.int32),
+    })
@@ -0,0 +1,309 @@
+import datetime
+from typing import Iterable
+import numpy as np
+import pandas as pd
+
+from .geo import haversine_distance
+from .gtfsr import get_latest_stop_time_updates
+from .services import WEEKDAYS, to_gtfs_date
+from .frequency import get_active_trips
+from .unified import get_key_column, get_id_values, get_stop_time_seconds
+
+
+DAY_TYPES = ['weekday', 'saturday', 'sunday']
+
+# The timezone of PTV's feeds, used if the feed has no agency_timezone
+DEFAULT_TIMEZONE = 'Australia/Melbourne'
+
+SEGMENT_SUMS = ['trips', 'scheduled_seconds', 'distance', 'observed_trips', 'actual_seconds', 'observed_distance', 'excess_seconds']
+
+
+def get_day_type(date : str | datetime.date) -> str:
+    """
+    Returns the day type of a service date: 'weekday', 'saturday' or 'sunday'.
+    """
+    weekday = WEEKDAYS[datetime.datetime.strptime(to_gtfs_date(date), '%Y%m%d').weekday()]
+    return weekday if weekday in DAY_TYPES else 'weekday'
+
+
+def get_feed_timezone(feed : dict[str, pd.DataFrame]) -> str:
+    """
+    Returns the agency_timezone of a feed, or DEFAULT_TIMEZONE if it has none.
+    """
+    agency = feed.get('agency')
+    if agency is not None and 'agency_timezone' in agency.columns:
+        timezones = agency['agency_timezone'].dropna().astype(str)
+        timezones = timezones[timezones != '']
+        if len(timezones) > 0:
+            return timezones.iloc[0]
+    return DEFAULT_TIMEZONE
+
+
+def get_service_day_starts(dates : np.ndarray, timezone : str) -> np.ndarray:
+    """
+    Returns the Unix time of the start of each service date, i.e. noon minus 12 hours in the timezone, as GTFS defines it,
+    so service day seconds stay correct on daylight saving changes.
+    """
+    noons = (pd.to_datetime(pd.Series(dates), format='%Y%m%d') + pd.Timedelta(hours=12)).dt.tz_localize(timezone)
+    return noons.astype('int64').to_numpy() // 10**9 - 12 * 3600
+
+
+def build_segments(feed : dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """
+    Explodes the trips of a feed into stop-to-stop segments between consecutive stops, and returns a DataFrame with one row per segment:
+
+        trip_code, segment_code, from_stop_code, to_stop_code, from_row, to_row, departure_seconds, arrival_seconds, distance
+
+    with integer codes rather than IDs, so a whole month can be aggregated in memory:
+    trip_code and the stop codes are positions in feed['trips'] and feed['stops'] (-1 for stops not in stops),
+    segment_code numbers the distinct (from_stop_code, to_stop_code) pairs,
+    and from_row and to_row are the positions of the segment's stop_times rows in the feed's stop_times.
+    Times are in seconds since the start of the service day (-1 if missing), and distance is in metres,
+    from shape_dist_traveled if both stops have it, else the straight-line distance between the stops.
+
+    Rows are sorted by trip_code and stop_sequence.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], or of `build_unified_feed`.
+    """
+    trips = feed['trips']
+    stops = feed['stops']
+    stop_times = feed['stop_times']
+    trip_key = get_key_column(trips, 'trip')
+    stop_key = get_key_column(stops, 'stop')
+
+    trip_codes = pd.Index(get_id_values(trips, trip_key), dtype=object).get_indexer(get_id_values(stop_times, trip_key))
+    rows = np.flatnonzero(trip_codes >= 0)
+    rows = rows[np.lexsort((stop_times['stop_sequence'].to_numpy()[rows], trip_codes[rows]))]
+    trip_codes = trip_codes[rows]
+    stop_codes = pd.Index(get_id_values(stops, stop_key), dtype=object).get_indexer(get_id_values(stop_times, stop_key)[rows])
+
+    # A segment joins each row to the next row of the same trip
+    same_trip = trip_codes[1:] == trip_codes[:-1]
+    from_rows = rows[:-1][same_trip]
+    to_rows = rows[1:][same_trip]
+    from_stop_codes = stop_codes[:-1][same_trip].astype(np.int32)
+    to_stop_codes = stop_codes[1:][same_trip].astype(np.int32)
+
+    departure_seconds = get_stop_time_seconds(stop_times, 'departure')
+    arrival_seconds = get_stop_time_seconds(stop_times, 'arrival')
+    segment_departure = np.where(departure_seconds[from_rows] >= 0, departure_seconds[from_rows], arrival_seconds[from_rows])
+    segment_arrival = np.where(arrival_seconds[to_rows] >= 0, arrival_seconds[to_rows], departure_seconds[to_rows])
+
+    stop_lat = np.append(stops['stop_lat'].to_numpy(dtype=np.float64), np.nan)
+    stop_lon = np.append(stops['stop_lon'].to_numpy(dtype=np.float64), np.nan)
+    distance = haversine_distance(stop_lat[from_stop_codes], stop_lon[from_stop_codes], stop_lat[to_stop_codes], stop_lon[to_stop_codes])
+    if 'shape_dist_traveled' in stop_times.columns:
+        shape_dist_traveled = stop_times['shape_dist_traveled'].to_numpy(dtype=np.float64)
+        shape_distance = shape_dist_traveled[to_rows] - shape_dist_traveled[from_rows]
+        distance = np.where(np.isnan(shape_distance), distance, shape_distance)
+
+    segment_codes = pd.factorize(from_stop_codes.astype(np.int64) * (len(stops) + 1) + to_stop_codes)[0]
+    return pd.DataFrame({
+        'trip_code': trip_codes[:-1][same_trip].astype(np.int32),
+        'segment_code': segment_codes.astype(np.int32),
+        'from_stop_code': from_stop_codes,
+        'to_stop_code': to_stop_codes,
+        'from_row': from_rows.astype(np.int64),
+        'to_row': to_rows.astype(np.int64),
+        'departure_seconds': segment_departure.astype(np.int32),
+        'arrival_seconds': segment_arrival.astype(np.int32),
+        'distance': distance,
+    })
+
+
+def get_update_trip_codes(feed : dict[str, pd.DataFrame], updates : pd.DataFrame, trip_index : pd.Index) -> np.ndarray:
+    """
+    Returns the position in feed['trips'] of the trip of each stop time update, -1 if it is not in the feed.
+    Updates are matched by the feed's trip key if they have it, else by trip_id, through feed['trip_ids'] for `build_unified_feed` output.
+    """
+    trip_key = get_key_column(feed['trips'], 'trip')
+    if trip_key in updates.columns:
+        return trip_index.get_indexer(get_id_values(updates, trip_key))
+    trip_ids = feed.get('trip_ids')
+    if trip_key != 'trip_id' and trip_ids is not None:
+        trip_map = pd.Series(trip_ids[trip_key].to_numpy(), index=get_id_values(trip_ids, 'trip_id'))
+        trip_map = trip_map[~trip_map.index.duplicated()]
+        values = pd.Index(trip_map.index, dtype=object).get_indexer(get_id_values(updates, 'trip_id'))
+        return np.where(values >= 0, trip_index.get_indexer(trip_map.to_numpy()[values]), -1)
+    return trip_index.get_indexer(get_id_values(updates, 'trip_id'))
+
+
+def get_actual_stop_seconds(
+        updates : pd.DataFrame,
+        update_trip_codes : np.ndarray,
+        day_start : int,
+        row_lookup : dict[str, np.ndarray],
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the actual arrival and departure times of each stop_times row on a service date, in seconds since the start of the service day,
+    NaN for rows without an update: the scheduled time plus the delay, or the update's Unix time minus day_start if it has no delay.
+
+    Parameters:
+    - updates: Stop time updates of the date, see `gtfsr.get_stop_time_updates`, matched to stop_times rows by trip and stop_sequence.
+    - update_trip_codes: The position in feed['trips'] of the trip of each update, see `get_update_trip_codes`.
+    - day_start: The Unix time of the start of the service day, see `get_service_day_starts`.
+    - row_lookup: The sorted (trip, stop_sequence) keys of the stop_times rows, their order, the key multiplier and the scheduled times.
+    """
+    sorted_keys = row_lookup['sorted_keys']
+    multiplier = int(row_lookup['multiplier'])
+    update_sequence = updates['stop_sequence'].to_numpy(dtype=np.int64)
+    update_keys = update_trip_codes * multiplier + update_sequence
+    matched = (update_trip_codes >= 0) & (update_sequence >= 0) & (update_sequence < multiplier)
+    if len(sorted_keys) > 0:
+        positions = np.minimum(np.searchsorted(sorted_keys, update_keys), len(sorted_keys) - 1)
+        matched &= sorted_keys[positions] == update_keys
+    else:
+        positions = np.zeros(len(update_keys), dtype=np.int64)
+        matched[:] = False
+    update_rows = row_lookup['order'][positions[matched]]
+
+    results = []
+    for event_name in ['arrival', 'departure']:
+        scheduled = row_lookup[event_name][update_rows].astype(np.float64)
+        scheduled[scheduled < 0] = np.nan
+        delay = updates[f'{event_name}_delay'].to_numpy(dtype=np.float64)[matched] if f'{event_name}_delay' in updates.columns else np.full(len(update_rows), np.nan)
+        time = updates[f'{event_name}_time'].to_numpy(dtype=np.float64)[matched] if f'{event_name}_time' in updates.columns else np.full(len(update_rows), np.nan)
+        actual = np.full(len(row_lookup['order']), np.nan)
+        actual[update_rows] = np.where(np.isnan(delay), time - day_start, scheduled + delay)
+        results.append(actual)
+    return results[0], results[1]
+
+
+def sum_by_key(keys : np.ndarray, values : dict[str, np.ndarray]) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Returns the distinct keys and the sums of each of the values by key.
+    """
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    return unique_keys, {name: np.bincount(inverse, weights=value, minlength=len(unique_keys)) for name, value in values.items()}
+
+
+def get_segment_speeds(
+        feed : dict[str, pd.DataFrame],
+        dates : list[str | datetime.date],
+        actuals : pd.DataFrame | Iterable[pd.DataFrame] = None,
+        day_types : dict[str, str] = None,
+        segments : pd.DataFrame = None,
+    ) -> pd.DataFrame:
+    """
+    Returns the scheduled and actual running times and speeds between consecutive stops, by segment, hour and day type,
+    as a DataFrame with columns:
+
+        from_stop, to_stop, day_type, hour, trips, distance, scheduled_seconds, scheduled_speed_kmh,
+        observed_trips, actual_seconds, actual_speed_kmh, excess_seconds
+
+    where from_stop and to_stop are the feed's stop key, e.g. stop_id, hour is the hour of the service day of the scheduled departure
+    (24 and over after midnight), trips and observed_trips count the scheduled trips and those with actual times,
+    distance and the seconds are means in metres and seconds, speeds are total distance over total time,
+    and excess_seconds is the mean of actual minus scheduled running time over the observed trips.
+
+    The segments of the feed are built once, see `build_segments`, then each service date and each chunk of actuals is aggregated into sums by
+    integer (segment, hour, day type) keys and merged, so only one chunk is in memory at a time.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], or of `build_unified_feed`.
+    - dates: The service dates to aggregate, see `services.to_gtfs_date`.
+    - actuals: Archived GTFS-R stop time updates, see `gtfsr.get_stop_time_updates`, as one DataFrame or an iterable of chunks,
+      e.g. one per service date, each holding every update of its trips. Trips are matched by trip_id (or the feed's trip key)
+      and stop_sequence, and only updates whose start_date is one of the dates are used. Within a chunk, the latest update by timestamp is kept.
+    - day_types: Day types of dates that differ from their weekday, e.g. {'20240311': 'sunday'} for a public holiday.
+    - segments: The output of `build_segments`, if already built.
+    """
+    if segments is None:
+        segments = build_segments(feed)
+    day_types = {to_gtfs_date(date): day_type for date, day_type in (day_types or {}).items()}
+    dates = [to_gtfs_date(date) for date in dates]
+    date_day_types = {date: DAY_TYPES.index(day_types.get(date, get_day_type(date))) for date in dates}
+    trip_index = pd.Index(get_id_values(feed['trips'], get_key_column(feed['trips'], 'trip')), dtype=object)
+    timezone = get_feed_timezone(feed)
+
+    trip_codes = segments['trip_code'].to_numpy()
+    segment_codes = segments['segment_code'].to_numpy().astype(np.int64)
+    from_rows = segments['from_row'].to_numpy()
+    to_rows = segments['to_row'].to_numpy()
+    departure_seconds = segments['departure_seconds'].to_numpy()
+    scheduled_seconds = (segments['arrival_seconds'].to_numpy() - departure_seconds).astype(np.float64)
+    scheduled_seconds[(departure_seconds < 0) | (segments['arrival_seconds'].to_numpy() < 0)] = np.nan
+    distance = segments['distance'].to_numpy()
+    hours = np.where(departure_seconds >= 0, departure_seconds // 3600, 0).astype(np.int64)
+    n_hours = int(hours.max()) + 1 if len(hours) > 0 else 1
+
+    def get_keys(day_type : int) -> np.ndarray:
+        return (segment_codes * n_hours + hours) * len(DAY_TYPES) + day_type
+
+    keys = np.empty(0, dtype=np.int64)
+    sums = {name: np.empty(0) for name in SEGMENT_SUMS}
+
+    def add(chunk_keys : np.ndarray, chunk_sums : dict[str, np.ndarray]):
+        nonlocal keys, sums
+        keys, sums = sum_by_key(np.concatenate([keys, chunk_keys]), {name: np.concatenate([sums[name], chunk_sums.get(name, np.zeros(len(chunk_keys)))]) for name in SEGMENT_SUMS})
+
+    # The scheduled running times of the trips of each date
+    trip_runs = {}
+    for date in dates:
+        active = np.zeros(len(trip_index) + 1, dtype=bool)
+        active_trips = get_active_trips(feed, date)[0]
+        active[trip_index.get_indexer(get_id_values(active_trips, get_key_column(active_trips, 'trip')))] = True
+        trip_runs[date] = active
+        rows = np.flatnonzero(active[trip_codes] & ~np.isnan(scheduled_seconds))
+        add(get_keys(date_day_types[date])[rows], {'trips': np.ones(len(rows)), 'scheduled_seconds': scheduled_seconds[rows], 'distance': distance[rows]})
+
+    # The actual running times, chunk by chunk, located by (trip, stop_sequence) packed into one sorted int64 key
+    stop_times = feed['stop_times']
+    stop_sequence = stop_times['stop_sequence'].to_numpy(dtype=np.int64)
+    multiplier = int(stop_sequence.max()) + 1 if len(stop_sequence) > 0 else 1
+    row_keys = trip_index.get_indexer(get_id_values(stop_times, get_key_column(stop_times, 'trip'))) * multiplier + stop_sequence
+    order = np.argsort(row_keys, kind='stable')
+    row_lookup = {
+        'sorted_keys': row_keys[order],
+        'order': order,
+        'multiplier': multiplier,
+        'arrival': get_stop_time_seconds(stop_times, 'arrival'),
+        'departure': get_stop_time_seconds(stop_times, 'departure'),
+    }
+    if actuals is None:
+        actuals = []
+    elif isinstance(actuals, pd.DataFrame):
+        actuals = [actuals]
+    for updates in actuals:
+        if 'timestamp' in updates.columns and 'trip_id' in updates.columns:
+            updates = get_latest_stop_time_updates(updates)
+        update_dates = updates['start_date'].astype(str).to_numpy()
+        update_trip_codes = get_update_trip_codes(feed, updates, trip_index)
+        for date in np.unique(update_dates):
+            if date not in trip_runs:
+                continue
+            on_date = update_dates == date
+            day_start = get_service_day_starts(np.array([date]), timezone)[0]
+            actual_arrival, actual_departure = get_actual_stop_seconds(updates[on_date], update_trip_codes[on_date], day_start, row_lookup)
+            actual_seconds = actual_arrival[to_rows] - np.where(np.isnan(actual_departure[from_rows]), actual_arrival[from_rows], actual_departure[from_rows])
+            rows = np.flatnonzero(trip_runs[date][trip_codes] & ~np.isnan(scheduled_seconds) & (actual_seconds >= 0))
+            add(get_keys(date_day_types[date])[rows], {
+                'observed_trips': np.ones(len(rows)),
+                'actual_seconds': actual_seconds[rows],
+                'observed_distance': distance[rows],
+                'excess_seconds': actual_seconds[rows] - scheduled_seconds[rows],
+            })
+
+    day_type_codes = keys % len(DAY_TYPES)
+    hours = keys // len(DAY_TYPES) % n_hours
+    first = np.unique(segment_codes, return_index=True)[1]
+    segment_stops = segments[['from_stop_code', 'to_stop_code']].to_numpy()[first[keys // len(DAY_TYPES) // n_hours]]
+    stop_values = np.append(get_id_values(feed['stops'], get_key_column(feed['stops'], 'stop')), None)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speeds = pd.DataFrame({
+            'from_stop': stop_values[segment_stops[:, 0]],
+            'to_stop': stop_values[segment_stops[:, 1]],
+            'day_type': pd.Categorical.from_codes(day_type_codes, categories=DAY_TYPES),
+            'hour': hours.astype(np.int16),
+            'trips': sums['trips'].astype(np.int64),
+            'distance': sums['distance'] / sums['trips'],
+            'scheduled_seconds': sums['scheduled_seconds'] / sums['trips'],
+            'scheduled_speed_kmh': np.where(sums['scheduled_seconds'] > 0, sums['distance'] / sums['scheduled_seconds'] * 3.6, np.nan),
+            'observed_trips': sums['observed_trips'].astype(np.int64),
+            'actual_seconds': sums['actual_seconds'] / sums['observed_trips'],
+            'actual_speed_kmh': np.where(sums['actual_seconds'] > 0, sums['observed_distance'] / sums['actual_seconds'] * 3.6, np.nan),
+            'excess_seconds': sums['excess_seconds'] / sums['observed_trips'],
+        })
+    return speeds
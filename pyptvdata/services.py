@@ -0,0 +1,56 @@
+import datetime
+import numpy as np
+import pandas as pd
+
+from .unified import get_id_values
+
+
+WEEKDAYS = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+
+def to_gtfs_date(date : str | datetime.date) -> str:
+    """
+    Returns a date as a GTFS date string, YYYYMMDD. Accepts a date, datetime, or a string in YYYYMMDD or YYYY-MM-DD form.
+    """
+    if isinstance(date, str):
+        date = date.replace('-', '')
+        assert len(date) == 8 and date.isdigit(), f"Date must be YYYYMMDD or YYYY-MM-DD, got {date}"
+        return date
+    return date.strftime('%Y%m%d')
+
+
+def get_active_services(feed : dict[str, pd.DataFrame], date : str | datetime.date) -> np.ndarray:
+    """
+    Returns the services that run on a service date, from calendar and calendar_dates, as an array of
+    service_id, or service_index for `build_unified_feed` output.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], or of `build_unified_feed`.
+    - date: The service date, see `to_gtfs_date`.
+    """
+    date = to_gtfs_date(date)
+    weekday = WEEKDAYS[datetime.datetime.strptime(date, '%Y%m%d').weekday()]
+    calendar = feed.get('calendar')
+    calendar_dates = feed.get('calendar_dates')
+    is_unified = any(table is not None and 'service_index' in table.columns for table in [calendar, calendar_dates])
+
+    def get_services(table : pd.DataFrame) -> np.ndarray:
+        return table['service_index'].to_numpy() if is_unified else get_id_values(table, 'service_id')
+
+    active = set()
+    if calendar is not None and len(calendar) > 0:
+        runs = (
+            (pd.to_numeric(calendar[weekday]).to_numpy() == 1)
+            & (calendar['start_date'].astype(str).to_numpy() <= date)
+            & (calendar['end_date'].astype(str).to_numpy() >= date)
+        )
+        active.update(get_services(calendar)[runs])
+
+    if calendar_dates is not None and len(calendar_dates) > 0:
+        services = get_services(calendar_dates)
+        on_date = calendar_dates['date'].astype(str).to_numpy() == date
+        exception_type = calendar_dates['exception_type'].astype(str).to_numpy()
+        active.update(services[on_date & (exception_type == '1')])
+        active.difference_update(services[on_date & (exception_type == '2')])
+
+    return np.array(sorted(active), dtype=np.int32 if is_unified else object)
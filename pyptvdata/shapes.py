@@ -0,0 +1,267 @@
+import hashlib
+import os
+import numpy as np
+import pandas as pd
+
+from .geo import METRES_PER_DEGREE, haversine_distance
+from .patterns import build_trip_patterns, get_ranges
+from .unified import get_key_column, get_id_values
+
+
+def get_shape_points(shapes : pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns the shapes sorted by shape and shape_pt_sequence, with a distance column: the metres travelled from the start of the shape,
+    derived from the geometry by summing the haversine distances between consecutive points.
+    """
+    shape_key = get_key_column(shapes, 'shape')
+    shape_codes = pd.factorize(get_id_values(shapes, shape_key))[0]
+    order = np.lexsort((shapes['shape_pt_sequence'].to_numpy(), shape_codes))
+    points = shapes.iloc[order][[shape_key, 'shape_pt_sequence', 'shape_pt_lat', 'shape_pt_lon']].reset_index(drop=True)
+
+    lat = points['shape_pt_lat'].to_numpy(dtype=np.float64)
+    lon = points['shape_pt_lon'].to_numpy(dtype=np.float64)
+    codes = shape_codes[order]
+    steps = np.r_[0.0, haversine_distance(lat[:-1], lon[:-1], lat[1:], lon[1:])]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) > 0 else np.empty(0, dtype=np.int64)
+    steps[starts] = 0.0
+    steps = np.nan_to_num(steps)
+    cumulative = np.cumsum(steps)
+    points['distance'] = cumulative - np.repeat(cumulative[starts], np.diff(np.r_[starts, len(codes)]))
+    return points
+
+
+def project_stops_onto_shape(stop_lat : np.ndarray, stop_lon : np.ndarray, shape_lat : np.ndarray, shape_lon : np.ndarray, shape_distance : np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Projects a trip's stops, in order, onto its shape, and returns each stop's distance along the shape and its offset from the shape, in metres.
+
+    All stops are projected onto all segments at once, in a local plane around the shape. Each stop then takes the nearest projection
+    that is not behind the previous stop, so shapes that pass the same place twice, e.g. loops, are followed in order.
+    """
+    if len(shape_lat) < 2:
+        return np.zeros(len(stop_lat)), haversine_distance(stop_lat, stop_lon, shape_lat[0], shape_lon[0]) if len(shape_lat) == 1 else np.full(len(stop_lat), np.nan)
+    scale_x = METRES_PER_DEGREE * np.cos(np.radians(np.mean(shape_lat)))
+    ax, ay = shape_lon[:-1] * scale_x, shape_lat[:-1] * METRES_PER_DEGREE
+    bx, by = shape_lon[1:] * scale_x, shape_lat[1:] * METRES_PER_DEGREE
+    px, py = (stop_lon * scale_x)[:, None], (stop_lat * METRES_PER_DEGREE)[:, None]
+
+    dx, dy = bx - ax, by - ay
+    length_squared = dx * dx + dy * dy
+    t = np.clip(((px - ax) * dx + (py - ay) * dy) / np.where(length_squared > 0, length_squared, 1), 0, 1)
+    offset = np.hypot(ax + t * dx - px, ay + t * dy - py)
+    along = shape_distance[:-1] + t * (shape_distance[1:] - shape_distance[:-1])
+
+    distances = np.empty(len(stop_lat))
+    offsets = np.empty(len(stop_lat))
+    previous = 0.0
+    for k in range(len(stop_lat)):
+        # Allow a metre of slack, for consecutive stops projected onto the same point
+        candidate_offset = np.where(along[k] >= previous - 1.0, offset[k], np.inf)
+        j = np.argmin(candidate_offset) if np.isfinite(candidate_offset).any() else np.argmin(offset[k])
+        distances[k] = max(along[k, j], previous)
+        offsets[k] = offset[k, j]
+        previous = distances[k]
+    return distances, offsets
+
+
+def get_cache_key(*arrays : np.ndarray) -> str:
+    """
+    Returns a hash of the bytes of arrays, to key cached results by their inputs.
+    """
+    h = hashlib.sha1()
+    for values in arrays:
+        h.update(np.ascontiguousarray(values).tobytes())
+    return h.hexdigest()[:16]
+
+
+def build_stop_distances(
+        feed : dict[str, pd.DataFrame],
+        patterns : dict[str, pd.DataFrame] = None,
+        cache_dir : str = None,
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Derives consistent distances along the shapes from the geometry, and returns a dictionary of pandas DataFrames:
+
+        {
+            'shape_points': shape, shape_pt_sequence, shape_pt_lat, shape_pt_lon, distance, see `get_shape_points`,
+            'pattern_stops': pattern_id, position, stop, shape, distance, offset,
+        }
+
+    where shape and stop are the feed's key columns, e.g. shape_id, or shape_index for `build_unified_feed` output.
+
+    The stops of each trip pattern, see `build_trip_patterns`, are projected onto each shape its trips follow, see `project_stops_onto_shape`,
+    so pattern_stops has the stops of a pattern once per (pattern_id, shape), sorted by pattern_id, shape and position, and the geometry work is done
+    once per (pattern, shape) rather than per stop_times row. distance is in metres along the shape, and offset the metres from the stop to the shape.
+    Trips without a shape have a missing shape and missing distances.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], or of `build_unified_feed`.
+    - patterns: The output of `build_trip_patterns`, if already built.
+    - cache_dir: If given, the result is saved in this directory keyed by a hash of the shapes, stops and patterns,
+      and loaded from there while they are unchanged.
+    """
+    if patterns is None:
+        patterns = build_trip_patterns(feed)
+    trips = feed['trips']
+    stops = feed['stops']
+    shape_key = get_key_column(trips, 'shape')
+    trip_key = get_key_column(trips, 'trip')
+    stop_key = get_key_column(stops, 'stop')
+
+    pattern_stops = patterns['pattern_stops']
+    shape_points = get_shape_points(feed['shapes']) if 'shapes' in feed else pd.DataFrame(columns=[shape_key, 'shape_pt_sequence', 'shape_pt_lat', 'shape_pt_lon', 'distance'])
+
+    # The trips of a pattern can follow different shapes, e.g. variants that detour between the same stops, so each (pattern, shape) is projected
+    trip_shapes = pd.Series(np.asarray(trips[shape_key]), index=pd.Index(get_id_values(trips, trip_key), dtype=object))
+    trip_shapes = trip_shapes[~trip_shapes.index.duplicated()]
+    pattern_shapes = pd.DataFrame({
+        'pattern_id': patterns['trips']['pattern_id'].to_numpy(),
+        shape_key: trip_shapes.reindex(get_id_values(patterns['trips'], trip_key)).to_numpy(),
+    }).drop_duplicates().sort_values(['pattern_id', shape_key], na_position='last', ignore_index=True)
+
+    cache_path = None
+    if cache_dir is not None:
+        cache_key = get_cache_key(
+            shape_points[['shape_pt_lat', 'shape_pt_lon']].to_numpy(dtype=np.float64),
+            pd.util.hash_pandas_object(shape_points[shape_key], index=False).to_numpy(),
+            pd.util.hash_pandas_object(pattern_stops, index=False).to_numpy(),
+            pd.util.hash_pandas_object(pattern_shapes, index=False).to_numpy(),
+            stops[['stop_lat', 'stop_lon']].to_numpy(dtype=np.float64),
+        )
+        cache_path = os.path.join(cache_dir, f'stop_distances-{cache_key}.pkl')
+        if os.path.exists(cache_path):
+            return {'shape_points': shape_points, 'pattern_stops': pd.read_pickle(cache_path)}
+
+    # The rows of pattern_stops for each (pattern, shape), as the pattern_ids are sorted
+    n_pattern_stops = np.bincount(pattern_stops['pattern_id'].to_numpy(), minlength=patterns['patterns']['pattern_id'].max() + 1 if len(patterns['patterns']) > 0 else 0)
+    pattern_starts = np.r_[0, np.cumsum(n_pattern_stops)[:-1]]
+    pair_patterns = pattern_shapes['pattern_id'].to_numpy()
+    pair_shapes = pattern_shapes[shape_key].to_numpy()
+    counts = n_pattern_stops[pair_patterns]
+    rows = get_ranges(pattern_starts[pair_patterns], counts)
+
+    stop_positions = pd.Index(get_id_values(stops, stop_key), dtype=object).get_indexer(get_id_values(pattern_stops, stop_key)[rows])
+    stop_lat = np.where(stop_positions >= 0, stops['stop_lat'].to_numpy(dtype=np.float64)[stop_positions], np.nan)
+    stop_lon = np.where(stop_positions >= 0, stops['stop_lon'].to_numpy(dtype=np.float64)[stop_positions], np.nan)
+
+    shape_values = get_id_values(shape_points, shape_key)
+    shape_starts = np.flatnonzero(np.r_[True, shape_values[1:] != shape_values[:-1]]) if len(shape_values) > 0 else np.empty(0, dtype=np.int64)
+    shape_ranges = pd.Series(np.c_[shape_starts, np.r_[shape_starts[1:], len(shape_values)]].tolist(), index=pd.Index(shape_values[shape_starts], dtype=object))
+    shape_lat = shape_points['shape_pt_lat'].to_numpy(dtype=np.float64)
+    shape_lon = shape_points['shape_pt_lon'].to_numpy(dtype=np.float64)
+    shape_distance = shape_points['distance'].to_numpy()
+
+    pair_starts = np.r_[0, np.cumsum(counts)[:-1]]
+    distances = np.full(len(rows), np.nan)
+    offsets = np.full(len(rows), np.nan)
+    for shape, start, end in zip(pair_shapes.tolist(), pair_starts.tolist(), (pair_starts + counts).tolist()):
+        if pd.isna(shape) or shape not in shape_ranges.index:
+            continue
+        shape_start, shape_end = shape_ranges[shape]
+        valid = ~np.isnan(stop_lat[start:end])
+        distances[start:end][valid], offsets[start:end][valid] = project_stops_onto_shape(
+            stop_lat[start:end][valid], stop_lon[start:end][valid],
+            shape_lat[shape_start:shape_end], shape_lon[shape_start:shape_end], shape_distance[shape_start:shape_end],
+        )
+
+    result = pattern_stops.iloc[rows].reset_index(drop=True)
+    result[shape_key] = np.repeat(pair_shapes, counts)
+    result['distance'] = distances
+    result['offset'] = offsets
+
+    if cache_path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        result.to_pickle(f'{cache_path}.tmp')
+        os.replace(f'{cache_path}.tmp', cache_path)
+    return {'shape_points': shape_points, 'pattern_stops': result}
+
+
+def fill_shape_dist_traveled(
+        feed : dict[str, pd.DataFrame],
+        stop_distances : dict[str, pd.DataFrame] = None,
+        patterns : dict[str, pd.DataFrame] = None,
+        overwrite : bool = False,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Returns copies of the feed's stop_times and shapes with shape_dist_traveled filled from the geometry-derived distances,
+    in metres, the unit of PTV's shape_dist_traveled. Only missing values are filled, or all of them if overwrite is True,
+    which makes the distances of every trip and shape consistent with each other.
+
+    Parameters:
+    - feed: The tables of one mode of `read_gtfs_zip`, i.e. DFK[mode_id], or of `build_unified_feed`.
+    - stop_distances: The output of `build_stop_distances`, if already built.
+    - patterns: The output of `build_trip_patterns`, if already built.
+    """
+    if patterns is None:
+        patterns = build_trip_patterns(feed)
+    if stop_distances is None:
+        stop_distances = build_stop_distances(feed, patterns=patterns)
+    stop_times = feed['stop_times'].copy()
+    trip_key = get_key_column(stop_times, 'trip')
+
+    # The pattern position of each stop_times row is its rank in the trip by stop_sequence
+    trip_positions = pd.Index(get_id_values(patterns['trips'], trip_key), dtype=object).get_indexer(get_id_values(stop_times, trip_key))
+    rows = np.flatnonzero(trip_positions >= 0)
+    rows = rows[np.lexsort((stop_times['stop_sequence'].to_numpy()[rows], trip_positions[rows]))]
+    trip_positions = trip_positions[rows]
+    starts = np.flatnonzero(np.r_[True, trip_positions[1:] != trip_positions[:-1]]) if len(rows) > 0 else np.empty(0, dtype=np.int64)
+    positions = np.arange(len(rows)) - np.repeat(starts, np.diff(np.r_[starts, len(rows)]))
+
+    # The first row in pattern_stops of each (pattern, shape), and of each trip's pattern and shape
+    pattern_stops = stop_distances['pattern_stops']
+    shape_key = get_key_column(pattern_stops, 'shape')
+    pair_starts = np.flatnonzero(pattern_stops['position'].to_numpy() == 0)
+    trip_shapes = pd.Series(np.asarray(feed['trips'][shape_key]), index=pd.Index(get_id_values(feed['trips'], trip_key), dtype=object))
+    trip_shapes = trip_shapes[~trip_shapes.index.duplicated()].reindex(get_id_values(patterns['trips'], trip_key)).to_numpy()
+    shape_codes, shape_values = pd.factorize(np.r_[pattern_stops[shape_key].to_numpy(dtype=object)[pair_starts], trip_shapes.astype(object)], use_na_sentinel=False)
+    pair_keys = pattern_stops['pattern_id'].to_numpy()[pair_starts].astype(np.int64) * len(shape_values) + shape_codes[:len(pair_starts)]
+    trip_keys = patterns['trips']['pattern_id'].to_numpy().astype(np.int64) * len(shape_values) + shape_codes[len(pair_starts):]
+    trip_starts = pair_starts[pd.Index(pair_keys).get_indexer(trip_keys)]
+    derived = pattern_stops['distance'].to_numpy()[trip_starts[trip_positions] + positions]
+
+    distance = stop_times['shape_dist_traveled'].to_numpy(dtype=np.float64, copy=True) if 'shape_dist_traveled' in stop_times.columns else np.full(len(stop_times), np.nan)
+    fill = np.ones(len(rows), dtype=bool) if overwrite else np.isnan(distance[rows])
+    distance[rows[fill]] = derived[fill]
+    stop_times['shape_dist_traveled'] = distance
+
+    shapes = feed.get('shapes')
+    if shapes is not None:
+        shapes = shapes.copy()
+        shape_points = stop_distances['shape_points']
+        shape_key = get_key_column(shapes, 'shape')
+        point_index = pd.MultiIndex.from_arrays([get_id_values(shape_points, shape_key), shape_points['shape_pt_sequence'].to_numpy()])
+        positions = point_index.get_indexer(pd.MultiIndex.from_arrays([get_id_values(shapes, shape_key), shapes['shape_pt_sequence'].to_numpy()]))
+        shape_distance = shapes['shape_dist_traveled'].to_numpy(dtype=np.float64, copy=True) if 'shape_dist_traveled' in shapes.columns else np.full(len(shapes), np.nan)
+        fill = (positions >= 0) & (True if overwrite else np.isnan(shape_distance))
+        shape_distance[fill] = shape_points['distance'].to_numpy()[positions[fill]]
+        shapes['shape_dist_traveled'] = shape_distance
+    return stop_times, shapes
+
+
+def interpolate_shape_positions(shape_points : pd.DataFrame, shapes : np.ndarray, distances : np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the (lat, lon) at distances in metres along shapes, e.g. of vehicles between two stops, interpolating between shape points.
+    Distances are clipped to the length of the shape. Unknown shapes give missing coordinates.
+
+    Parameters:
+    - shape_points: The shape_points of `build_stop_distances`, or the output of `get_shape_points`.
+    - shapes: The shape of each position, shape_id or shape_index values.
+    - distances: Metres along each shape.
+    """
+    shape_values = np.asarray(shape_points[shape_points.columns[0]])
+    if len(shape_values) == 0:
+        return np.full(len(distances), np.nan), np.full(len(distances), np.nan)
+    shape_distance = shape_points['distance'].to_numpy()
+    starts = np.flatnonzero(np.r_[True, shape_values[1:] != shape_values[:-1]])
+    ends = np.r_[starts[1:], len(shape_values)] - 1
+
+    # Lay all the shapes end to end on one axis, a metre apart, so one np.interp call serves every shape
+    lengths = shape_distance[ends]
+    offsets = np.r_[0.0, np.cumsum(lengths + 1.0)[:-1]]
+    axis = shape_distance + np.repeat(offsets, ends - starts + 1)
+
+    shape_positions = pd.Index(shape_values[starts]).get_indexer(np.asarray(shapes))
+    known = shape_positions >= 0
+    x = offsets[shape_positions] + np.clip(np.asarray(distances, dtype=np.float64), 0, lengths[shape_positions])
+    lat = np.where(known, np.interp(x, axis, shape_points['shape_pt_lat'].to_numpy(dtype=np.float64)), np.nan)
+    lon = np.where(known, np.interp(x, axis, shape_points['shape_pt_lon'].to_numpy(dtype=np.float64)), np.nan)
+    return lat, lon
@@ -0,0 +1,90 @@
+import hashlib
+import os
+import numpy as np
+import pandas as pd
+
+from .geo import get_pairs_within_distance
+
+
+# Default walking speed, in metres per second
+WALKING_SPEED = 1.2
+
+# Ratio of walking distance along streets to straight-line distance
+DETOUR_FACTOR = 1.3
+
+
+def get_stops_version(stops : pd.DataFrame) -> str:
+    """
+    Returns a hash of the stop coordinates, which identifies the feed version the transfers were built from.
+    """
+    h = hashlib.sha1()
+    for column in ['stop_lat', 'stop_lon']:
+        h.update(np.ascontiguousarray(stops[column].to_numpy(dtype=np.float64)).tobytes())
+    return h.hexdigest()[:16]
+
+
+def build_transfers(
+        stops : pd.DataFrame,
+        max_distance : float = 400.0,
+        walking_speed : float = WALKING_SPEED,
+        detour_factor : float = DETOUR_FACTOR,
+        cache_dir : str = None,
+    ) -> pd.DataFrame:
+    """
+    Returns the walking transfers between stops within max_distance metres of each other, in both directions, as a DataFrame with columns:
+    from_stop_index, to_stop_index, distance (straight-line metres) and walking_seconds (int32), sorted by from_stop_index then walking_seconds.
+
+    Pairs are found with a grid-bucketed radius search, see `get_pairs_within_distance`, so the whole of Victoria takes seconds.
+
+    Parameters:
+    - stops: The stops of `build_unified_feed`, or any table with stop_lat and stop_lon columns.
+      Stops are numbered by their stop_index column if there is one, else by row position.
+    - walking_speed: Metres per second.
+    - detour_factor: Ratio of the walking distance to the straight-line distance.
+    - cache_dir: If given, the transfers are saved in this directory, e.g. the mirror directory of `materialize_gtfs_zip`,
+      keyed by a hash of the stop coordinates and the parameters, and loaded from there while the stops are unchanged.
+    """
+    cache_path = None
+    if cache_dir is not None:
+        cache_key = f'{get_stops_version(stops)}-{max_distance}-{walking_speed}-{detour_factor}'
+        cache_path = os.path.join(cache_dir, f'transfers-{cache_key}.npz')
+        if os.path.exists(cache_path):
+            with np.load(cache_path) as cached:
+                return pd.DataFrame({column: cached[column] for column in cached.files})
+
+    i, j, distance = get_pairs_within_distance(stops['stop_lat'].to_numpy(), stops['stop_lon'].to_numpy(), max_distance)
+    stop_indices = stops['stop_index'].to_numpy() if 'stop_index' in stops.columns else np.arange(len(stops))
+    from_stop = np.concatenate([stop_indices[i], stop_indices[j]]).astype(np.int32)
+    to_stop = np.concatenate([stop_indices[j], stop_indices[i]]).astype(np.int32)
+    distance = np.concatenate([distance, distance])
+    walking_seconds = np.ceil(distance * detour_factor / walking_speed).astype(np.int32)
+
+    order = np.lexsort((walking_seconds, from_stop))
+    transfers = pd.DataFrame({
+        'from_stop_index': from_stop[order],
+        'to_stop_index': to_stop[order],
+        'distance': distance[order],
+        'walking_seconds': walking_seconds[order],
+    })
+
+    if cache_path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        np.savez(f'{cache_path}.tmp.npz', **{column: transfers[column].to_numpy() for column in transfers.columns})
+        os.replace(f'{cache_path}.tmp.npz', cache_path)
+    return transfers
+
+
+def get_transfer_graph(transfers : pd.DataFrame, n_stops : int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the transfers as a compressed sparse row graph (indptr, to_stop_index, walking_seconds),
+    where the transfers from stop s are to_stop_index[indptr[s]:indptr[s + 1]].
+
+    Parameters:
+    - transfers: The output of `build_transfers`.
+    - n_stops: Number of stops, i.e. one more than the largest stop index.
+    """
+    from_stop = transfers['from_stop_index'].to_numpy()
+    order = np.argsort(from_stop, kind='stable')
+    indptr = np.zeros(n_stops + 1, dtype=np.int64)
+    np.cumsum(np.bincount(from_stop, minlength=n_stops), out=indptr[1:])
+    return indptr, transfers['to_stop_index'].to_numpy()[order], transfers['walking_seconds'].to_numpy()[order]
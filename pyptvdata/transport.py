@@ -0,0 +1,122 @@
+import importlib.util
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# HTTP status codes that are retried: rate limited, or a temporary server error
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def get_accept_encoding() -> str:
+    """
+    Returns the Accept-Encoding header value for the content encodings that can be decoded in this environment.
+    Brotli (br) needs the brotli or brotlicffi package.
+    """
+    encodings = ['gzip', 'deflate']
+    if importlib.util.find_spec('brotli') is not None or importlib.util.find_spec('brotlicffi') is not None:
+        encodings.append('br')
+    return ', '.join(encodings)
+
+
+def get_retry_count(response) -> int:
+    """
+    Returns the number of retries the transport made for a response. Only known for the requests backend.
+    """
+    retries = getattr(getattr(response, 'raw', None), 'retries', None)
+    if retries is None:
+        return 0
+    return len(retries.history)
+
+
+class Transport:
+    """
+    HTTP transport shared by PTVAPIClient and GTFSRClient.
+
+    Holds one connection pool, so passing the same Transport to several clients reuses their connections.
+    Uses a requests.Session by default, or an httpx.Client with HTTP/2 multiplexing if http2 is True.
+
+    By default, requests are sent like a plain requests.Session: without a timeout and without retries.
+    Set timeout and max_retries, e.g. Transport(timeout=(5, 30), max_retries=3), to time out and retry with backoff.
+    """
+    def __init__(
+            self,
+            pool_connections : int = 10,
+            pool_maxsize : int = 32,
+            keepalive_expiry : float = 5.0,
+            max_retries : int = 0,
+            backoff_factor : float = 0.5,
+            retry_status_codes : tuple[int, ...] = RETRY_STATUS_CODES,
+            timeout : float | tuple[float, float] = None,
+            compression : bool = True,
+            http2 : bool = False,
+        ):
+        """
+        Parameters:
+        - pool_connections: Number of hosts to keep connection pools for.
+        - pool_maxsize: Maximum number of connections per host, or in total with http2. Set it to at least the number of threads sharing the transport.
+        - keepalive_expiry: Seconds an idle connection is kept alive. Only used with http2, requests keeps connections until the server closes them.
+        - max_retries: Number of retries on connection errors and retry_status_codes, with exponential backoff. Defaults to no retries.
+          With http2, only connection errors are retried.
+        - backoff_factor: Retry delays are backoff_factor * 2 ** (retry number - 1) seconds.
+        - timeout: Seconds to wait for the server, or a (connect timeout, read timeout) tuple. Defaults to waiting forever.
+        - compression: If True, ask for gzip, deflate and, if installed, brotli compressed responses.
+        - http2: If True, use an httpx.Client with HTTP/2. Needs the httpx and h2 packages.
+        """
+        self.timeout = timeout
+        self.headers = {'Accept-Encoding': get_accept_encoding() if compression else 'identity'}
+        self.http2 = http2
+
+        if http2:
+            assert httpx is not None, "httpx is not installed, install httpx[http2] to use HTTP/2"
+            if isinstance(timeout, tuple):
+                timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+            # The client ignores its own limits when given a transport, so they are set on the transport
+            self.session = httpx.Client(
+                timeout=timeout,
+                headers=self.headers,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=max_retries,
+                    limits=httpx.Limits(
+                        max_connections=pool_maxsize,
+                        max_keepalive_connections=pool_maxsize,
+                        keepalive_expiry=keepalive_expiry,
+                    ),
+                ),
+            )
+        else:
+            retry = Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=retry_status_codes,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+            self.session = requests.Session()
+            self.session.headers.update(self.headers)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
+
+    def get(self, url : str, headers : dict = None):
+        """
+        Sends a GET request and returns the response.
+        """
+        return self.session.get(url, headers=headers, timeout=self.timeout if not self.http2 else httpx.USE_CLIENT_DEFAULT)
+
+    def post(self, url : str, json = None, headers : dict = None):
+        """
+        Sends a POST request with a JSON body and returns the response.
+        """
+        return self.session.post(url, json=json, headers=headers, timeout=self.timeout if not self.http2 else httpx.USE_CLIENT_DEFAULT)
+
+    def close(self):
+        """
+        Closes all the pooled connections.
+        """
+        self.session.close()
@@ -0,0 +1,251 @@
+import numpy as np
+import pandas as pd
+
+from .gtfs import gtfs_time_to_seconds
+from .geo import get_pairs_within_distance, get_connected_components
+
+
+def get_id_values(df : pd.DataFrame | None, column : str) -> np.ndarray:
+    """
+    Returns a column of original GTFS IDs as an object array, or an empty array if the table or column is missing.
+    """
+    if df is None or column not in df.columns:
+        return np.empty(0, dtype=object)
+    return np.asarray(df[column], dtype=object)
+
+
+def get_key_column(df : pd.DataFrame, entity : str) -> str:
+    """
+    Returns the column that references an entity, e.g. 'stop', in a table of either a single mode of `read_gtfs_zip`
+    or of `build_unified_feed`: the global {entity}_index if the table has one, else the original {entity}_id.
+    """
+    return f'{entity}_index' if f'{entity}_index' in df.columns else f'{entity}_id'
+
+
+def get_stop_time_seconds(stop_times : pd.DataFrame, column : str = 'departure') -> np.ndarray:
+    """
+    Returns the 'arrival' or 'departure' times of stop_times in seconds since the start of the service day, as an int32 array
+    with -1 for missing times. Uses the {column}_seconds of `build_unified_feed` if present, else converts {column}_time.
+    """
+    if f'{column}_seconds' in stop_times.columns:
+        return stop_times[f'{column}_seconds'].to_numpy(dtype=np.int32)
+    return gtfs_time_to_seconds(stop_times[f'{column}_time'])
+
+
+def make_id_map(mode_ids : dict[str, np.ndarray], id_column : str, index_column : str) -> tuple[pd.DataFrame, dict[str, tuple[pd.Index, int]]]:
+    """
+    Numbers the distinct IDs of each mode with global dense integers, in mode order.
+
+    Returns the mapping table, with columns mode_id, id_column and index_column,
+    and a {mode_id: (pd.Index of the original IDs, first global index)} lookup for `get_global_index`.
+    """
+    frames = []
+    lookup = {}
+    offset = 0
+    for mode_id, values in mode_ids.items():
+        index = pd.Index(pd.unique(values[pd.notna(values)]), dtype=object)
+        lookup[mode_id] = (index, offset)
+        frames.append(pd.DataFrame({
+            'mode_id': mode_id,
+            id_column: index.to_numpy(),
+            index_column: np.arange(offset, offset + len(index), dtype=np.int32),
+        }))
+        offset += len(index)
+    if not frames:
+        return pd.DataFrame({'mode_id': [], id_column: [], index_column: np.empty(0, dtype=np.int32)}), lookup
+    return pd.concat(frames, ignore_index=True), lookup
+
+
+def get_global_index(lookup : dict[str, tuple[pd.Index, int]], mode_id : str, values : np.ndarray) -> np.ndarray:
+    """
+    Returns the global indices of the original IDs of a mode, as an int32 array with -1 for missing or unknown IDs.
+    """
+    index, offset = lookup[mode_id]
+    positions = index.get_indexer(values)
+    return np.where(positions >= 0, positions + offset, -1).astype(np.int32)
+
+
+def normalize_stop_name(names : pd.Series) -> pd.Series:
+    """
+    Returns stop names lower-cased with whitespace collapsed, for matching nearby stops.
+    """
+    return names.astype(str).str.lower().str.replace(r'\s+', ' ', regex=True).str.strip()
+
+
+def build_unified_stops(
+        DFK : dict[str, dict[str, pd.DataFrame]],
+        merge_distance : float = 10.0,
+        match_names : bool = True,
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Merges the stops of all modes, and returns the unified stops and the stop_ids mapping table.
+
+    Stops with the same stop_id in several modes are merged, as are stops within merge_distance metres of each other
+    and, if match_names is True, with the same name. Merged stops take the name and coordinates of their first stop, in mode order.
+
+    Parameters:
+    - DFK: The output of `read_gtfs_zip` or `read_gtfs_mirror`.
+    - merge_distance: Distance in metres within which stops are merged. 0 merges stops by stop_id only.
+    """
+    frames = []
+    for mode_id, tables in DFK.items():
+        stops = tables.get('stops')
+        if stops is None:
+            continue
+        frames.append(pd.DataFrame({
+            'mode_id': mode_id,
+            'stop_id': get_id_values(stops, 'stop_id'),
+            'stop_name': np.asarray(stops['stop_name'], dtype=object) if 'stop_name' in stops.columns else None,
+            'stop_lat': np.asarray(stops['stop_lat'], dtype=np.float64) if 'stop_lat' in stops.columns else np.nan,
+            'stop_lon': np.asarray(stops['stop_lon'], dtype=np.float64) if 'stop_lon' in stops.columns else np.nan,
+        }))
+    if not frames:
+        empty_stops = pd.DataFrame({'stop_index': np.empty(0, dtype=np.int32), 'stop_id': [], 'stop_name': [], 'stop_lat': [], 'stop_lon': []})
+        empty_ids = pd.DataFrame({'mode_id': [], 'stop_id': [], 'stop_index': np.empty(0, dtype=np.int32)})
+        return empty_stops, empty_ids
+    all_stops = pd.concat(frames, ignore_index=True)
+    all_stops = all_stops[~all_stops.duplicated(['mode_id', 'stop_id']) | all_stops['stop_id'].isna()].reset_index(drop=True)
+    n = len(all_stops)
+
+    # Join every stop to the first stop with the same stop_id. Stops without a stop_id, code -1, are not joined by ID
+    id_codes = pd.factorize(all_stops['stop_id'])[0]
+    has_id = np.flatnonzero(id_codes >= 0)
+    first_row = np.full(id_codes.max() + 1 if len(has_id) > 0 else 0, n, dtype=np.int64)
+    np.minimum.at(first_row, id_codes[has_id], has_id)
+    edges_i = [has_id]
+    edges_j = [first_row[id_codes[has_id]]]
+
+    if merge_distance > 0:
+        i, j, _ = get_pairs_within_distance(all_stops['stop_lat'].to_numpy(), all_stops['stop_lon'].to_numpy(), merge_distance)
+        if match_names:
+            names = normalize_stop_name(all_stops['stop_name']).to_numpy()
+            same_name = names[i] == names[j]
+            i, j = i[same_name], j[same_name]
+        edges_i.append(i)
+        edges_j.append(j)
+
+    labels = get_connected_components(n, np.concatenate(edges_i), np.concatenate(edges_j)).astype(np.int32)
+
+    stop_ids = pd.DataFrame({'mode_id': all_stops['mode_id'], 'stop_id': all_stops['stop_id'], 'stop_index': labels})
+    first = np.unique(labels, return_index=True)[1]
+    stops = all_stops.iloc[first].drop(columns='mode_id').reset_index(drop=True)
+    stops.insert(0, 'stop_index', np.arange(len(stops), dtype=np.int32))
+    return stops, stop_ids
+
+
+def build_unified_feed(
+        DFK : dict[str, dict[str, pd.DataFrame]],
+        merge_distance : float = 10.0,
+        match_names : bool = True,
+    ) -> dict[str, pd.DataFrame]:
+    """
+    Merges the per-mode tables of a feed into one network with global dense integer IDs, and returns a dictionary of pandas DataFrames:
+
+        {
+            'stops': stop_index, stop_id, stop_name, stop_lat, stop_lon,
+            'routes': route_index, mode_id, and the other routes columns,
+            'trips': trip_index, route_index, service_index, shape_index, and the other trips columns,
+            'stop_times': trip_index, stop_index, arrival_seconds, departure_seconds, and the other stop_times columns,
+            'shapes': shape_index, and the other shapes columns,
+            'calendar': service_index, and the other calendar columns,
+            'calendar_dates': service_index, and the other calendar_dates columns,
+            'agency': mode_id, and the agency columns,
+            'stop_ids': mode_id, stop_id, stop_index,
+            'route_ids': mode_id, route_id, route_index,
+            'trip_ids': mode_id, trip_id, trip_index,
+            'service_ids': mode_id, service_id, service_index,
+            'shape_ids': mode_id, shape_id, shape_index,
+        }
+
+    The *_ids tables map each (mode_id, original ID) to its global index. Routes, trips, services and shapes are numbered per mode,
+    as their IDs are only unique within a mode. Stops are merged across modes, see `build_unified_stops`.
+    Global indices are int32, with -1 for missing or unknown references. arrival_seconds and departure_seconds are seconds since the
+    start of the service day, see `gtfs_time_to_seconds`. Tables missing from the feed, or filtered out when it was read, are left out.
+
+    Parameters:
+    - DFK: The output of `read_gtfs_zip` or `read_gtfs_mirror`.
+    - merge_distance: Distance in metres within which stops of different IDs are merged.
+    - match_names: If True, only merge nearby stops with the same name.
+    """
+    stops, stop_ids = build_unified_stops(DFK, merge_distance=merge_distance, match_names=match_names)
+    stop_lookup = {
+        mode_id: (pd.Index(mode_stop_ids['stop_id'].to_numpy(), dtype=object), mode_stop_ids['stop_index'].to_numpy())
+        for mode_id, mode_stop_ids in stop_ids[stop_ids['stop_id'].notna()].groupby('mode_id', sort=False)
+    }
+
+    route_ids, route_lookup = make_id_map({mode_id: get_id_values(tables.get('routes'), 'route_id') for mode_id, tables in DFK.items()}, 'route_id', 'route_index')
+    trip_ids, trip_lookup = make_id_map({mode_id: get_id_values(tables.get('trips'), 'trip_id') for mode_id, tables in DFK.items()}, 'trip_id', 'trip_index')
+    shape_ids, shape_lookup = make_id_map({
+        mode_id: np.concatenate([get_id_values(tables.get('shapes'), 'shape_id'), get_id_values(tables.get('trips'), 'shape_id')])
+        for mode_id, tables in DFK.items()
+    }, 'shape_id', 'shape_index')
+    service_ids, service_lookup = make_id_map({
+        mode_id: np.concatenate([get_id_values(tables.get(table_name), 'service_id') for table_name in ['calendar', 'calendar_dates', 'trips']])
+        for mode_id, tables in DFK.items()
+    }, 'service_id', 'service_index')
+
+    frames = {table_name: [] for table_name in ['routes', 'trips', 'stop_times', 'shapes', 'calendar', 'calendar_dates', 'agency']}
+    for mode_id, tables in DFK.items():
+        if 'routes' in tables:
+            routes = tables['routes'].drop_duplicates('route_id')
+            frames['routes'].append(pd.DataFrame({
+                'route_index': get_global_index(route_lookup, mode_id, get_id_values(routes, 'route_id')),
+                'mode_id': mode_id,
+                **{column: routes[column].to_numpy() for column in routes.columns if column != 'route_id'},
+            }))
+
+        if 'trips' in tables:
+            trips = tables['trips'].drop_duplicates('trip_id')
+            frames['trips'].append(pd.DataFrame({
+                'trip_index': get_global_index(trip_lookup, mode_id, get_id_values(trips, 'trip_id')),
+                'route_index': get_global_index(route_lookup, mode_id, get_id_values(trips, 'route_id')) if 'route_id' in trips.columns else -1,
+                'service_index': get_global_index(service_lookup, mode_id, get_id_values(trips, 'service_id')) if 'service_id' in trips.columns else -1,
+                'shape_index': get_global_index(shape_lookup, mode_id, get_id_values(trips, 'shape_id')) if 'shape_id' in trips.columns else -1,
+                **{column: trips[column].to_numpy() for column in trips.columns if column not in ['trip_id', 'route_id', 'service_id', 'shape_id']},
+            }))
+
+        if 'stop_times' in tables:
+            stop_times = tables['stop_times']
+            data = {'trip_index': get_global_index(trip_lookup, mode_id, get_id_values(stop_times, 'trip_id'))}
+            if 'stop_id' in stop_times.columns:
+                index, stop_indices = stop_lookup.get(mode_id, (pd.Index([], dtype=object), np.empty(0, dtype=np.int32)))
+                positions = index.get_indexer(get_id_values(stop_times, 'stop_id'))
+                data['stop_index'] = np.where(positions >= 0, stop_indices[positions], -1).astype(np.int32)
+            for column in stop_times.columns:
+                if column in ['trip_id', 'stop_id']:
+                    continue
+                if column in ['arrival_time', 'departure_time']:
+                    data[column.replace('_time', '_seconds')] = gtfs_time_to_seconds(stop_times[column])
+                else:
+                    data[column] = stop_times[column].to_numpy()
+            frames['stop_times'].append(pd.DataFrame(data))
+
+        if 'shapes' in tables:
+            shapes = tables['shapes']
+            frames['shapes'].append(pd.DataFrame({
+                'shape_index': get_global_index(shape_lookup, mode_id, get_id_values(shapes, 'shape_id')),
+                **{column: shapes[column].to_numpy() for column in shapes.columns if column != 'shape_id'},
+            }))
+
+        for table_name in ['calendar', 'calendar_dates']:
+            if table_name in tables:
+                calendar = tables[table_name]
+                frames[table_name].append(pd.DataFrame({
+                    'service_index': get_global_index(service_lookup, mode_id, get_id_values(calendar, 'service_id')),
+                    **{column: calendar[column].to_numpy() for column in calendar.columns if column != 'service_id'},
+                }))
+
+        if 'agency' in tables:
+            agency = tables['agency']
+            frames['agency'].append(pd.DataFrame({'mode_id': mode_id, **{column: agency[column].to_numpy() for column in agency.columns}}))
+
+    feed = {'stops': stops}
+    for table_name, table_frames in frames.items():
+        if table_frames:
+            feed[table_name] = pd.concat(table_frames, ignore_index=True)
+    feed['stop_ids'] = stop_ids
+    feed['route_ids'] = route_ids
+    feed['trip_ids'] = trip_ids
+    feed['service_ids'] = service_ids
+    feed['shape_ids'] = shape_ids
+    return feed
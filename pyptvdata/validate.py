@@ -0,0 +1,268 @@
+import time
+import numpy as np
+import pandas as pd
+
+from .const import GTFS_PRIMARY_KEYS
+from .gtfs import gtfs_time_to_seconds
+
+
+# (min_lat, min_lon, max_lat, max_lon) that PTV coordinates must be within. Wider than Victoria, as interstate services reach Sydney and Adelaide.
+COORDINATE_BOUNDS = (-44.0, 129.0, -28.0, 154.0)
+
+# Tables every mode must have. calendar or calendar_dates is checked separately.
+REQUIRED_TABLES = ['agency', 'stops', 'routes', 'trips', 'stop_times']
+
+# Columns referencing another table: (table_name, column, referenced table_name, referenced column)
+FOREIGN_KEYS = [
+    ('routes', 'agency_id', 'agency', 'agency_id'),
+    ('trips', 'route_id', 'routes', 'route_id'),
+    ('trips', 'shape_id', 'shapes', 'shape_id'),
+    ('stop_times', 'trip_id', 'trips', 'trip_id'),
+    ('stop_times', 'stop_id', 'stops', 'stop_id'),
+]
+
+ISSUE_COLUMNS = ['mode_id', 'table_name', 'rule', 'severity', 'row', 'column', 'value', 'message']
+
+
+def make_issues(mode_id : str, table_name : str, rule : str, severity : str, rows : np.ndarray, column : str = None, values : np.ndarray = None, message : str = '') -> pd.DataFrame:
+    """
+    Returns an issue table with one issue per row, where rows are index labels of the table, or -1 for issues about the whole table.
+    """
+    rows = np.asarray(rows)
+    return pd.DataFrame({
+        'mode_id': mode_id,
+        'table_name': table_name,
+        'rule': rule,
+        'severity': severity,
+        'row': rows,
+        'column': column,
+        'value': pd.Series(values, dtype=object).astype(str).to_numpy() if values is not None else None,
+        'message': message,
+    }, index=pd.RangeIndex(len(rows)))
+
+
+def check_tables(mode_id : str, tables : dict[str, pd.DataFrame]) -> list[pd.DataFrame]:
+    """
+    Checks that the required tables are present.
+    """
+    issues = []
+    for table_name in REQUIRED_TABLES:
+        if table_name not in tables:
+            issues.append(make_issues(mode_id, table_name, 'missing_table', 'error', [-1], message=f"{table_name}.txt is missing"))
+    if 'calendar' not in tables and 'calendar_dates' not in tables:
+        issues.append(make_issues(mode_id, 'calendar', 'missing_table', 'error', [-1], message="calendar.txt and calendar_dates.txt are both missing"))
+    return issues
+
+
+def check_keys(mode_id : str, tables : dict[str, pd.DataFrame]) -> list[pd.DataFrame]:
+    """
+    Checks that primary key columns are not missing, and that primary keys are unique, see GTFS_PRIMARY_KEYS.
+    """
+    issues = []
+    for table_name, key in GTFS_PRIMARY_KEYS.items():
+        df = tables.get(table_name)
+        if df is None or not all(column in df.columns for column in key):
+            continue
+        for column in key:
+            missing = df[column].isna().to_numpy()
+            if missing.any():
+                issues.append(make_issues(mode_id, table_name, 'missing_value', 'error', df.index[missing], column, message=f"{column} is missing"))
+        duplicated = df.duplicated(key, keep='first').to_numpy()
+        if duplicated.any():
+            values = df.loc[duplicated, key].astype(str).agg(','.join, axis=1).to_numpy()
+            issues.append(make_issues(mode_id, table_name, 'duplicate_key', 'error', df.index[duplicated], ','.join(key), values, message=f"Duplicate {','.join(key)}"))
+    return issues
+
+
+def check_foreign_keys(mode_id : str, tables : dict[str, pd.DataFrame]) -> list[pd.DataFrame]:
+    """
+    Checks that referenced IDs exist: see FOREIGN_KEYS, and that trips' service_id is in calendar or calendar_dates.
+    Also warns about trips without stop_times.
+    """
+    issues = []
+    foreign_keys = FOREIGN_KEYS + [('trips', 'service_id', table_name, 'service_id') for table_name in ['calendar', 'calendar_dates'] if table_name in tables]
+    checked = {}
+    for table_name, column, referenced_table_name, referenced_column in foreign_keys:
+        df = tables.get(table_name)
+        referenced = tables.get(referenced_table_name)
+        if df is None or column not in df.columns or referenced is None or referenced_column not in referenced.columns:
+            continue
+        # A service_id may be in either calendar table
+        if (table_name, column) in checked:
+            unknown = checked[(table_name, column)] & ~df[column].isin(referenced[referenced_column]).to_numpy()
+        else:
+            unknown = df[column].notna().to_numpy() & ~df[column].isin(referenced[referenced_column]).to_numpy()
+        checked[(table_name, column)] = unknown
+
+    for (table_name, column), unknown in checked.items():
+        if unknown.any():
+            df = tables[table_name]
+            referenced_names = [referenced_table_name for name, key, referenced_table_name, _ in foreign_keys if (name, key) == (table_name, column)]
+            issues.append(make_issues(
+                mode_id, table_name, 'unknown_reference', 'error', df.index[unknown], column, df[column].to_numpy()[unknown],
+                message=f"{column} is not in {' or '.join(referenced_names)}",
+            ))
+
+    trips = tables.get('trips')
+    stop_times = tables.get('stop_times')
+    if trips is not None and stop_times is not None and 'trip_id' in trips.columns and 'trip_id' in stop_times.columns:
+        unused = ~trips['trip_id'].isin(stop_times['trip_id']).to_numpy()
+        if unused.any():
+            issues.append(make_issues(mode_id, 'trips', 'trip_without_stop_times', 'warning', trips.index[unused], 'trip_id', trips['trip_id'].to_numpy()[unused], message="Trip has no stop_times"))
+    return issues
+
+
+def check_stop_times(mode_id : str, tables : dict[str, pd.DataFrame]) -> list[pd.DataFrame]:
+    """
+    Checks that stop_times times are valid HH:MM:SS, that arrival is not after departure at a stop, and that times and
+    shape_dist_traveled do not decrease along a trip. Trips are sorted by stop_sequence once, and each check compares consecutive rows.
+    """
+    issues = []
+    stop_times = tables.get('stop_times')
+    if stop_times is None or not all(column in stop_times.columns for column in ['trip_id', 'stop_sequence']):
+        return issues
+
+    times = {}
+    for column in ['arrival_time', 'departure_time']:
+        if column not in stop_times.columns:
+            continue
+        seconds = gtfs_time_to_seconds(stop_times[column])
+        invalid = (seconds < 0) & stop_times[column].notna().to_numpy()
+        if invalid.any():
+            issues.append(make_issues(mode_id, 'stop_times', 'invalid_time', 'error', stop_times.index[invalid], column, stop_times[column].to_numpy()[invalid], message=f"{column} is not HH:MM:SS"))
+        times[column] = seconds
+
+    if len(times) == 2:
+        after = (times['arrival_time'] >= 0) & (times['departure_time'] >= 0) & (times['arrival_time'] > times['departure_time'])
+        if after.any():
+            issues.append(make_issues(mode_id, 'stop_times', 'arrival_after_departure', 'error', stop_times.index[after], 'arrival_time', stop_times['arrival_time'].to_numpy()[after], message="arrival_time is after departure_time"))
+
+    trip_codes = pd.factorize(stop_times['trip_id'])[0]
+    order = np.lexsort((stop_times['stop_sequence'].to_numpy(), trip_codes))
+    same_trip = trip_codes[order][1:] == trip_codes[order][:-1]
+    index = stop_times.index[order[1:]]
+
+    if len(times) > 0:
+        # Compare each stop with the previous stop of the trip that has a time, as intermediate stops may have none
+        arrival = times.get('arrival_time', times.get('departure_time'))[order]
+        departure = times.get('departure_time', times.get('arrival_time'))[order]
+        timed = np.flatnonzero((arrival >= 0) | (departure >= 0))
+        arrival, departure = np.where(arrival >= 0, arrival, departure)[timed], np.where(departure >= 0, departure, arrival)[timed]
+        timed_trips = trip_codes[order][timed]
+        decreasing = (timed_trips[1:] == timed_trips[:-1]) & (arrival[1:] < departure[:-1])
+        if decreasing.any():
+            rows = order[timed[1:]][decreasing]
+            issues.append(make_issues(
+                mode_id, 'stop_times', 'non_monotonic_time', 'error', stop_times.index[rows], 'trip_id',
+                stop_times['trip_id'].to_numpy()[rows], message="Time is before the previous stop of the trip",
+            ))
+
+    if 'shape_dist_traveled' in stop_times.columns:
+        distance = stop_times['shape_dist_traveled'].to_numpy(dtype=np.float64)[order]
+        decreasing = same_trip & (distance[1:] < distance[:-1])
+        if decreasing.any():
+            issues.append(make_issues(
+                mode_id, 'stop_times', 'decreasing_shape_dist', 'warning', index[decreasing], 'shape_dist_traveled',
+                distance[1:][decreasing], message="shape_dist_traveled is less than at the previous stop of the trip",
+            ))
+    return issues
+
+
+def check_coordinates(mode_id : str, tables : dict[str, pd.DataFrame], bounds : tuple[float, float, float, float] = COORDINATE_BOUNDS) -> list[pd.DataFrame]:
+    """
+    Checks that stops and shapes coordinates are present and within bounds, (min_lat, min_lon, max_lat, max_lon).
+    """
+    issues = []
+    min_lat, min_lon, max_lat, max_lon = bounds
+    for table_name, lat_column, lon_column in [('stops', 'stop_lat', 'stop_lon'), ('shapes', 'shape_pt_lat', 'shape_pt_lon')]:
+        df = tables.get(table_name)
+        if df is None or lat_column not in df.columns or lon_column not in df.columns:
+            continue
+        lat = df[lat_column].to_numpy(dtype=np.float64)
+        lon = df[lon_column].to_numpy(dtype=np.float64)
+        missing = np.isnan(lat) | np.isnan(lon)
+        if missing.any():
+            issues.append(make_issues(mode_id, table_name, 'missing_value', 'error', df.index[missing], f'{lat_column},{lon_column}', message="Coordinates are missing"))
+        outside = ~missing & ((lat < min_lat) | (lat > max_lat) | (lon < min_lon) | (lon > max_lon))
+        if outside.any():
+            values = [f'{y},{x}' for y, x in zip(lat[outside].tolist(), lon[outside].tolist())]
+            issues.append(make_issues(mode_id, table_name, 'coordinates_out_of_bounds', 'error', df.index[outside], f'{lat_column},{lon_column}', values, message=f"Coordinates are outside {bounds}"))
+    return issues
+
+
+def check_calendar(mode_id : str, tables : dict[str, pd.DataFrame]) -> list[pd.DataFrame]:
+    """
+    Checks that calendar and calendar_dates dates are valid YYYYMMDD dates, and that calendar start_date is not after end_date.
+    """
+    issues = []
+    for table_name, columns in [('calendar', ['start_date', 'end_date']), ('calendar_dates', ['date'])]:
+        df = tables.get(table_name)
+        if df is None:
+            continue
+        for column in columns:
+            if column not in df.columns:
+                continue
+            invalid = pd.to_datetime(df[column], format='%Y%m%d', errors='coerce').isna().to_numpy()
+            if invalid.any():
+                issues.append(make_issues(mode_id, table_name, 'invalid_date', 'error', df.index[invalid], column, df[column].to_numpy()[invalid], message=f"{column} is not YYYYMMDD"))
+    calendar = tables.get('calendar')
+    if calendar is not None and 'start_date' in calendar.columns and 'end_date' in calendar.columns:
+        reversed_dates = (calendar['start_date'].astype(str) > calendar['end_date'].astype(str)).to_numpy()
+        if reversed_dates.any():
+            issues.append(make_issues(mode_id, 'calendar', 'start_after_end', 'error', calendar.index[reversed_dates], 'start_date', calendar['start_date'].to_numpy()[reversed_dates], message="start_date is after end_date"))
+    return issues
+
+
+# Checks run by validate_gtfs, in order
+CHECKS = {
+    'tables': check_tables,
+    'keys': check_keys,
+    'foreign_keys': check_foreign_keys,
+    'stop_times': check_stop_times,
+    'coordinates': check_coordinates,
+    'calendar': check_calendar,
+}
+
+
+def validate_gtfs(
+        DFK : dict[str, dict[str, pd.DataFrame]],
+        bounds : tuple[float, float, float, float] = COORDINATE_BOUNDS,
+        budget_seconds : float = None,
+        profile : bool = False,
+    ) -> pd.DataFrame | tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Validates the dictionary returned by `read_gtfs_zip`, and returns the issues found as a DataFrame with columns:
+    mode_id, table_name, rule, severity ('error' or 'warning'), row (the index label of the row in the table, -1 for the whole table),
+    column, value (the offending value as a string, if any) and message.
+
+    Each check in CHECKS is a vectorized pass over a mode's tables: isin joins for references, duplicated for keys,
+    and diffs over stop_times sorted by trip and stop_sequence for times.
+
+    Parameters:
+    - bounds: (min_lat, min_lon, max_lat, max_lon) for stops and shapes coordinates.
+    - budget_seconds: If the validation takes longer, a 'performance_budget' warning is added to the issues.
+    - profile: If True, also return a DataFrame of the seconds each check took per mode, with columns mode_id, check, seconds and issues.
+    """
+    start = time.perf_counter()
+    issues = []
+    profile_rows = []
+    for mode_id, tables in DFK.items():
+        for check_name, check in CHECKS.items():
+            check_start = time.perf_counter()
+            check_issues = check(mode_id, tables, bounds) if check is check_coordinates else check(mode_id, tables)
+            issues.extend(check_issues)
+            profile_rows.append({
+                'mode_id': mode_id,
+                'check': check_name,
+                'seconds': time.perf_counter() - check_start,
+                'issues': sum(len(check_issue) for check_issue in check_issues),
+            })
+
+    seconds = time.perf_counter() - start
+    if budget_seconds is not None and seconds > budget_seconds:
+        issues.append(make_issues(None, None, 'performance_budget', 'warning', [-1], message=f"Validation took {seconds:.2f} seconds, over the budget of {budget_seconds} seconds"))
+
+    issues = pd.concat(issues, ignore_index=True) if issues else pd.DataFrame(columns=ISSUE_COLUMNS)
+    if not profile:
+        return issues
+    return issues, pd.DataFrame(profile_rows)
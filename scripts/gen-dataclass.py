@@ -1,49 +1,87 @@
 import requests
+import argparse
+import json
 import os
 
 # FIELD_TYPES = set()
 
 FIELD_TYPES_MAP = {
-    'array': 'list', 
-    'boolean': 'bool', 
-    'integer': 'int', 
-    'number': 'float', 
-    'object': "object", 
+    'array': 'list',
+    'boolean': 'bool',
+    'integer': 'int',
+    'number': 'float',
+    'object': "object",
     'string': 'str'
 }
 
+SWAGGER_DOCS_URL = 'https://timetableapi.ptv.vic.gov.au/swagger/docs/v3'
+
+
 def get_dataclass_name(class_name):
     return 'V3' + class_name
 
 
-def generate_dataclass(class_name : str, schema : dict[str, dict[str, dict[str, dict]]]):
-    fields = []
+def get_dataclass_decorator(slots : bool = True, frozen : bool = False, kw_only : bool = False) -> str:
+    """
+    Returns the decorator line for a generated dataclass, e.g. `@dataclass(slots=True)`.
+    """
+    options = []
+    if slots:
+        options.append('slots=True')
+    if frozen:
+        options.append('frozen=True')
+    if kw_only:
+        options.append('kw_only=True')
+    if len(options) == 0:
+        return '@dataclass'
+    return f"@dataclass({', '.join(options)})"
+
+
+def generate_dataclass(
+        class_name : str,
+        schema : dict[str, dict[str, dict[str, dict]]],
+        slots : bool = True,
+        frozen : bool = False,
+        kw_only : bool = False,
+    ):
+    """
+    Returns the source code of a dataclass for a swagger definition, and the set of classes it depends on.
+
+    Properties listed in the schema's `required` are typed as-is.
+    Every other property may be missing or null in API responses, so it is typed `T | None` and defaults to None.
+    Unless `kw_only` is set, required fields are emitted first so that the defaulted fields can follow them.
+    """
+    required_fields = []
+    optional_fields = []
     class_dependencies = set()
+    required = set(schema.get("required", []))
     for prop_name, prop_schema in schema["properties"].items():
         if "type" in prop_schema:
             if prop_schema["type"] == "object":
                 assert "additionalProperties" in prop_schema, f"Missing additionalProperties for {prop_name}"
                 if "$ref" in prop_schema["additionalProperties"]:
-                    field_type = prop_schema["additionalProperties"]["$ref"].split("#/definitions/V3.", 1)[1]
-                    field_type = get_dataclass_name(field_type)
-                    class_dependencies.add(field_type)
+                    value_type = prop_schema["additionalProperties"]["$ref"].split("#/definitions/V3.", 1)[1]
+                    value_type = get_dataclass_name(value_type)
+                    class_dependencies.add(value_type)
                 else:
                     assert "type" in prop_schema["additionalProperties"], f"Missing type for {prop_name}"
-                    field_type = prop_schema["additionalProperties"]["type"]
-                    # FIELD_TYPES.add(field_type)
-                    field_type = FIELD_TYPES_MAP[field_type]
-                
+                    value_type = prop_schema["additionalProperties"]["type"]
+                    # FIELD_TYPES.add(value_type)
+                    value_type = FIELD_TYPES_MAP[value_type]
+                field_type = f"dict[str, {value_type}]"
+
             elif prop_schema["type"] == "array":
                 if "type" in prop_schema["items"]:
                     inner_type = prop_schema["items"]["type"]
                     # FIELD_TYPES.add(inner_type)
                     inner_type = FIELD_TYPES_MAP[inner_type]
                     field_type = f"list[{inner_type}]"
-                        
+
                 else:
                     field_type = prop_schema["items"]["$ref"].split("#/definitions/V3.", 1)[1]
                     field_type = get_dataclass_name(field_type)
                     class_dependencies.add(field_type)
+                    field_type = f"list[{field_type}]"
             else:
                 field_type = prop_schema["type"]
                 # FIELD_TYPES.add(field_type)
@@ -52,23 +90,42 @@ def generate_dataclass(class_name : str, schema : dict[str, dict[str, dict[str,
             field_type = prop_schema["$ref"].split("#/definitions/V3.", 1)[1]
             field_type = get_dataclass_name(field_type)
             class_dependencies.add(field_type)
-        
-        description = prop_schema.get("description", "")
-        
+
+        description = prop_schema.get("description", "").replace("\r\n", "\n")
+
+        if prop_name in required:
+            field_signature = f"{prop_name}: {field_type}"
+        else:
+            field_signature = f"{prop_name}: {field_type} | None = None"
+
         # fields.append(f"    {prop_name}: {field_type}\n    \"\"\"\n{description}\n\"\"\"")
-        fields.append(f"    {prop_name}: {field_type}\n    \"\"\"\n    {description.replace("\n", "\n    ")}\n    \"\"\"")
+        field_code = f"    {field_signature}\n    \"\"\"\n    {description.replace("\n", "\n    ")}\n    \"\"\""
 
-    class_description = schema.get("description", "")
+        if prop_name in required or kw_only:
+            required_fields.append(field_code)
+        else:
+            optional_fields.append(field_code)
 
-    class_field_signature = "\n".join(fields) if len(fields) > 0 else "    pass"
+    fields = required_fields + optional_fields
 
-    return f"@dataclass\nclass {class_name}:\n    \"\"\"\n    {class_description.replace("\n", "\n    ")}\n    \"\"\"\n" + class_field_signature, class_dependencies
+    class_description = schema.get("description", "").replace("\r\n", "\n")
 
+    class_field_signature = "\n".join(fields) if len(fields) > 0 else "    pass"
 
-if __name__ == "__main__":
+    decorator = get_dataclass_decorator(slots=slots, frozen=frozen, kw_only=kw_only)
 
-    docs_definitions : dict[str, dict] = requests.get('https://timetableapi.ptv.vic.gov.au/swagger/docs/v3').json()['definitions']
+    return f"{decorator}\nclass {class_name}:\n    \"\"\"\n    {class_description.replace("\n", "\n    ")}\n    \"\"\"\n" + class_field_signature, class_dependencies
 
+
+def generate_module(
+        docs_definitions : dict[str, dict],
+        slots : bool = True,
+        frozen : bool = False,
+        kw_only : bool = False,
+    ) -> str:
+    """
+    Returns the source code of the types module for the swagger definitions, with classes ordered by their dependencies.
+    """
     # Generate dataclasses
     generated_codes = {}
     class_dependencies_map = {}
@@ -77,7 +134,7 @@ if __name__ == "__main__":
         # for key in schema.keys():
         #     keys_set.add(key)
         dataclass_name = get_dataclass_name(class_name.split('.', 1)[1])
-        generated_code, class_dependencies = generate_dataclass(dataclass_name, schema)
+        generated_code, class_dependencies = generate_dataclass(dataclass_name, schema, slots=slots, frozen=frozen, kw_only=kw_only)
         generated_codes[dataclass_name] = generated_code
         class_dependencies_map[dataclass_name] = class_dependencies
 
@@ -97,11 +154,32 @@ if __name__ == "__main__":
                 class_ordered_set.add(class_name)
             else:
                 class_dependencies_map[class_name] = dependencies - set(class_ordered)
-    
+
+    code = "from dataclasses import dataclass\n\n\n"
+    for class_name in class_ordered:
+        code += generated_codes[class_name]
+        code += "\n\n"
+    return code
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Generate pyptvdata/apiv3/types.py from the PTV API swagger definitions.")
+    parser.add_argument('--definitions', help="Path to a local definitions.json, e.g. pyptvdata/apiv3/definitions.json. Fetched from the swagger docs if not given.")
+    parser.add_argument('--no-slots', action='store_true', help="Emit plain dataclasses with a per-instance __dict__.")
+    parser.add_argument('--frozen', action='store_true', help="Emit frozen (immutable, hashable) dataclasses.")
+    parser.add_argument('--kw-only', action='store_true', help="Emit keyword-only dataclasses, keeping the swagger field order.")
+    args = parser.parse_args()
+
+    if args.definitions is not None:
+        with open(args.definitions) as f:
+            docs_definitions : dict[str, dict] = json.load(f)
+    else:
+        docs_definitions : dict[str, dict] = requests.get(SWAGGER_DOCS_URL).json()['definitions']
+
+    code = generate_module(docs_definitions, slots=not args.no_slots, frozen=args.frozen, kw_only=args.kw_only)
+
     module_path = "../pyptvdata/apiv3/types.py"
     module_path = os.path.join(os.path.dirname(__file__), module_path)
-    with open(module_path, 'w') as f:
-        f.write("from dataclasses import dataclass\n\n\n")
-        for class_name in class_ordered:
-            f.write(generated_codes[class_name])
-            f.write("\n\n")
+    with open(module_path, 'w', newline='\n') as f:
+        f.write(code)
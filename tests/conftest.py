@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.fixtures import make_gtfs_zip
+from pyptvdata.gtfs import read_gtfs_zip
+from pyptvdata.unified import build_unified_feed
+
+
+# The synthetic feed runs the weekday timetable (service T0) on this date
+DATE = '20240312'
+
+
+@pytest.fixture(scope='session')
+def gtfs_zip_path(tmp_path_factory) -> str:
+    """
+    A small synthetic gtfs.zip with metropolitan tram and bus, see `benchmarks.fixtures.make_gtfs_mode_tables`.
+    """
+    path = str(tmp_path_factory.mktemp('gtfs') / 'gtfs.zip')
+    make_gtfs_zip(path, scale=0.25, mode_ids=['3', '4'])
+    return path
+
+
+@pytest.fixture(scope='session')
+def DFK(gtfs_zip_path) -> dict:
+    """
+    The synthetic feed read with `read_gtfs_zip`. Tests must not modify it.
+    """
+    return read_gtfs_zip(gtfs_zip_path)
+
+
+@pytest.fixture(scope='session')
+def feed(DFK) -> dict:
+    """
+    The bus mode of the synthetic feed.
+    """
+    return DFK['4']
+
+
+@pytest.fixture(scope='session')
+def unified(DFK) -> dict:
+    """
+    The synthetic feed merged with `build_unified_feed`.
+    """
+    return build_unified_feed(DFK)
+
+
+def get_brute_force_arrivals(network : dict, origin_stops : list[int], origin_seconds : list[int], departure_time : int, max_seconds : int) -> np.ndarray:
+    """
+    Returns the earliest arrival time at each stop of a `build_transit_network` network, -1 if not reached within max_seconds,
+    by repeated relaxation rather than a connection scan: each round rides every trip from the first stop it can be boarded at,
+    and then walks one transfer from each stop arrived at by vehicle, or from the origin stops, until no time improves.
+    """
+    n_stops = len(network['stop_lat'])
+    end_time = departure_time + max_seconds
+    unreached = end_time + 1
+    ridden = np.full(n_stops, unreached, dtype=np.int64)
+    for stop, seconds in zip(origin_stops, origin_seconds):
+        ridden[stop] = min(ridden[stop], departure_time + seconds)
+
+    in_window = (network['dep_time'] >= departure_time) & (network['dep_time'] <= end_time)
+    connections = pd.DataFrame({name: network[name][in_window] for name in ['dep_stop', 'arr_stop', 'dep_time', 'arr_time', 'trip']})
+    trips = [trip_connections.to_numpy() for _, trip_connections in connections.groupby('trip', sort=False)[['dep_stop', 'arr_stop', 'dep_time', 'arr_time']]]
+    walk_from = np.repeat(np.arange(n_stops), np.diff(network['transfer_indptr']))
+
+    while True:
+        earliest = ridden.copy()
+        np.minimum.at(earliest, network['transfer_to'], ridden[walk_from] + network['transfer_seconds'])
+        new_ridden = ridden.copy()
+        for trip_connections in trips:
+            boarded = False
+            for dep_stop, arr_stop, dep_time, arr_time in trip_connections:
+                boarded = boarded or earliest[dep_stop] <= dep_time
+                if boarded and arr_time <= end_time:
+                    new_ridden[arr_stop] = min(new_ridden[arr_stop], arr_time)
+        if (new_ridden == ridden).all():
+            return np.where(earliest <= end_time, earliest, -1)
+        ridden = new_ridden
@@ -0,0 +1,73 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyptvdata import accessibility
+from pyptvdata.accessibility import attach_network, get_accessibility, get_origin_scores, share_network
+from pyptvdata.isochrone import build_transit_network
+
+from .conftest import DATE, get_brute_force_arrivals
+
+
+def test_share_network_round_trip(unified):
+    network = build_transit_network(unified, DATE)
+    shm, layout = share_network(network)
+    try:
+        attached_shm, attached = attach_network(shm.name, layout)
+        for name, values in network.items():
+            np.testing.assert_array_equal(attached[name], values)
+        del attached
+        attached_shm.close()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    with pytest.raises(FileNotFoundError):
+        attach_network(shm.name, layout)
+
+
+def test_get_accessibility_unlinks_the_shared_network(unified, monkeypatch):
+    network = build_transit_network(unified, DATE)
+    names = []
+
+    def recording_share_network(network):
+        shm, layout = share_network(network)
+        names.append(shm.name)
+        return shm, layout
+
+    monkeypatch.setattr(accessibility, 'share_network', recording_share_network)
+    get_accessibility(network, list(range(8)), processes=2, chunksize=4)
+    assert len(names) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=names[0])
+
+
+def test_origin_scores_match_brute_force(unified):
+    network = build_transit_network(unified, DATE)
+    n_stops = len(network['stop_lat'])
+    origins = list(range(0, n_stops, 6))
+    departure_times = [7 * 3600, 8 * 3600 + 300]
+    thresholds = np.array([600, 1200, 1800])
+    opportunities = np.arange(1, n_stops + 1, dtype=np.float64)
+    scores = get_origin_scores(network, origins, departure_times, thresholds, opportunities)
+
+    expected = np.zeros((len(origins), len(thresholds)))
+    for k, origin in enumerate(origins):
+        for departure_time in departure_times:
+            earliest = get_brute_force_arrivals(network, [origin], [0], departure_time, int(thresholds[-1]))
+            travel_seconds = np.where(earliest >= 0, earliest - departure_time, thresholds[-1] + 1)
+            expected[k] += [opportunities[travel_seconds <= threshold].sum() for threshold in thresholds]
+    np.testing.assert_allclose(scores, expected / len(departure_times))
+    assert (expected[:, -1] > expected[:, 0]).any()
+
+
+def test_accessibility_in_worker_processes(unified):
+    network = build_transit_network(unified, DATE)
+    origins = np.flatnonzero(~np.isnan(network['stop_lat']))[:12].tolist()
+    opportunities = np.arange(len(network['stop_lat']), dtype=np.float64)
+    serial = get_accessibility(network, origins, opportunities=opportunities, processes=1)
+    parallel = get_accessibility(network, origins, opportunities=opportunities, processes=2, chunksize=4)
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert list(serial.columns) == [15, 30, 45, 60] and list(serial.index) == origins
@@ -0,0 +1,60 @@
+from pyptvdata.apiv3 import PTVAPI3
+
+
+STOP_NAMES = {(0, 1000): 'Flinders Street Station', (2, 1000): 'Swanston St/Flinders St', (2, 1001): 'Bourke St/Swanston St'}
+
+
+def make_client() -> tuple[PTVAPI3, list[dict]]:
+    """
+    Returns a client whose post_data answers bulk departure requests like the API, with stops keyed by stop_id only,
+    and the list of request bodies it was sent.
+    """
+    client = PTVAPI3('0', 'key')
+    bodies = []
+
+    def post_data(endpoint, data, **kwargs):
+        bodies.append(data)
+        responses, stops, runs, disruptions = [], {}, [], {}
+        for stop_request in data['requests']:
+            route_type, stop_id = stop_request['route_type'], stop_request['stop_id']
+            stops[str(stop_id)] = {'stop_id': stop_id, 'stop_name': STOP_NAMES[(route_type, stop_id)]}
+            for route_direction in stop_request['route_directions']:
+                run_ref = f"{route_type}-{route_direction['route_id']}"
+                responses.append({'route_type': route_type, 'stop_id': stop_id, 'requested_route_direction': route_direction, 'departures': [{'run_ref': run_ref}]})
+                runs.append({'run_ref': run_ref})
+                disruptions[str(route_direction['route_id'])] = {'disruption_id': route_direction['route_id']}
+        return {'responses': responses, 'stops': stops, 'runs': runs, 'routes': [], 'directions': [], 'disruptions': disruptions}
+
+    client.post_data = post_data
+    return client, bodies
+
+
+def test_get_bulk_departures_merges_requests_and_expansions():
+    client, bodies = make_client()
+    results = client.get_bulk_departures([
+        {'route_type': 2, 'stop_id': 1000, 'route_directions': [{'route_id': 1, 'direction_id': 0}]},
+        {'route_type': 2, 'stop_id': 1000, 'route_directions': [{'route_id': 1, 'direction_id': 0}, {'route_id': 2, 'direction_id': 0}]},
+        {'route_type': 2, 'stop_id': 1001},
+    ], batch_size=1)
+    assert len(bodies) == 2
+    assert [len(body['requests']) for body in bodies] == [1, 1]
+    assert len(results['departures'][(2, 1000)]['responses']) == 2
+    # A stop request without route_directions is sent, but has no route directions to return departures for
+    assert bodies[1]['requests'][0]['route_directions'] == []
+    assert (2, 1001) not in results['departures']
+    assert [run['run_ref'] for run in results['runs']] == ['2-1', '2-2']
+    assert sorted(results['disruptions']) == ['1', '2']
+
+
+def test_get_bulk_departures_keys_stops_by_route_type():
+    client, bodies = make_client()
+    results = client.get_bulk_departures([
+        {'route_type': 0, 'stop_id': 1000, 'route_directions': [{'route_id': 1, 'direction_id': 0}]},
+        {'route_type': 2, 'stop_id': 1000, 'route_directions': [{'route_id': 1, 'direction_id': 0}]},
+        {'route_type': 2, 'stop_id': 1001, 'route_directions': [{'route_id': 1, 'direction_id': 0}]},
+    ])
+    # The stops of one response are keyed by stop_id only, so the same stop_id of two route types needs two requests
+    assert len(bodies) == 2
+    assert results['departures'][(0, 1000)]['stop']['stop_name'] == 'Flinders Street Station'
+    assert results['departures'][(2, 1000)]['stop']['stop_name'] == 'Swanston St/Flinders St'
+    assert results['departures'][(2, 1001)]['stop']['stop_name'] == 'Bourke St/Swanston St'
@@ -0,0 +1,98 @@
+import threading
+from concurrent.futures import Future
+
+import pytest
+import requests
+
+from pyptvdata import apiv3
+from pyptvdata.apiv3 import PTVAPIClient
+
+
+N_CALLERS = 8
+
+
+class FakeResponse:
+    def __init__(self, status_code : int, content : bytes):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Error', response=self)
+
+
+class BlockingTransport:
+    """
+    Answers GET requests once released, so that callers pile up while a request is in flight.
+    """
+    def __init__(self, status_code : int, content : bytes = b'{"route_types": []}'):
+        self.session = None
+        self.status_code = status_code
+        self.content = content
+        self.urls = []
+        self.release = threading.Event()
+
+    def get(self, url : str, headers : dict = None):
+        self.urls.append(url)
+        assert self.release.wait(10)
+        return FakeResponse(self.status_code, self.content)
+
+
+def call_concurrently(client : PTVAPIClient, endpoints : list[str], monkeypatch) -> list:
+    """
+    Calls get_data for each endpoint in its own thread, releases the transport once every caller but the owner waits for its result,
+    and returns the results, or the exceptions raised.
+    """
+    waiting = threading.Semaphore(0)
+
+    class CountingFuture(Future):
+        def result(self, timeout=None):
+            waiting.release()
+            return super().result(timeout)
+
+    monkeypatch.setattr(apiv3, 'Future', CountingFuture)
+    results = [None] * len(endpoints)
+
+    def call(k : int):
+        try:
+            results[k] = client.get_data(endpoints[k])
+        except Exception as e:
+            results[k] = e
+
+    threads = [threading.Thread(target=call, args=(k,)) for k in range(len(endpoints))]
+    for thread in threads:
+        thread.start()
+    for _ in range(len(endpoints) - 1):
+        assert waiting.acquire(timeout=10)
+    client.transport.release.set()
+    for thread in threads:
+        thread.join(10)
+    return results
+
+
+def test_coalesced_callers_share_one_request(monkeypatch):
+    client = PTVAPIClient('0', 'key', coalesce_requests=True, transport=BlockingTransport(200))
+    # The same query with its parameters in another order is the same request
+    endpoints = ['/v3/route_types?a=1&b=2' if k % 2 else '/v3/route_types?b=2&a=1' for k in range(N_CALLERS)]
+    results = call_concurrently(client, endpoints, monkeypatch)
+    assert len(client.transport.urls) == 1
+    assert all(result is results[0] for result in results)
+    assert results[0] == {'route_types': []}
+    assert client._in_flight == {}
+
+
+def test_owner_exception_reaches_every_waiter(monkeypatch):
+    client = PTVAPIClient('0', 'key', coalesce_requests=True, transport=BlockingTransport(503))
+    results = call_concurrently(client, ['/v3/route_types'] * N_CALLERS, monkeypatch)
+    assert len(client.transport.urls) == 1
+    assert all(isinstance(result, requests.HTTPError) for result in results)
+    assert client._in_flight == {}
+
+
+def test_requests_are_not_coalesced_by_default():
+    transport = BlockingTransport(200)
+    transport.release.set()
+    client = PTVAPIClient('0', 'key', transport=transport)
+    assert client.get_data('/v3/route_types') is not client.get_data('/v3/route_types')
+    assert len(transport.urls) == 2
@@ -0,0 +1,74 @@
+import datetime
+
+from pyptvdata.apiv3 import PTVAPI3
+
+
+def make_times(start : str, end : str, minutes : int) -> list[str]:
+    time = datetime.datetime.fromisoformat(start)
+    end = datetime.datetime.fromisoformat(end)
+    times = []
+    while time <= end:
+        times.append(time.strftime('%Y-%m-%dT%H:%M:%SZ'))
+        time += datetime.timedelta(minutes=minutes)
+    return times
+
+
+def make_client(timetable : dict[tuple[int, int], list[str]]) -> PTVAPI3:
+    """
+    Returns a client whose get_departures answers from timetable {(route_id, direction_id): departure times}, like the API:
+    up to max_results departures per route and direction, at or after date_utc.
+    """
+    client = PTVAPI3('0', 'key')
+
+    def get_departures(date_utc=None, max_results=None, **kwargs):
+        departures = []
+        for (route_id, direction_id), times in timetable.items():
+            times = [time for time in times if date_utc is None or time >= date_utc][:max_results]
+            departures.extend({
+                'stop_id': 1000,
+                'route_id': route_id,
+                'direction_id': direction_id,
+                'run_ref': f'{route_id}-{direction_id}-{time}',
+                'scheduled_departure_utc': time,
+            } for time in times)
+        return {'departures': departures}
+
+    client.get_departures = get_departures
+    return client
+
+
+def get_yielded(client : PTVAPI3, **kwargs) -> list[tuple]:
+    return [
+        (departure['route_id'], departure['direction_id'], departure['scheduled_departure_utc'])
+        for page in client.iter_departures(stop_id=1000, route_type=2, **kwargs)
+        for departure in page['departures']
+    ]
+
+
+def test_iter_departures_continues_after_a_route_runs_out():
+    timetable = {
+        (1, 0): make_times('2024-03-01T10:00:00', '2024-03-01T10:05:00', 5),
+        (2, 0): make_times('2024-03-01T10:00:00', '2024-03-01T11:55:00', 5),
+    }
+    yielded = get_yielded(make_client(timetable), date_utc='2024-03-01T10:00:00Z', page_size=3)
+    expected = [(route_id, direction_id, time) for (route_id, direction_id), times in timetable.items() for time in times]
+    assert len(yielded) == 26
+    assert sorted(yielded) == sorted(expected)
+
+
+def test_iter_departures_does_not_skip_unfetched_route_directions():
+    timetable = {
+        (1, 0): make_times('2024-03-01T10:00:00', '2024-03-01T10:30:00', 1),
+        (1, 1): make_times('2024-03-01T10:00:00', '2024-03-01T12:00:00', 20),
+        (2, 0): make_times('2024-03-01T10:10:00', '2024-03-01T10:50:00', 10),
+    }
+    yielded = get_yielded(make_client(timetable), date_utc='2024-03-01T10:00:00Z', page_size=4)
+    expected = [(route_id, direction_id, time) for (route_id, direction_id), times in timetable.items() for time in times]
+    assert len(yielded) == len(set(yielded))
+    assert sorted(yielded) == sorted(expected)
+
+
+def test_iter_departures_stops_at_end_utc():
+    timetable = {(1, 0): make_times('2024-03-01T10:00:00', '2024-03-01T12:00:00', 5)}
+    yielded = get_yielded(make_client(timetable), date_utc='2024-03-01T10:00:00Z', end_utc='2024-03-01T11:00:00Z', page_size=5)
+    assert [time for _, _, time in yielded] == make_times('2024-03-01T10:00:00', '2024-03-01T10:55:00', 5)
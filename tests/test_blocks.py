@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+
+from pyptvdata.blocks import chain_trips, get_peak_vehicles, infer_blocks
+
+from .conftest import DATE
+
+
+def get_brute_force_peak(start_seconds : np.ndarray, end_seconds : np.ndarray) -> int:
+    # The count in service is highest just after some block starts
+    return max(((start_seconds <= start) & (end_seconds > start)).sum() for start in start_seconds)
+
+
+def test_chain_trips_layover_window():
+    # Trip 1 waits the minimum layover after trip 0, trip 2 is too early for it, trip 4 starts where no vehicle waits,
+    # and trip 3 comes after the vehicles of trips 1 and 2 left service. Blocks are numbered in order of start
+    blocks = chain_trips(
+        group_codes=np.zeros(5, dtype=np.int64),
+        start_seconds=np.array([0, 280, 250, 2000, 400]),
+        end_seconds=np.array([100, 380, 300, 2100, 500]),
+        first_terminals=np.array([0, 1, 1, 0, 1]),
+        last_terminals=np.array([1, 0, 0, 1, 0]),
+        min_layover=180,
+        max_layover=600,
+    )
+    assert blocks.tolist() == [0, 0, 1, 3, 2]
+
+    # The vehicle that has waited longest is used first, and only within its group
+    blocks = chain_trips(
+        group_codes=np.array([0, 0, 1, 0]),
+        start_seconds=np.array([0, 10, 500, 600]),
+        end_seconds=np.array([100, 50, 550, 700]),
+        first_terminals=np.zeros(4, dtype=np.int64),
+        last_terminals=np.zeros(4, dtype=np.int64),
+        min_layover=60,
+        max_layover=3600,
+    )
+    assert blocks.tolist() == [0, 1, 2, 1]
+
+
+def test_get_peak_vehicles_matches_brute_force():
+    rng = np.random.default_rng(0)
+    start_seconds = rng.integers(0, 20000, 200)
+    blocks = pd.DataFrame({
+        'group': rng.choice(['a', 'b', 'c'], 200),
+        'start_seconds': start_seconds,
+        'end_seconds': start_seconds + rng.integers(1, 5000, 200),
+    })
+    # A block that ends when another starts does not overlap it
+    blocks.loc[1, ['start_seconds', 'end_seconds']] = blocks.loc[0, 'end_seconds'] + np.array([0, 100])
+    peak = get_peak_vehicles(blocks).set_index('group')
+    assert sorted(peak.index[:-1]) == ['a', 'b', 'c'] and peak.index[-1] == 'all'
+    for group, group_blocks in [*blocks.groupby('group'), ('all', blocks)]:
+        starts, ends = group_blocks['start_seconds'].to_numpy(), group_blocks['end_seconds'].to_numpy()
+        assert peak.loc[group, 'peak_vehicles'] == get_brute_force_peak(starts, ends), group
+        assert peak.loc[group, 'blocks'] == len(group_blocks)
+        at_peak = peak.loc[group, 'peak_seconds']
+        assert ((starts <= at_peak) & (ends > at_peak)).sum() == peak.loc[group, 'peak_vehicles']
+
+
+def test_get_peak_vehicles_without_blocks():
+    peak = get_peak_vehicles(pd.DataFrame({'group': [], 'start_seconds': [], 'end_seconds': []}))
+    assert peak.to_dict('records') == [{'group': 'all', 'peak_vehicles': 0, 'peak_seconds': -1, 'blocks': 0}]
+
+
+def test_infer_blocks_chains_valid_trips(feed):
+    result = infer_blocks(feed, DATE, min_layover_minutes=3, max_layover_minutes=60, merge_distance=0)
+    trips = result['trips']
+    assert len(trips) == (feed['trips']['service_id'] == 'T0').sum()
+    assert len(result['blocks']) < len(trips)
+
+    # Consecutive trips of a block are on the same route, leave from the stop where the last trip ended, and wait within the layover window
+    next_trips = trips.groupby('block_id').shift(-1)
+    chained = next_trips['trip_id'].notna()
+    assert (trips.loc[chained, 'route_id'] == next_trips.loc[chained, 'route_id']).all()
+    assert (trips.loc[chained, 'last_stop'] == next_trips.loc[chained, 'first_stop']).all()
+    assert trips.loc[chained, 'layover_seconds'].between(180, 3600).all()
+    assert (trips.loc[~chained, 'layover_seconds'] == -1).all()
+
+    blocks = result['blocks']
+    assert blocks['n_trips'].sum() == len(trips)
+    all_peak = result['peak'].set_index('group').loc['all', 'peak_vehicles']
+    assert all_peak == get_brute_force_peak(blocks['start_seconds'].to_numpy(), blocks['end_seconds'].to_numpy())
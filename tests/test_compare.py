@@ -0,0 +1,46 @@
+import numpy as np
+
+from pyptvdata.compare import compare_feeds, get_pattern_hashes
+from pyptvdata.patterns import build_trip_patterns
+
+
+def without_trips(feed : dict, trip_ids) -> dict:
+    trips = feed['trips'][~feed['trips']['trip_id'].isin(trip_ids)]
+    return {**feed, 'trips': trips, 'stop_times': feed['stop_times'][feed['stop_times']['trip_id'].isin(trips['trip_id'])]}
+
+
+def test_identical_feeds_are_unchanged(DFK):
+    result = compare_feeds(DFK, DFK)
+    for name in ['routes', 'patterns', 'stops']:
+        assert (result[name]['status'] == 'unchanged').all(), name
+    assert (result['summary'][['routes_added', 'routes_removed', 'routes_changed', 'stops_changed']] == 0).all().all()
+
+
+def test_compare_feeds_finds_changes(DFK):
+    feed = DFK['4']
+    route_ids = feed['routes']['route_id'].tolist()
+    weekday_trips = feed['trips'][feed['trips']['service_id'] == 'T0']
+    removed_route_trips = feed['trips'].loc[feed['trips']['route_id'] == route_ids[0], 'trip_id']
+    dropped_trip = weekday_trips.loc[weekday_trips['route_id'] == route_ids[1], 'trip_id'].iloc[0]
+    new_DFK = {**DFK, '4': without_trips(feed, [*removed_route_trips, dropped_trip])}
+
+    result = compare_feeds(DFK, new_DFK, modes=['4'])
+    routes = result['routes'][result['routes']['day_type'] == 'weekday'].set_index('route_id')
+    assert routes.loc[route_ids[0], 'status'] == 'removed'
+    assert routes.loc[route_ids[1], 'status'] == 'changed'
+    assert routes.loc[route_ids[1], 'trip_change'] == -1
+    assert (routes.drop(index=route_ids[:2])['status'] == 'unchanged').all()
+
+    patterns = result['patterns'].set_index('route_id')
+    assert (patterns.loc[route_ids[0], 'status'] == 'removed').all()
+    assert set(patterns.loc[route_ids[1], 'status']) == {'changed', 'unchanged'}
+
+
+def test_pattern_hashes_depend_on_stop_order(feed):
+    pattern_stops = build_trip_patterns(feed)['pattern_stops']
+    hashes = get_pattern_hashes(pattern_stops)
+    reversed_stops = pattern_stops.copy()
+    reversed_stops['stop_id'] = reversed_stops.groupby('pattern_id')['stop_id'].transform(lambda stop_ids: stop_ids.to_numpy()[::-1])
+    # A pattern reversed is the opposite direction of its route, which must hash differently
+    assert len(np.unique(hashes)) == len(hashes)
+    assert (get_pattern_hashes(reversed_stops) != hashes).all()
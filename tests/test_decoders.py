@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from benchmarks.fixtures import make_api_responses
+from pyptvdata.apiv3 import types
+from pyptvdata.apiv3.decoders import decode_json, from_dict, get_available_decoders, to_dict
+
+
+RESPONSES = make_api_responses(list_length=5)
+
+
+def without_none(value):
+    if isinstance(value, dict):
+        return {key: without_none(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [without_none(item) for item in value]
+    return value
+
+
+@pytest.mark.parametrize('class_name', sorted(RESPONSES))
+@pytest.mark.parametrize('decoder', get_available_decoders())
+def test_decode_json_round_trip(class_name, decoder):
+    content = RESPONSES[class_name]
+    response_type = getattr(types, class_name)
+    decoded = decode_json(content, decoder=decoder, response_type=response_type)
+    assert isinstance(decoded, response_type)
+    assert to_dict(decoded) == without_none(json.loads(content))
+    assert decode_json(content, decoder=decoder) == json.loads(content)
+
+
+def test_from_dict_nested_types_and_unknown_keys():
+    data = json.loads(RESPONSES['V3DeparturesResponse'])
+    response = from_dict(types.V3DeparturesResponse, {**data, 'not_a_field': 1})
+    assert isinstance(response.departures[0], types.V3Departure)
+    assert all(isinstance(run, types.V3Run) for run in response.runs.values())
+    assert from_dict(types.V3DeparturesResponse, {}).departures is None
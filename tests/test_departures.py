@@ -0,0 +1,128 @@
+import datetime
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyptvdata.departures import DepartureBoard
+from pyptvdata.frequency import get_active_trips
+from pyptvdata.gtfs import gtfs_time_to_seconds
+from pyptvdata.segments import get_service_day_starts
+from pyptvdata.services import to_gtfs_date
+
+from .conftest import DATE
+
+
+# The service dates of the queries: DATE, the public holiday before it and the day after it
+DATES = ['20240311', DATE, '20240313']
+
+
+def get_brute_force_departures(feed : dict, updates : pd.DataFrame = None) -> pd.DataFrame:
+    """
+    Returns every departure of DATES, with its scheduled and estimated Unix times.
+    """
+    stop_times = feed['stop_times'].sort_values(['trip_id', 'stop_sequence'])
+    stop_times = stop_times[stop_times['trip_id'].duplicated(keep='last')]
+    departures = []
+    for date in DATES:
+        trip_ids = get_active_trips(feed, date)[0]['trip_id']
+        date_stop_times = stop_times[stop_times['trip_id'].isin(trip_ids)]
+        day_start = get_service_day_starts(np.array([date]), 'Australia/Melbourne')[0]
+        date_departures = pd.DataFrame({
+            'service_date': date,
+            'stop': date_stop_times['stop_id'].to_numpy(),
+            'trip': date_stop_times['trip_id'].to_numpy(),
+            'stop_sequence': date_stop_times['stop_sequence'].to_numpy(dtype=np.int64),
+            'scheduled_departure': day_start + gtfs_time_to_seconds(date_stop_times['departure_time']),
+        })
+        date_departures = date_departures[date_departures['scheduled_departure'] >= day_start].sort_values('stop_sequence')
+        date_updates = pd.DataFrame({'trip': [], 'stop_sequence': [], 'departure_delay': []}) if updates is None else updates[updates['start_date'] == date]
+        # Each departure takes the delay of its trip's latest update at or before its stop
+        date_departures = pd.merge_asof(
+            date_departures,
+            date_updates.rename(columns={'trip_id': 'trip'})[['trip', 'stop_sequence', 'departure_delay']].astype({'trip': object, 'stop_sequence': np.int64}).sort_values('stop_sequence'),
+            on='stop_sequence', by='trip', direction='backward',
+        )
+        date_departures['estimated_departure'] = date_departures['scheduled_departure'] + date_departures['departure_delay'].fillna(0)
+        departures.append(date_departures)
+    return pd.concat(departures, ignore_index=True)
+
+
+def check_next_departures(board : DepartureBoard, departures : pd.DataFrame, stop, now : float, n : int = 5, **kwargs):
+    result = board.get_next_departures(stop, n=n, now=now, **kwargs)
+    # Without lookahead_days, the board has the previous and current service dates of now
+    today = datetime.datetime.fromtimestamp(now, board.zoneinfo).date()
+    service_dates = [to_gtfs_date(today - datetime.timedelta(days=1)), to_gtfs_date(today)]
+    expected = departures[departures['service_date'].isin(service_dates) & (departures['stop'] == stop) & (departures['estimated_departure'] >= now)]
+    expected = expected.sort_values('estimated_departure')
+    times = [departure['estimated_departure'] or departure['scheduled_departure'] for departure in result]
+    assert times == expected['estimated_departure'].iloc[:n].tolist(), (stop, now)
+    candidates = set(zip(expected['trip'], expected['scheduled_departure']))
+    assert all((departure['trip'], departure['scheduled_departure']) in candidates for departure in result)
+    return result
+
+
+def test_next_departures_match_brute_force(feed):
+    board = DepartureBoard(feed)
+    departures = get_brute_force_departures(feed)
+    day_start = get_service_day_starts(np.array([DATE]), board.timezone)[0]
+    stops = feed['stops']['stop_id'].iloc[::7].tolist()
+    for now in [day_start + 4 * 3600, day_start + 8 * 3600 + 17, day_start + 23.5 * 3600, day_start + 24 * 3600 + 600]:
+        for stop in stops:
+            result = check_next_departures(board, departures, stop, now)
+            assert all(departure['delay_seconds'] is None for departure in result)
+
+    # Just after midnight, the previous service date's trips past 24:00:00 are still running
+    service_dates = {departure['service_date'] for stop in stops for departure in board.get_next_departures(stop, now=day_start + 24 * 3600 + 600)}
+    assert service_dates == {DATE, '20240313'}
+
+
+def test_next_departures_by_route_and_direction(feed):
+    board = DepartureBoard(feed)
+    departures = get_brute_force_departures(feed).merge(feed['trips'][['trip_id', 'route_id', 'direction_id']], left_on='trip', right_on='trip_id')
+    now = get_service_day_starts(np.array([DATE]), board.timezone)[0] + 7 * 3600
+    stop_routes = departures[['stop', 'route_id', 'direction_id']].drop_duplicates().iloc[::11]
+    for stop, route_id, direction_id in stop_routes.itertuples(index=False):
+        result = check_next_departures(board, departures[departures['route_id'] == route_id], stop, now, route=route_id)
+        assert all(departure['route'] == route_id for departure in result)
+        result = check_next_departures(board, departures[departures['direction_id'] == direction_id], stop, now, n=3, direction_id=int(direction_id))
+        assert all(departure['direction_id'] == int(direction_id) for departure in result)
+    assert board.get_next_departures(stop_routes['stop'].iloc[0], now=now, route='no-such-route') == []
+
+
+def test_trip_updates_shift_departures(feed):
+    board = DepartureBoard(feed)
+    day_start = get_service_day_starts(np.array([DATE]), board.timezone)[0]
+    now = day_start + 8 * 3600
+    stops = feed['stops']['stop_id'].iloc[::7].tolist()
+    scheduled = {stop: board.get_next_departures(stop, now=now) for stop in stops}
+
+    rng = np.random.default_rng(0)
+    trip_ids = get_active_trips(feed, DATE)[0]['trip_id'].to_numpy()
+    stop_times = feed['stop_times'][feed['stop_times']['trip_id'].isin(rng.choice(trip_ids, len(trip_ids) // 2, replace=False))]
+    updates = stop_times.sample(frac=0.3, random_state=0)[['trip_id', 'stop_sequence']].assign(start_date=DATE, timestamp=float(now))
+    updates['departure_delay'] = rng.integers(-120, 900, len(updates)).astype(np.float64)
+    updates['arrival_delay'] = updates['departure_delay']
+    board.apply_trip_updates(updates.reset_index(drop=True), now=now)
+
+    departures = get_brute_force_departures(feed, updates)
+    delayed = 0
+    for stop in stops:
+        result = check_next_departures(board, departures, stop, now)
+        delayed += sum(departure['delay_seconds'] is not None for departure in result)
+        assert board.get_next_departures(stop, now=now, realtime=False) == scheduled[stop]
+    assert delayed > 0
+
+    board.clear_trip_updates()
+    assert {stop: board.get_next_departures(stop, now=now) for stop in stops} == scheduled
+
+
+def test_roll_over_before_midnight_builds_the_next_service_date(feed, monkeypatch):
+    board = DepartureBoard(feed)
+    before_midnight = get_service_day_starts(np.array([DATE]), board.timezone)[0] + 24 * 3600 - 60
+    board.get_next_departures(feed['stops']['stop_id'].iloc[0], now=before_midnight - 2 * 24 * 3600)
+    board.roll_over(before_midnight)
+    assert sorted(board.boards) == ['20240311', DATE, '20240313']
+
+    # The first query after midnight finds its boards already built
+    monkeypatch.setattr(board, 'build_board', lambda date: pytest.fail(f'{date} was built by a query'))
+    assert len(board.get_next_departures(feed['stops']['stop_id'].iloc[0], now=before_midnight + 120)) > 0
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pyptvdata.frequency import TIME_BANDS, check_time_bands, get_active_trips, get_route_frequencies, get_stop_frequencies
+from pyptvdata.gtfs import gtfs_time_to_seconds
+
+from .conftest import DATE
+
+
+def get_departures(feed : dict, date : str) -> pd.DataFrame:
+    """
+    The departures of a date, the slow way, with the time band of each.
+    """
+    trips, _ = get_active_trips(feed, date)
+    departures = feed['stop_times'].merge(trips[['trip_id', 'route_id', 'direction_id']], on='trip_id')
+    departures['seconds'] = gtfs_time_to_seconds(departures['departure_time'])
+    names, starts, ends = check_time_bands()
+    band = np.searchsorted(starts, departures['seconds'].to_numpy(), side='right') - 1
+    departures['time_band'] = np.array(names)[band]
+    return departures[departures['seconds'] < ends[band]]
+
+
+def test_get_active_trips(feed):
+    trips, positions = get_active_trips(feed, DATE)
+    assert set(trips['service_id']) == {'T0'}
+    # The Monday public holiday runs the Sunday timetable
+    assert set(get_active_trips(feed, '20240311')[0]['service_id']) == {'UJ'}
+    assert (positions >= 0).sum() == feed['stop_times']['trip_id'].isin(trips['trip_id']).sum()
+
+
+def test_get_stop_frequencies(feed):
+    result = get_stop_frequencies(feed, DATE)
+    expected = get_departures(feed, DATE).groupby(['stop_id', 'route_id', 'direction_id', 'time_band'])['seconds'].agg(
+        departures='size', first_departure_seconds='min', last_departure_seconds='max',
+        max_headway_minutes=lambda seconds: np.diff(np.sort(seconds)).max() / 60 if len(seconds) > 1 else np.nan,
+    ).reset_index()
+    result = result.astype({'time_band': str}).sort_values(['stop_id', 'route_id', 'direction_id', 'time_band'], ignore_index=True)
+    expected = expected.sort_values(['stop_id', 'route_id', 'direction_id', 'time_band'], ignore_index=True)
+    pd.testing.assert_frame_equal(result[expected.columns], expected, check_dtype=False)
+
+    hours = result['time_band'].map({name: (gtfs_time_to_seconds(pd.Series([end]))[0] - gtfs_time_to_seconds(pd.Series([start]))[0]) / 3600 for name, (start, end) in TIME_BANDS.items()})
+    np.testing.assert_allclose(result['trips_per_hour'], result['departures'] / hours)
+
+
+def test_get_route_frequencies_counts_trips_once(feed):
+    result = get_route_frequencies(feed, DATE)
+    trips, _ = get_active_trips(feed, DATE)
+    assert result['trips'].sum() == len(trips)
+
+
+def test_check_time_bands_rejects_overlaps():
+    with pytest.raises(AssertionError):
+        check_time_bands({'a': ('07:00:00', '09:00:00'), 'b': ('08:00:00', '10:00:00')})
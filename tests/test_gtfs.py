@@ -0,0 +1,84 @@
+import io
+import zipfile
+import numpy as np
+import pandas as pd
+
+from pyptvdata.gtfs import read_gtfs_zip, profile_gtfs_zip, gtfs_time_to_seconds, open_google_transit_zip, iter_gtfs_table_chunks
+
+
+def test_read_gtfs_zip_filters(gtfs_zip_path):
+    DFK = read_gtfs_zip(gtfs_zip_path, modes=['3'], tables=['stops', 'routes'], columns={'stops': ['stop_id', 'stop_lat']})
+    assert list(DFK) == ['3']
+    assert sorted(DFK['3']) == ['routes', 'stops']
+    assert list(DFK['3']['stops'].columns) == ['stop_id', 'stop_lat']
+
+
+def test_profile_gtfs_zip_returns_the_same_tables(gtfs_zip_path, DFK):
+    profiled, report = profile_gtfs_zip(gtfs_zip_path)
+    assert sorted(profiled) == sorted(DFK)
+    for mode_id, tables in DFK.items():
+        for table_name, df in tables.items():
+            pd.testing.assert_frame_equal(profiled[mode_id][table_name], df)
+    assert report['download_seconds'] == 0.0
+    assert list(report['modes']['mode_id']) == list(DFK)
+    assert report['tables']['rows'].sum() == sum(len(df) for tables in DFK.values() for df in tables.values())
+
+
+def read_chunks(gtfs_zip_path : str, table_name : str, chunksize : int, **kwargs) -> pd.DataFrame:
+    chunks = list(iter_gtfs_table_chunks(gtfs_zip_path, '4', table_name, chunksize=chunksize, **kwargs))
+    assert all(0 < len(chunk) <= chunksize for chunk in chunks)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def test_iter_gtfs_table_chunks(gtfs_zip_path, DFK):
+    for table_name in ['stop_times', 'shapes']:
+        chunks = read_chunks(gtfs_zip_path, table_name, chunksize=1000)
+        pd.testing.assert_frame_equal(chunks, DFK['4'][table_name])
+
+
+def test_iter_gtfs_table_chunks_filters(gtfs_zip_path, DFK):
+    stop_times = DFK['4']['stop_times']
+    trip_ids = set(stop_times['trip_id'].drop_duplicates().iloc[::5])
+    # The filter columns are read to filter, and dropped if not asked for
+    chunks = read_chunks(gtfs_zip_path, 'stop_times', chunksize=500, columns=['stop_id', 'stop_sequence'], trip_ids=trip_ids, start_time='07:00:00', end_time=9 * 3600)
+    seconds = gtfs_time_to_seconds(stop_times['departure_time'])
+    expected = stop_times.loc[stop_times['trip_id'].isin(trip_ids) & (seconds >= 7 * 3600) & (seconds < 9 * 3600), ['stop_id', 'stop_sequence']]
+    assert 0 < len(expected) < len(stop_times)
+    pd.testing.assert_frame_equal(chunks, expected.reset_index(drop=True))
+
+    shapes = DFK['4']['shapes']
+    shape_ids = set(shapes['shape_id'].drop_duplicates().iloc[::3])
+    chunks = read_chunks(gtfs_zip_path, 'shapes', chunksize=100, columns=['shape_pt_lat', 'shape_pt_lon'], shape_ids=shape_ids)
+    expected = shapes.loc[shapes['shape_id'].isin(shape_ids), ['shape_pt_lat', 'shape_pt_lon']]
+    pd.testing.assert_frame_equal(chunks, expected.reset_index(drop=True))
+
+
+def test_open_google_transit_zip_in_place_by_default(gtfs_zip_path):
+    with zipfile.ZipFile(gtfs_zip_path) as gtfs_zip:
+        with open_google_transit_zip(gtfs_zip, '3') as transit_zip:
+            assert not isinstance(transit_zip.fp, io.BytesIO)
+            in_place_stops = transit_zip.read('stops.txt')
+        with open_google_transit_zip(gtfs_zip, '3', in_memory=True) as transit_zip:
+            assert isinstance(transit_zip.fp, io.BytesIO)
+            assert transit_zip.read('stops.txt') == in_place_stops
+
+
+def test_gtfs_time_to_seconds():
+    times = pd.Series(['05:00:00', '24:30:15', None, '7:05:00', 'bad'])
+    assert gtfs_time_to_seconds(times).tolist() == [18000, 88215, -1, 25500, -1]
+    categorical = gtfs_time_to_seconds(times.astype('category'))
+    assert categorical.dtype == np.int32
+    assert categorical.tolist() == [18000, 88215, -1, 25500, -1]
+
+
+def test_gtfs_time_to_seconds_all_missing():
+    times = pd.Series([None, None], dtype=object)
+    assert gtfs_time_to_seconds(times).tolist() == [-1, -1]
+    assert gtfs_time_to_seconds(times.astype('category')).tolist() == [-1, -1]
+    assert len(gtfs_time_to_seconds(pd.Series([], dtype=object).astype('category'))) == 0
+
+
+def test_gtfs_time_to_seconds_rejects_non_digits():
+    # All HH:MM:SS wide, so the fast path is taken
+    times = pd.Series(['05:00:00', '0a:15:00', '99:xx:00'])
+    assert gtfs_time_to_seconds(times).tolist() == [18000, -1, -1]
@@ -0,0 +1,116 @@
+import io
+import zipfile
+import numpy as np
+
+from benchmarks.fixtures import make_gtfs_mode_tables
+from pyptvdata import gtfsdiff
+from pyptvdata.gtfsdiff import diff_gtfs_zip, is_same_zip_entry, summarize_gtfs_diff
+
+
+def get_zip_info(name : str) -> zipfile.ZipInfo:
+    # A fixed timestamp, so unchanged entries are byte for byte the same in both versions
+    zip_info = zipfile.ZipInfo(name, date_time=(2024, 1, 1, 0, 0, 0))
+    zip_info.compress_type = zipfile.ZIP_DEFLATED
+    return zip_info
+
+
+def write_gtfs_zip(path : str, mode_tables : dict[str, dict[str, str]]):
+    with zipfile.ZipFile(path, 'w') as gtfs_zip:
+        for mode_id, tables in mode_tables.items():
+            google_transit_file = io.BytesIO()
+            with zipfile.ZipFile(google_transit_file, 'w') as transit_zip:
+                for table_name, csv_text in tables.items():
+                    transit_zip.writestr(get_zip_info(f'{table_name}.txt'), csv_text)
+            gtfs_zip.writestr(get_zip_info(f'{mode_id}/'), '')
+            gtfs_zip.writestr(get_zip_info(f'{mode_id}/google_transit.zip'), google_transit_file.getvalue())
+
+
+def drop_csv_column(csv_text : str, column : str) -> str:
+    lines = [line.split(',') for line in csv_text.splitlines()]
+    position = lines[0].index(column)
+    return '\n'.join(','.join(values[:position] + values[position + 1:]) for values in lines) + '\n'
+
+
+def make_versions(tmp_path) -> tuple[str, str]:
+    new_tables = {mode_id: make_gtfs_mode_tables(mode_id, scale=0.125) for mode_id in ['3', '4']}
+    old_tables = {mode_id: dict(tables) for mode_id, tables in new_tables.items()}
+    # shapes is added in the new version, and calendar_dates removed
+    del old_tables['3']['shapes']
+    tram = new_tables['3']
+    # calendar: T0 runs on Saturday too, T2 is removed and X1 is added
+    tram['calendar'] = tram['calendar'].replace('T0,1,1,1,1,1,0,0', 'T0,1,1,1,1,1,1,0').replace('T2,0,0,0,0,0,1,0,20240101,20241231\n', '') + 'X1,1,0,0,0,0,0,0,20240101,20241231\n'
+    # routes: route_color is removed, which changes every route
+    tram['routes'] = drop_csv_column(tram['routes'], 'route_color')
+    # stops: a column is added, which changes every stop
+    tram['stops'] = '\n'.join(f'{line},platform_code' if i == 0 else f'{line},{i % 2}' for i, line in enumerate(tram['stops'].splitlines())) + '\n'
+    del tram['calendar_dates']
+
+    old_path, new_path = str(tmp_path / 'old.zip'), str(tmp_path / 'new.zip')
+    write_gtfs_zip(old_path, old_tables)
+    write_gtfs_zip(new_path, new_tables)
+    return old_path, new_path
+
+
+def test_is_same_zip_entry(tmp_path):
+    old_path, new_path = make_versions(tmp_path)
+    with zipfile.ZipFile(old_path) as old_zip, zipfile.ZipFile(new_path) as new_zip:
+        assert is_same_zip_entry(old_zip, new_zip, '4/google_transit.zip')
+        assert not is_same_zip_entry(old_zip, new_zip, '3/google_transit.zip')
+
+
+def test_diff_gtfs_zip_skips_unchanged_entries(tmp_path, monkeypatch):
+    old_path, new_path = make_versions(tmp_path)
+    read_tables = []
+    read_gtfs_table = gtfsdiff.read_gtfs_table
+    monkeypatch.setattr(gtfsdiff, 'read_gtfs_table', lambda transit_zip, table_name: read_tables.append(table_name) or read_gtfs_table(transit_zip, table_name))
+    diff = diff_gtfs_zip(old_path, new_path)
+
+    assert diff['4'] == {'status': 'unchanged', 'tables': {}}
+    tables = diff['3']['tables']
+    assert diff['3']['status'] == 'changed'
+    for table_name in ['agency', 'trips', 'stop_times']:
+        assert tables[table_name] == {'status': 'unchanged'}
+        assert table_name not in read_tables
+    assert {table_name: table_diff['status'] for table_name, table_diff in tables.items() if table_diff['status'] != 'unchanged'} == {
+        'calendar': 'changed',
+        'routes': 'changed',
+        'stops': 'changed',
+        'calendar_dates': 'removed',
+        'shapes': 'added',
+    }
+
+
+def test_diff_gtfs_zip_finds_rows_by_key(tmp_path):
+    old_path, new_path = make_versions(tmp_path)
+    tables = diff_gtfs_zip(old_path, new_path)['3']['tables']
+
+    calendar = tables['calendar']
+    assert calendar['added']['service_id'].tolist() == ['X1']
+    assert calendar['removed']['service_id'].tolist() == ['T2']
+    assert calendar['changed']['service_id'].tolist() == ['T0']
+    assert calendar['changed']['saturday'].tolist() == [1]
+    # Int columns keep their dtype through the outer merge
+    for rows in [calendar['added'], calendar['removed'], calendar['changed']]:
+        assert rows['monday'].dtype == np.int64
+
+    routes = tables['routes']
+    assert len(routes['changed']) == 1 and len(routes['added']) == len(routes['removed']) == 0
+    assert 'route_color' not in routes['changed'].columns
+
+    stops = tables['stops']
+    assert len(stops['changed']) == 20 and len(stops['added']) == len(stops['removed']) == 0
+    assert stops['changed']['platform_code'].notna().all()
+
+    assert len(tables['calendar_dates']['removed']) == 2 and len(tables['calendar_dates']['added']) == 0
+    assert len(tables['shapes']['added']) == len(make_gtfs_mode_tables('3', scale=0.125)['shapes'].splitlines()) - 1
+
+
+def test_summarize_gtfs_diff(tmp_path):
+    summary = summarize_gtfs_diff(diff_gtfs_zip(*make_versions(tmp_path)))
+    assert summary.iloc[-1].to_dict() == {'mode_id': '4', 'table_name': None, 'status': 'unchanged', 'added': 0, 'removed': 0, 'changed': 0}
+    counts = summary[summary['mode_id'] == '3'].set_index('table_name')[['added', 'removed', 'changed']]
+    assert counts.loc['calendar'].tolist() == [1, 1, 1]
+    assert counts.loc['stops'].tolist() == [0, 0, 20]
+    assert counts.loc['calendar_dates'].tolist() == [0, 2, 0]
+    assert counts.loc['shapes', 'added'] > 0 and counts.loc['shapes', ['removed', 'changed']].tolist() == [0, 0]
+    assert counts.loc['trips'].tolist() == [0, 0, 0]
@@ -0,0 +1,26 @@
+from benchmarks.fixtures import make_gtfs_r_feed, load_recorded_gtfs_r_feeds
+from pyptvdata.gtfsr import get_stop_time_updates, parse_gtfs_r_binary
+
+
+def test_load_recorded_gtfs_r_feeds(tmp_path):
+    feed_data = make_gtfs_r_feed(n_trips=3, stops_per_trip=4)
+    (tmp_path / 'tram-tripupdates.pb').write_bytes(feed_data)
+    (tmp_path / 'notes.txt').write_text('not a feed')
+    assert load_recorded_gtfs_r_feeds(str(tmp_path)) == {'tram-tripupdates': feed_data}
+
+
+def test_parse_gtfs_r_binary_lists_repeated_fields():
+    entities = parse_gtfs_r_binary(make_gtfs_r_feed(n_trips=3, stops_per_trip=4))
+    trip_updates = [entity['trip_update'] for entity in entities if 'trip_update' in entity]
+    assert len(trip_updates) == 3
+    assert all(isinstance(trip_update['stop_time_update'], list) and len(trip_update['stop_time_update']) == 4 for trip_update in trip_updates)
+
+
+
+def test_get_stop_time_updates():
+    updates = get_stop_time_updates(make_gtfs_r_feed(trip_ids=['a', 'b'], stops_per_trip=4))
+    assert len(updates) == 8
+    assert updates['trip_id'].tolist() == ['a'] * 4 + ['b'] * 4
+    assert updates['stop_sequence'].tolist() == [1, 2, 3, 4] * 2
+    assert (updates['arrival_delay'] == updates['departure_delay']).all()
+    assert (updates['timestamp'] == 1710140400).all()
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+
+from pyptvdata import isochrone
+from pyptvdata.isochrone import build_transit_network, get_isochrone, get_isochrones, scan_connections
+
+from .conftest import DATE, get_brute_force_arrivals
+
+
+def test_get_isochrone_from_a_stop(unified):
+    network = build_transit_network(unified, DATE)
+    origin = int(network['dep_stop'][len(network['dep_stop']) // 2])
+    result = get_isochrone(network, origin, '08:00:00', max_minutes=30)
+    assert result['stop_index'].iloc[0] == origin and result['travel_seconds'].iloc[0] == 0
+    assert result['travel_seconds'].is_monotonic_increasing
+    assert (result['travel_seconds'] <= 30 * 60).all()
+    assert (result['walk_radius'] >= 0).all()
+    # Every stop reachable in 10 minutes is also reachable in 30
+    assert set(get_isochrone(network, origin, '08:00:00', max_minutes=10)['stop_index']) <= set(result['stop_index'])
+
+
+def test_get_isochrones_serial_does_not_keep_the_network(unified):
+    network = build_transit_network(unified, DATE)
+    origins = network['dep_stop'][::len(network['dep_stop']) // 3][:3].tolist()
+    results = get_isochrones(network, origins, processes=1, max_minutes=20)
+    assert isochrone._worker_network is None
+    for origin_number, origin in enumerate(origins):
+        expected = get_isochrone(network, origin, max_minutes=20)
+        pd.testing.assert_frame_equal(results[results['origin'] == origin_number].drop(columns='origin').reset_index(drop=True), expected)
+
+
+def test_scan_connections_matches_brute_force(unified):
+    network = build_transit_network(unified, DATE)
+    n_stops = len(network['stop_lat'])
+    for origin in range(0, n_stops, 4):
+        for departure_time in [6 * 3600, 8 * 3600 + 120, 17 * 3600 + 45 * 60]:
+            earliest = scan_connections(network, np.array([origin]), np.array([0]), departure_time, 3600)
+            np.testing.assert_array_equal(earliest, get_brute_force_arrivals(network, [origin], [0], departure_time, 3600), err_msg=f'{origin} {departure_time}')
+    # Several origin stops, each with its own walk
+    origin_stops, origin_seconds = np.array([0, n_stops // 2]), np.array([120, 300])
+    earliest = scan_connections(network, origin_stops, origin_seconds, 8 * 3600, 1800)
+    np.testing.assert_array_equal(earliest, get_brute_force_arrivals(network, origin_stops, origin_seconds, 8 * 3600, 1800))
+    assert (earliest >= 0).sum() > len(origin_stops)
+
+
+def test_scan_connections_walks_on_after_a_later_ride():
+    # Stop 1 is a 60 second walk from the origin, and also a ride arriving at 150. Stop 2 is a 60 second walk from stop 1 only,
+    # so it is reached by riding to stop 1 and walking on, as only one transfer is walked in a row
+    network = {
+        'dep_stop': np.array([0], dtype=np.int32),
+        'arr_stop': np.array([1], dtype=np.int32),
+        'dep_time': np.array([10], dtype=np.int32),
+        'arr_time': np.array([150], dtype=np.int32),
+        'trip': np.array([0], dtype=np.int32),
+        'transfer_indptr': np.array([0, 1, 2, 2]),
+        'transfer_to': np.array([1, 2], dtype=np.int32),
+        'transfer_seconds': np.array([60, 60], dtype=np.int32),
+        'stop_lat': np.zeros(3),
+        'stop_lon': np.zeros(3),
+    }
+    earliest = scan_connections(network, np.array([0]), np.array([0]), 0, 600)
+    assert earliest.tolist() == [0, 60, 210]
+    assert earliest.tolist() == get_brute_force_arrivals(network, [0], [0], 0, 600).tolist()
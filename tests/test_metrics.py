@@ -0,0 +1,67 @@
+import time
+
+import pytest
+import requests
+
+from pyptvdata.apiv3 import PTVAPIClient
+from pyptvdata.metrics import Metrics
+
+
+class FakeResponse:
+    def __init__(self, status_code : int, content : bytes):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Error', response=self)
+
+
+class FakeTransport:
+    def __init__(self, status_code : int, content : bytes = b'{}', on_get = None):
+        self.session = None
+        self.status_code = status_code
+        self.content = content
+        self.on_get = on_get
+
+    def get(self, url : str, headers : dict = None):
+        if self.on_get is not None:
+            self.on_get()
+        return FakeResponse(self.status_code, self.content)
+
+
+def make_client(status_code : int, content : bytes = b'{}', on_get = None) -> tuple[PTVAPIClient, Metrics]:
+    metrics = Metrics()
+    client = PTVAPIClient('0', 'key', transport=FakeTransport(status_code, content, on_get), metrics=metrics)
+    return client, metrics
+
+
+def test_request_duration_ignores_wall_clock_changes(monkeypatch):
+    # Set the wall clock back, as NTP may while a request is in flight
+    client, metrics = make_client(200, b'{"route_types": []}', on_get=lambda: monkeypatch.setattr(time, 'time', lambda: 0.0))
+    infos = []
+    metrics.add_post_request_hook(infos.append)
+    client.get_data('/v3/route_types')
+    assert infos[0].start_time > 0
+    assert 0 <= infos[0].duration < 60
+
+
+def test_http_errors_are_counted_as_request_errors():
+    client, metrics = make_client(500)
+    with pytest.raises(requests.HTTPError):
+        client.get_data('/v3/route_types')
+    stats = metrics.to_dict()[('ptvapi', '/v3/route_types')]
+    assert stats['status_counts'] == {500: 1}
+    assert 'pyptvdata_request_errors_total{client="ptvapi",endpoint="/v3/route_types"} 1' in metrics.to_prometheus()
+
+
+def test_coalesced_ratio():
+    metrics = Metrics()
+    for coalesced in [False, True, True, False]:
+        info = metrics.start_request('ptvapi', 'GET', 'https://timetableapi.ptv.vic.gov.au/v3/route_types')
+        info.coalesced = coalesced
+        info.duration = info.get_elapsed()
+        metrics.end_request(info)
+    assert metrics.get_coalesced_ratio() == 0.5
+    assert Metrics().get_coalesced_ratio() == 0.0
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+
+from benchmarks.fixtures import make_gtfs_zip
+from pyptvdata import mirror
+from pyptvdata.gtfs import gtfs_time_to_seconds
+from pyptvdata.mirror import materialize_gtfs_zip, read_gtfs_mirror, read_mirror_manifest
+
+
+def test_mirror_round_trip(gtfs_zip_path, DFK, tmp_path):
+    materialize_gtfs_zip(gtfs_zip_path, str(tmp_path))
+    mirrored = read_gtfs_mirror(str(tmp_path), categorical=False)
+    assert sorted(mirrored) == sorted(DFK)
+    for mode_id, tables in DFK.items():
+        assert sorted(mirrored[mode_id]) == sorted(tables)
+        for table_name, df in tables.items():
+            # Numeric columns are memory-mapped, so compare them as plain arrays
+            mirrored_df = pd.DataFrame({column: np.array(values) for column, values in mirrored[mode_id][table_name].items()})
+            pd.testing.assert_frame_equal(mirrored_df, df)
+
+
+def test_mirror_categorical_times(gtfs_zip_path, DFK, tmp_path):
+    materialize_gtfs_zip(gtfs_zip_path, str(tmp_path), modes=['3'], tables=['stop_times'])
+    stop_times = read_gtfs_mirror(str(tmp_path), columns={'stop_times': ['departure_time']})['3']['stop_times']
+    assert isinstance(stop_times['departure_time'].dtype, pd.CategoricalDtype)
+    assert (gtfs_time_to_seconds(stop_times['departure_time']) == gtfs_time_to_seconds(DFK['3']['stop_times']['departure_time'])).all()
+
+
+def test_filtered_runs_keep_other_modes_and_tables(gtfs_zip_path, tmp_path):
+    mirror_dir = str(tmp_path)
+    materialize_gtfs_zip(gtfs_zip_path, mirror_dir, modes=['3'], tables=['stops'])
+    materialize_gtfs_zip(gtfs_zip_path, mirror_dir, modes=['3'], tables=['routes'])
+    materialize_gtfs_zip(gtfs_zip_path, mirror_dir, modes=['4'], tables=['trips'])
+    manifest = read_mirror_manifest(mirror_dir)
+    assert sorted(manifest['modes']['3']['tables']) == ['routes', 'stops']
+    assert sorted(manifest['modes']['4']['tables']) == ['trips']
+    assert not manifest['modes']['3']['complete']
+    assert sorted(read_gtfs_mirror(mirror_dir)['3']) == ['routes', 'stops']
+
+
+def test_unchanged_tables_are_not_unpacked_again(gtfs_zip_path, tmp_path, monkeypatch):
+    mirror_dir = str(tmp_path)
+    materialize_gtfs_zip(gtfs_zip_path, mirror_dir, modes=['3'], tables=['stops'])
+
+    read_tables = []
+    read_gtfs_table = mirror.read_gtfs_table
+    monkeypatch.setattr(mirror, 'read_gtfs_table', lambda transit_zip, table_name: read_tables.append(table_name) or read_gtfs_table(transit_zip, table_name))
+    materialize_gtfs_zip(gtfs_zip_path, mirror_dir, modes=['3'], tables=['stops'])
+    assert read_tables == []
+
+    # An unfiltered run only unpacks the tables that are missing, and then the mode is complete
+    manifest = materialize_gtfs_zip(gtfs_zip_path, mirror_dir, modes=['3'])
+    assert 'stops' not in read_tables and 'stop_times' in read_tables
+    assert manifest['modes']['3']['complete']
+    read_tables.clear()
+    materialize_gtfs_zip(gtfs_zip_path, mirror_dir, modes=['3'])
+    assert read_tables == []
+
+
+def test_changed_modes_drop_stale_tables(tmp_path):
+    mirror_dir = str(tmp_path / 'mirror')
+    old_path, new_path = str(tmp_path / 'old.zip'), str(tmp_path / 'new.zip')
+    make_gtfs_zip(old_path, scale=0.125, mode_ids=['3'], seed=0)
+    make_gtfs_zip(new_path, scale=0.125, mode_ids=['3'], seed=1)
+    materialize_gtfs_zip(old_path, mirror_dir, tables=['stops', 'routes'])
+    manifest = materialize_gtfs_zip(new_path, mirror_dir, tables=['stops'])
+    assert sorted(manifest['modes']['3']['tables']) == ['stops']
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+from pyptvdata.gtfs import gtfs_time_to_seconds
+from pyptvdata.patterns import build_trip_patterns, get_stop_times_from_patterns
+
+
+def test_patterns_round_trip_stop_times(feed):
+    patterns = build_trip_patterns(feed)
+    stop_times = feed['stop_times'].sort_values(['trip_id', 'stop_sequence'])
+    expected = pd.DataFrame({
+        'trip_id': stop_times['trip_id'].to_numpy(),
+        'stop_id': stop_times['stop_id'].to_numpy(),
+        'stop_position': stop_times.groupby('trip_id').cumcount().to_numpy().astype(np.int32),
+        'arrival_seconds': gtfs_time_to_seconds(stop_times['arrival_time']),
+        'departure_seconds': gtfs_time_to_seconds(stop_times['departure_time']),
+    })
+    result = get_stop_times_from_patterns(patterns).sort_values(['trip_id', 'stop_position'], ignore_index=True)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+    assert len(patterns['pattern_stops']) < len(feed['stop_times'])
+    assert patterns['patterns']['n_trips'].sum() == len(patterns['trips']) == feed['trips']['trip_id'].nunique()
+    assert (patterns['pattern_stops'].groupby('pattern_id').size().to_numpy() == patterns['patterns']['n_stops'].to_numpy()).all()
+
+
+def test_templates_cover_trips_at_their_headway(feed):
+    patterns = build_trip_patterns(feed)
+    trips = patterns['trips'].merge(patterns['templates'], on='template_id', suffixes=('', '_template'))
+    assert (trips['pattern_id'] == trips['pattern_id_template']).all()
+    assert (trips['timing_id'] == trips['timing_id_template']).all()
+
+    # Each template's trips start at start_seconds + k * headway_seconds for k < n_trips
+    k = (trips['start_seconds'] - trips['start_seconds_template']) / trips['headway_seconds'].where(trips['headway_seconds'] > 0, 1)
+    assert (k == k.round()).all()
+    assert ((k >= 0) & (k < trips['n_trips'])).all()
+    assert (trips.groupby('template_id')['start_seconds'].nunique() == patterns['templates'].set_index('template_id')['n_trips']).all()
+    assert len(patterns['templates']) < len(patterns['trips'])
+
+
+def test_templates_split_where_the_headway_changes():
+    # Every 10 minutes, then every 10 minutes again from 5 minutes after the third trip
+    start_minutes = [0, 10, 20, 25, 35, 45]
+    trip_ids = [f't{k}' for k in range(len(start_minutes))]
+    feed = {
+        'trips': pd.DataFrame({'route_id': 'r', 'service_id': 'T0', 'trip_id': trip_ids, 'direction_id': 0}),
+        'stop_times': pd.DataFrame({
+            'trip_id': np.repeat(trip_ids, 2),
+            'arrival_time': [f'07:{minutes + offset:02d}:00' for minutes in start_minutes for offset in [0, 4]],
+            'departure_time': [f'07:{minutes + offset:02d}:00' for minutes in start_minutes for offset in [0, 4]],
+            'stop_id': ['a', 'b'] * len(start_minutes),
+            'stop_sequence': [1, 2] * len(start_minutes),
+        }),
+    }
+    templates = build_trip_patterns(feed)['templates']
+    assert templates[['start_seconds', 'headway_seconds', 'n_trips']].values.tolist() == [
+        [7 * 3600, 600, 3],
+        [7 * 3600 + 25 * 60, 600, 3],
+    ]
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from pyptvdata.gtfs import gtfs_time_to_seconds
+from pyptvdata.segments import build_segments, get_segment_speeds
+
+from .conftest import DATE
+
+
+def test_build_segments(feed):
+    segments = build_segments(feed)
+    stop_times = feed['stop_times']
+    assert len(segments) == len(stop_times) - stop_times['trip_id'].nunique()
+    assert (segments['arrival_seconds'] >= segments['departure_seconds']).all()
+    assert (segments['distance'] > 0).all()
+    trip_ids = feed['trips']['trip_id'].to_numpy()[segments['trip_code']]
+    assert (stop_times['trip_id'].to_numpy()[segments['from_row']] == trip_ids).all()
+    assert (stop_times['stop_sequence'].to_numpy()[segments['to_row']] > stop_times['stop_sequence'].to_numpy()[segments['from_row']]).all()
+
+
+def test_scheduled_speeds_match_a_groupby(feed):
+    speeds = get_segment_speeds(feed, [DATE])
+    assert (speeds['day_type'] == 'weekday').all()
+    assert (speeds['observed_trips'] == 0).all()
+
+    # Brute force: the consecutive stop_times of the weekday trips, grouped by stop pair and departure hour
+    stop_times = feed['stop_times'].merge(feed['trips'][feed['trips']['service_id'] == 'T0'][['trip_id']], on='trip_id')
+    stop_times = stop_times.sort_values(['trip_id', 'stop_sequence'])
+    stop_times['seconds'] = gtfs_time_to_seconds(stop_times['departure_time'])
+    next_stop_times = stop_times.groupby('trip_id').shift(-1)
+    pairs = pd.DataFrame({
+        'from_stop': stop_times['stop_id'],
+        'to_stop': next_stop_times['stop_id'],
+        'hour': stop_times['seconds'] // 3600,
+        'running_seconds': gtfs_time_to_seconds(next_stop_times['arrival_time'].fillna('')) - stop_times['seconds'],
+    }).dropna(subset=['to_stop'])
+    expected = pairs.groupby(['from_stop', 'to_stop', 'hour']).agg(trips=('running_seconds', 'size'), scheduled_seconds=('running_seconds', 'mean'))
+
+    result = speeds.set_index(['from_stop', 'to_stop', 'hour'])[['trips', 'scheduled_seconds']].sort_index()
+    pd.testing.assert_frame_equal(result, expected.sort_index(), check_dtype=False, check_index_type=False)
+
+
+def test_actual_speeds_from_updates(feed):
+    trip_id = feed['trips'].loc[feed['trips']['service_id'] == 'T0', 'trip_id'].iloc[0]
+    trip_stop_times = feed['stop_times'][feed['stop_times']['trip_id'] == trip_id].sort_values('stop_sequence')
+    # Each stop is 30 seconds later than the one before, so every segment runs 30 seconds over schedule
+    delays = 30.0 * np.arange(len(trip_stop_times))
+    updates = pd.DataFrame({
+        'trip_id': trip_id,
+        'start_date': DATE,
+        'stop_sequence': trip_stop_times['stop_sequence'].to_numpy(dtype=np.int64),
+        'arrival_delay': delays,
+        'departure_delay': delays,
+        'timestamp': 0.0,
+    })
+    speeds = get_segment_speeds(feed, [DATE], actuals=[updates, updates.assign(start_date='20240313')])
+    observed = speeds[speeds['observed_trips'] > 0]
+    assert len(observed) == len(trip_stop_times) - 1
+    assert (observed['observed_trips'] == 1).all()
+    np.testing.assert_allclose(observed['excess_seconds'], 30.0)
+    assert (observed['actual_speed_kmh'] < observed['scheduled_speed_kmh']).all()
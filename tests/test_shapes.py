@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from pyptvdata.geo import haversine_distance
+from pyptvdata.patterns import build_trip_patterns
+from pyptvdata.shapes import build_stop_distances, fill_shape_dist_traveled, get_shape_points, interpolate_shape_positions
+
+
+def test_stop_distances_follow_the_shapes(feed):
+    stop_distances = build_stop_distances(feed)
+    pattern_stops = stop_distances['pattern_stops']
+    assert pattern_stops['distance'].notna().all()
+    assert (pattern_stops.groupby(['pattern_id', 'shape_id'])['distance'].diff().dropna() >= 0).all()
+    # The synthetic shapes pass through every stop
+    assert pattern_stops['offset'].max() < 1.0
+
+
+def test_fill_shape_dist_traveled(feed):
+    stop_times, shapes = fill_shape_dist_traveled(feed)
+    original = feed['stop_times']['shape_dist_traveled']
+    assert stop_times['shape_dist_traveled'].notna().all()
+    assert (stop_times['shape_dist_traveled'][original.notna()] == original[original.notna()]).all()
+
+    # The fixture's distances are straight lines between stops, and its shapes detour through a point between each pair
+    derived, _ = fill_shape_dist_traveled(feed, overwrite=True)
+    known = original.to_numpy() > 0
+    ratio = derived['shape_dist_traveled'].to_numpy()[known] / original.to_numpy()[known]
+    assert ratio.min() > 0.99 and ratio.max() < 1.1
+    pd.testing.assert_series_equal(shapes['shape_dist_traveled'], feed['shapes']['shape_dist_traveled'])
+
+
+def test_trips_of_a_pattern_on_different_shapes(feed):
+    patterns = build_trip_patterns(feed)
+    trip_id, other_trip_id = patterns['trips'].loc[patterns['trips']['pattern_id'] == 0, 'trip_id'].iloc[:2]
+    trips = feed['trips'].copy()
+    shape_id = trips.loc[trips['trip_id'] == trip_id, 'shape_id'].iloc[0]
+
+    # The same shape, starting from a depot about 1.1 km north of its first point
+    shape = feed['shapes'][feed['shapes']['shape_id'] == shape_id].sort_values('shape_pt_sequence')
+    depot = shape.iloc[[0]].assign(shape_pt_lat=shape['shape_pt_lat'].iloc[0] + 0.01, shape_pt_sequence=0)
+    detour = pd.concat([depot, shape]).assign(shape_id=f'{shape_id}.depot', shape_dist_traveled=np.nan)
+    detour_metres = haversine_distance(depot['shape_pt_lat'].iloc[0], depot['shape_pt_lon'].iloc[0], shape['shape_pt_lat'].iloc[0], shape['shape_pt_lon'].iloc[0])
+    trips.loc[trips['trip_id'] == trip_id, 'shape_id'] = f'{shape_id}.depot'
+    detour_feed = {**feed, 'trips': trips, 'shapes': pd.concat([feed['shapes'], detour], ignore_index=True)}
+
+    stop_distances = build_stop_distances(detour_feed)
+    assert set(stop_distances['pattern_stops'].loc[stop_distances['pattern_stops']['pattern_id'] == 0, 'shape_id']) == {shape_id, f'{shape_id}.depot'}
+    stop_times, _ = fill_shape_dist_traveled(detour_feed, stop_distances=stop_distances, overwrite=True)
+    distances = stop_times.sort_values('stop_sequence').groupby('trip_id')['shape_dist_traveled'].apply(np.array)
+    np.testing.assert_allclose(distances[trip_id] - distances[other_trip_id], detour_metres, atol=1.0)
+
+
+def test_interpolate_shape_positions(feed):
+    shape_points = get_shape_points(feed['shapes'])
+    first = shape_points.iloc[0]
+    lat, lon = interpolate_shape_positions(shape_points, np.array([first['shape_id'], 'no-such-shape']), np.array([-5.0, 0.0]))
+    assert (lat[0], lon[0]) == (first['shape_pt_lat'], first['shape_pt_lon'])
+    assert np.isnan(lat[1]) and np.isnan(lon[1])
+
+    lat, lon = interpolate_shape_positions(shape_points.iloc[:0], np.array([first['shape_id']]), np.array([0.0]))
+    assert np.isnan(lat).all() and np.isnan(lon).all()
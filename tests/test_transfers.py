@@ -0,0 +1,38 @@
+import numpy as np
+
+from pyptvdata.geo import haversine_distance
+from pyptvdata.transfers import DETOUR_FACTOR, WALKING_SPEED, build_transfers, get_transfer_graph
+
+
+def test_build_transfers_matches_brute_force(unified):
+    stops = unified['stops']
+    transfers = build_transfers(stops, max_distance=400)
+    assert len(transfers) > 0
+
+    lat, lon = stops['stop_lat'].to_numpy(), stops['stop_lon'].to_numpy()
+    distance = haversine_distance(lat[:, None], lon[:, None], lat[None, :], lon[None, :])
+    i, j = np.nonzero((distance <= 400) & ~np.eye(len(stops), dtype=bool))
+    stop_index = stops['stop_index'].to_numpy()
+    assert sorted(zip(transfers['from_stop_index'], transfers['to_stop_index'])) == sorted(zip(stop_index[i], stop_index[j]))
+
+    expected_seconds = np.ceil(transfers['distance'].to_numpy() * DETOUR_FACTOR / WALKING_SPEED)
+    assert (transfers['walking_seconds'].to_numpy() == expected_seconds).all()
+    assert (transfers.groupby('from_stop_index')['walking_seconds'].diff().dropna() >= 0).all()
+
+
+def test_build_transfers_cache(unified, tmp_path):
+    transfers = build_transfers(unified['stops'], cache_dir=str(tmp_path))
+    assert len(list(tmp_path.iterdir())) == 1
+    cached = build_transfers(unified['stops'], cache_dir=str(tmp_path))
+    assert cached.equals(transfers)
+
+
+def test_get_transfer_graph(unified):
+    transfers = build_transfers(unified['stops'])
+    n_stops = int(unified['stops']['stop_index'].max()) + 1
+    indptr, to_stop, seconds = get_transfer_graph(transfers, n_stops)
+    assert len(indptr) == n_stops + 1 and indptr[-1] == len(transfers)
+    stop = int(transfers['from_stop_index'].iloc[0])
+    expected = transfers[transfers['from_stop_index'] == stop]
+    assert to_stop[indptr[stop]:indptr[stop + 1]].tolist() == expected['to_stop_index'].tolist()
+    assert seconds[indptr[stop]:indptr[stop + 1]].tolist() == expected['walking_seconds'].tolist()
@@ -0,0 +1,85 @@
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+from pyptvdata.transport import RETRY_STATUS_CODES, Transport, get_retry_count
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """
+    Answers 503 to the first failures requests, then 200.
+    """
+    failures = 0
+    requests = 0
+
+    def do_GET(self):
+        type(self).requests += 1
+        status_code = 503 if type(self).requests <= type(self).failures else 200
+        self.send_response(status_code)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def flaky_url():
+    FlakyHandler.failures = 2
+    FlakyHandler.requests = 0
+    server = HTTPServer(('127.0.0.1', 0), FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}/v3/route_types'
+    server.shutdown()
+    server.server_close()
+
+
+def test_defaults_match_a_plain_session():
+    transport = Transport()
+    adapter = transport.session.get_adapter('https://timetableapi.ptv.vic.gov.au')
+    assert transport.timeout is None
+    assert adapter.max_retries.total == 0
+    assert transport.session.headers['Accept-Encoding'].startswith('gzip, deflate')
+    assert Transport(compression=False).session.headers['Accept-Encoding'] == 'identity'
+
+
+def test_mounted_adapter_retry_settings():
+    transport = Transport(pool_maxsize=7, max_retries=3, backoff_factor=0.1, retry_status_codes=(503,), timeout=(1.0, 9.0))
+    assert transport.timeout == (1.0, 9.0)
+    for url in ['https://timetableapi.ptv.vic.gov.au', 'http://data.ptv.vic.gov.au']:
+        adapter = transport.session.get_adapter(url)
+        retry = adapter.max_retries
+        assert (retry.total, retry.backoff_factor, tuple(retry.status_forcelist), retry.raise_on_status) == (3, 0.1, (503,), False)
+        assert adapter._pool_maxsize == 7
+    assert tuple(Transport(max_retries=1).session.get_adapter('https://').max_retries.status_forcelist) == RETRY_STATUS_CODES
+
+
+def test_get_retry_count(flaky_url):
+    transport = Transport(max_retries=3, backoff_factor=0)
+    response = transport.get(flaky_url)
+    assert response.status_code == 200
+    assert get_retry_count(response) == 2
+    assert FlakyHandler.requests == 3
+    assert get_retry_count(transport.get(flaky_url)) == 0
+    assert get_retry_count(SimpleNamespace(status_code=200)) == 0
+
+
+def test_retries_give_up_with_the_last_response(flaky_url):
+    response = Transport(max_retries=1, backoff_factor=0).get(flaky_url)
+    assert response.status_code == 503
+    assert get_retry_count(response) == 1
+
+
+def test_http2_limits():
+    httpx = pytest.importorskip('httpx')
+    pytest.importorskip('h2')
+    transport = Transport(http2=True, pool_maxsize=7, keepalive_expiry=2.0, max_retries=2, timeout=(1.0, 9.0))
+    pool = transport.session._transport._pool
+    assert (pool._max_connections, pool._max_keepalive_connections, pool._keepalive_expiry) == (7, 7, 2.0)
+    assert pool._http2 and pool._retries == 2
+    assert transport.session.timeout == httpx.Timeout(9.0, connect=1.0)
+    transport.close()
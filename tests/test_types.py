@@ -0,0 +1,24 @@
+import dataclasses
+
+import pytest
+
+from pyptvdata.apiv3 import types
+
+
+TYPES = [value for value in vars(types).values() if dataclasses.is_dataclass(value)]
+
+
+def test_types_are_slotted():
+    assert len(TYPES) > 50
+    for cls in TYPES:
+        assert '__slots__' in vars(cls), cls.__name__
+        instance = cls(**{field.name: None for field in dataclasses.fields(cls) if field.default is dataclasses.MISSING})
+        assert not hasattr(instance, '__dict__')
+        with pytest.raises(AttributeError):
+            instance.not_a_field = 1
+
+
+def test_optional_fields_default_to_none():
+    departure = types.V3Departure(stop_id=1000)
+    assert departure.stop_id == 1000
+    assert departure.scheduled_departure_utc is None
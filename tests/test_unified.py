@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+
+from pyptvdata.gtfs import gtfs_time_to_seconds
+from pyptvdata.unified import build_unified_stops, build_unified_feed
+
+
+def make_stops(rows : list[tuple]) -> dict:
+    return {'stops': pd.DataFrame(rows, columns=['stop_id', 'stop_name', 'stop_lat', 'stop_lon'])}
+
+
+def get_stop_indices(stop_ids : pd.DataFrame) -> dict[tuple, int]:
+    return {(mode_id, stop_id): stop_index for mode_id, stop_id, stop_index in stop_ids.itertuples(index=False)}
+
+
+def test_stops_are_merged_by_id_across_modes():
+    DFK = {
+        '2': make_stops([('19842', 'Flinders Street Station', -37.8183, 144.9671), ('19843', 'Southern Cross', -37.8184, 144.9525)]),
+        '3': make_stops([('19842', 'Flinders St Station', -37.8180, 144.9670), ('2001', 'Elizabeth St', -37.8170, 144.9640)]),
+    }
+    stops, stop_ids = build_unified_stops(DFK, merge_distance=0)
+    indices = get_stop_indices(stop_ids)
+    assert indices[('2', '19842')] == indices[('3', '19842')]
+    assert len(stops) == 3 and len(stop_ids) == 4
+    # The merged stop takes the name and coordinates of its first stop
+    merged = stops.set_index('stop_index').loc[indices[('2', '19842')]]
+    assert (merged['stop_name'], merged['stop_lat']) == ('Flinders Street Station', -37.8183)
+
+
+def test_stops_are_merged_by_distance_and_name():
+    # About 5.5 m apart in latitude at 0.00005 degrees, and about 55 m at 0.0005
+    DFK = {
+        '3': make_stops([('A', 'Collins St/Swanston St', -37.81500, 144.9660), ('C', 'Bourke St', -37.81300, 144.9660)]),
+        '4': make_stops([
+            ('B', '  collins st/swanston   ST ', -37.81505, 144.9660),
+            ('D', 'Bourke St/Swanston St', -37.81305, 144.9660),
+            ('E', 'Collins St/Swanston St', -37.81550, 144.9660),
+        ]),
+    }
+    indices = get_stop_indices(build_unified_stops(DFK, merge_distance=10)[1])
+    assert indices[('3', 'A')] == indices[('4', 'B')]
+    assert indices[('3', 'C')] != indices[('4', 'D')]
+    assert indices[('4', 'E')] not in [indices[('3', 'A')], indices[('3', 'C')]]
+
+    indices = get_stop_indices(build_unified_stops(DFK, merge_distance=10, match_names=False)[1])
+    assert indices[('3', 'A')] == indices[('4', 'B')] and indices[('3', 'C')] == indices[('4', 'D')]
+    assert len(set(get_stop_indices(build_unified_stops(DFK, merge_distance=0)[1]).values())) == 5
+
+
+def test_stops_without_id_are_not_merged_by_id():
+    DFK = {
+        '3': make_stops([('A', 'First', -37.80, 144.90), (np.nan, 'Second', -37.70, 144.80), (np.nan, 'Third', -37.60, 144.70)]),
+        '4': make_stops([(np.nan, 'Fourth', -37.50, 144.60)]),
+    }
+    stops, stop_ids = build_unified_stops(DFK)
+    assert len(stops) == 4
+    assert stop_ids['stop_index'].is_unique
+    assert stops['stop_name'].tolist() == ['First', 'Second', 'Third', 'Fourth']
+
+
+def test_unified_feed_global_indices(DFK, unified):
+    for entity, table_name in [('route', 'routes'), ('trip', 'trips')]:
+        ids = unified[f'{entity}_ids']
+        assert ids[f'{entity}_index'].tolist() == list(range(len(ids)))
+        assert len(ids) == sum(len(tables[table_name]) for tables in DFK.values())
+        assert unified[table_name][f'{entity}_index'].tolist() == ids[f'{entity}_index'].tolist()
+    assert unified['stops']['stop_index'].tolist() == list(range(len(unified['stops'])))
+
+    for mode_id, tables in DFK.items():
+        trip_ids = unified['trip_ids'][unified['trip_ids']['mode_id'] == mode_id].set_index('trip_id')['trip_index']
+        route_ids = unified['route_ids'][unified['route_ids']['mode_id'] == mode_id].set_index('route_id')['route_index']
+        stop_ids = unified['stop_ids'][unified['stop_ids']['mode_id'] == mode_id].set_index('stop_id')['stop_index']
+        service_ids = unified['service_ids'][unified['service_ids']['mode_id'] == mode_id].set_index('service_id')['service_index']
+
+        trips = unified['trips'].set_index('trip_index').loc[trip_ids[tables['trips']['trip_id']].to_numpy()]
+        assert (trips['route_index'].to_numpy() == route_ids[tables['trips']['route_id']].to_numpy()).all()
+        assert (trips['service_index'].to_numpy() == service_ids[tables['trips']['service_id']].to_numpy()).all()
+
+        stop_times = unified['stop_times'][unified['stop_times']['trip_index'].isin(trip_ids)]
+        assert len(stop_times) == len(tables['stop_times'])
+        assert (stop_times['trip_index'].to_numpy() == trip_ids[tables['stop_times']['trip_id']].to_numpy()).all()
+        assert (stop_times['stop_index'].to_numpy() == stop_ids[tables['stop_times']['stop_id']].to_numpy()).all()
+        assert (stop_times['departure_seconds'].to_numpy() == gtfs_time_to_seconds(tables['stop_times']['departure_time'])).all()
+
+    # Services are numbered per mode, as their IDs are only unique within a mode
+    service_ids = unified['service_ids']
+    assert service_ids.groupby('service_id')['service_index'].nunique().max() == len(DFK)
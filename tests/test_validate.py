@@ -0,0 +1,31 @@
+import pandas as pd
+
+from pyptvdata.validate import ISSUE_COLUMNS, validate_gtfs
+
+
+def test_synthetic_feed_is_valid(DFK):
+    issues = validate_gtfs(DFK)
+    assert list(issues.columns) == ISSUE_COLUMNS
+    assert len(issues) == 0
+
+
+def test_validate_gtfs_finds_broken_rows(feed):
+    tables = {table_name: df.copy() for table_name, df in feed.items()}
+    stops = tables['stops']
+    tables['stops'] = pd.concat([stops, stops.iloc[[0]]], ignore_index=True)
+    tables['stops'].loc[1, 'stop_lat'] = 10.0
+    tables['trips'].loc[2, 'route_id'] = 'no-such-route'
+    stop_times = tables['stop_times']
+    stop_times.loc[3, 'departure_time'] = '0a:15:00'
+    stop_times.loc[4, 'arrival_time'] = '23:59:59'
+    del tables['agency']
+
+    issues, profile = validate_gtfs({'4': tables}, profile=True)
+    found = {(rule, table_name, row) for rule, table_name, row in issues[['rule', 'table_name', 'row']].itertuples(index=False)}
+    assert ('missing_table', 'agency', -1) in found
+    assert ('duplicate_key', 'stops', len(stops)) in found
+    assert ('coordinates_out_of_bounds', 'stops', 1) in found
+    assert ('unknown_reference', 'trips', 2) in found
+    assert ('invalid_time', 'stop_times', 3) in found
+    assert ('arrival_after_departure', 'stop_times', 4) in found
+    assert set(profile['check']) == {'tables', 'keys', 'foreign_keys', 'stop_times', 'coordinates', 'calendar'}